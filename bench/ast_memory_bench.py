@@ -0,0 +1,69 @@
+"""
+Benchmark de memoria del AST.
+
+Construye con Parser un programa de alrededor de N nodos (por defecto un
+millón) y reporta los bytes por nodo retenidos por el árbol. Los tokens se
+generan antes de empezar a medir, de modo que solo se cuenta el AST.
+
+Uso: python -m bench.ast_memory_bench [nodos | archivo_fuente]
+"""
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, is_dataclass
+from lexer.lexer import Lexer
+from parser.parser import Parser
+
+# Cada sentencia aporta 6 nodos: Assignment, dos BinaryOp, una VariableRef
+# y dos Literal
+STATEMENT = "x = x + 1 * 2;\n"
+NODES_PER_STATEMENT = 6
+
+def generate_program(nodes: int) -> str:
+    """Programa válido con aproximadamente la cantidad de nodos indicada"""
+    statements = STATEMENT * max(1, nodes // NODES_PER_STATEMENT)
+    return f"int main() {{\nint x = 0;\n{statements}return x;\n}}\n"
+
+def count_nodes(root) -> int:
+    """Cuenta los nodos del árbol con un recorrido iterativo"""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        for field in fields(node):
+            value = getattr(node, field.name)
+            if isinstance(value, list):
+                stack.extend(child for child in value if is_dataclass(child))
+            elif is_dataclass(value):
+                stack.append(value)
+    return count
+
+def main():
+    argument = sys.argv[1] if len(sys.argv) > 1 else "1000000"
+    if argument.isdigit():
+        code = generate_program(int(argument))
+    else:
+        with open(argument, 'r') as file:
+            code = file.read()
+    
+    tokens = Lexer(code).tokenize()
+    print(f"Entrada: {len(code)} caracteres, {len(tokens)} tokens")
+    print("-"*50)
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    program = Parser(tokens).parse()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    nodes = count_nodes(program)
+    print(f"{'Nodos':<20} {nodes:>12}")
+    print(f"{'Tiempo de parseo':<20} {elapsed:>12.3f} s")
+    print(f"{'Memoria retenida':<20} {retained / 2**20:>12.1f} MiB")
+    print(f"{'Pico':<20} {peak / 2**20:>12.1f} MiB")
+    print(f"{'Bytes por nodo':<20} {retained / nodes:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark de los motores de escaneo.
+
+Compara la regex combinada (engine='regex') con el escáner por tabla de
+clases de carácter (engine='table'), sobre str y sobre bytes, y verifica
+que ambos produzcan los mismos tokens.
+
+Uso: python -m bench.engine_bench [archivo_fuente] [repeticiones]
+"""
+import sys
+import time
+from typing import List, Union
+from lexer.lexer import Lexer, ENGINES
+from lexer.token import Token
+from bench.lexer_bench import load_corpus
+
+def measure(label: str, engine: str, code: Union[str, bytes]) -> List[Token]:
+    """Tokeniza la entrada con un motor e imprime el tiempo"""
+    start = time.perf_counter()
+    tokens = Lexer(code, engine=engine).tokenize()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {elapsed:8.3f} s  {len(tokens) / elapsed:12.0f} tokens/s")
+    return tokens
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    code = load_corpus(path, repeat)
+    print(f"Entrada: {len(code)} caracteres, {code.count(chr(10)) + 1} líneas")
+    print("-"*50)
+    
+    for label, text in (("str", code), ("bytes", code.encode('utf-8'))):
+        streams = [measure(f"{engine} ({label})", engine, text) for engine in ENGINES]
+        if any(stream != streams[0] for stream in streams[1:]):
+            print("❌ Los flujos de tokens no coinciden")
+            sys.exit(1)
+    print("✓ Flujos de tokens idénticos")
+
+if __name__ == "__main__":
+    main()
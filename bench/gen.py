@@ -0,0 +1,378 @@
+"""
+Generador aleatorio de programas a partir de la gramática.
+
+Produce programas válidos del subconjunto de C del compilador con tamaño
+configurable (cantidad de funciones, profundidad de anidamiento, largo de
+las expresiones y cantidad de identificadores) y, opcionalmente, con una
+cantidad controlada de errores sintácticos y semánticos en líneas
+conocidas. Las expresiones se generan para un tipo pedido con las mismas
+reglas que SemanticChecker, de modo que un programa sin errores inyectados
+es siempre correcto.
+
+Uso: python -m bench.gen [--clave=valor ...] [archivo_salida]
+     (claves: los campos de GeneratorConfig, por ejemplo --functions=100)
+"""
+import random
+import sys
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Tuple
+
+TYPES = ('int', 'float', 'char')
+RETURN_TYPES = ('int', 'float', 'char', 'void')
+ARITHMETIC = ('+', '-', '*', '/')
+# Con operandos enteros cualquier operador da un entero
+INT_OPERATORS = ARITHMETIC + ('<', '<=', '>', '>=', '==', '!=', '&&', '||')
+COMPARISONS = ('<', '<=', '>', '>=', '==', '!=')
+PRINTS = {'int': 'printInt', 'float': 'printFloat', 'char': 'printChar'}
+SCANS = {'int': 'scanInt', 'float': 'scanFloat', 'char': 'scanChar'}
+ERROR_KINDS = ('syntax', 'type', 'undeclared', 'uninitialized', 'arguments')
+
+@dataclass
+class GeneratorConfig:
+    """Tamaño y forma del programa generado"""
+    functions: int = 10  # Funciones además de main
+    statements: int = 8  # Sentencias por bloque
+    depth: int = 3  # Bloques anidados dentro de cada función
+    expression_length: int = 4  # Operandos por expresión
+    expression_depth: int = 2  # Paréntesis y llamadas anidadas en una expresión
+    identifiers: int = 8  # Nombres de variables locales disponibles
+    globals: int = 4  # Variables globales
+    parameters: int = 3  # Máximo de parámetros por función
+    errors: int = 0  # Errores inyectados
+    error_kinds: str = ",".join(ERROR_KINDS)
+    seed: int = 0
+
+@dataclass(slots=True)
+class InjectedError:
+    """Error inyectado: su tipo y la línea (desde 1) donde aparece"""
+    kind: str
+    line: int
+
+@dataclass(slots=True)
+class Signature:
+    name: str
+    return_type: str
+    parameters: Tuple[str, ...]
+
+class ProgramGenerator:
+    """
+    Genera un programa derivando la gramática con elecciones aleatorias.
+    Lleva la pila de ámbitos con el tipo de cada variable visible; todas las
+    variables se declaran inicializadas. Cada bloque tiene a lo sumo una
+    sentencia compuesta con un bloque completo (la que alcanza la
+    profundidad pedida), así el tamaño crece de forma lineal con cada
+    parámetro de GeneratorConfig.
+    """
+    def __init__(self, config: GeneratorConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.lines: List[str] = []
+        self.scopes: List[Dict[str, str]] = []
+        self.signatures: List[Signature] = []
+        # Líneas de sentencias simples dentro de funciones (índice y sangría),
+        # donde se pueden insertar errores
+        self.slots: List[Tuple[int, str]] = []
+        self.errors: List[InjectedError] = []
+        # Variables visibles por tipo; se recalcula cuando cambian los ámbitos
+        self.visible_cache: Optional[Dict[str, List[str]]] = None
+
+    def generate(self) -> str:
+        config = self.config
+        self.lines = []
+        self.slots = []
+        self.errors = []
+        self.scopes = [{}]
+        self.visible_cache = None
+        for n in range(config.globals):
+            data_type = self.random.choice(TYPES)
+            self.lines.append(f"{data_type} g{n} = {self.literal(data_type)};")
+            self.declare(f"g{n}", data_type)
+
+        # Todas las firmas se conocen antes de los cuerpos: cualquier función
+        # puede llamar a cualquier otra (y a sí misma)
+        self.signatures = [
+            Signature(f"f{n}", self.random.choice(RETURN_TYPES),
+                      tuple(self.random.choice(TYPES)
+                            for _ in range(self.random.randint(0, config.parameters))))
+            for n in range(config.functions)
+        ]
+        for signature in self.signatures:
+            self.function(signature)
+        self.function(Signature("main", 'int', ()))
+
+        self.inject_errors()
+        return "\n".join(self.lines) + "\n"
+
+    # Declaraciones
+
+    def function(self, signature: Signature) -> None:
+        parameters = ", ".join(f"{data_type} p{n}"
+                               for n, data_type in enumerate(signature.parameters))
+        self.lines.append("")
+        self.lines.append(f"{signature.return_type} {signature.name}({parameters}) {{")
+        self.enter_scope()
+        for n, data_type in enumerate(signature.parameters):
+            self.declare(f"p{n}", data_type)
+        self.block_body(self.config.depth, "    ")
+        if signature.return_type != 'void':
+            self.simple(f"return {self.expression(signature.return_type)};", "    ")
+        self.exit_scope()
+        self.lines.append("}")
+
+    def block_body(self, depth: int, indent: str, statements: Optional[int] = None) -> None:
+        """Sentencias de un bloque; el ámbito ya está abierto"""
+        if statements is None:
+            statements = self.config.statements
+        nested = self.random.randrange(statements) if depth > 0 and statements > 0 else -1
+        for n in range(statements):
+            if n == nested:
+                self.compound(depth - 1, indent)
+            else:
+                self.statement(indent)
+
+    def block(self, depth: int, indent: str, statements: Optional[int] = None) -> None:
+        self.enter_scope()
+        self.block_body(depth, indent + "    ", statements)
+        self.exit_scope()
+
+    def compound(self, depth: int, indent: str) -> None:
+        """Sentencia compuesta cuyo bloque desciende un nivel más"""
+        kind = self.random.choice(('if', 'if-else', 'while', 'do', 'block'))
+        if kind == 'block':
+            self.lines.append(f"{indent}{{")
+            self.block(depth, indent)
+            self.lines.append(f"{indent}}}")
+        elif kind == 'do':
+            self.lines.append(f"{indent}do {{")
+            self.block(depth, indent)
+            self.lines.append(f"{indent}}} while ({self.expression('int')});")
+        else:
+            keyword = 'while' if kind == 'while' else 'if'
+            self.lines.append(f"{indent}{keyword} ({self.expression('int')}) {{")
+            self.block(depth, indent)
+            if kind == 'if-else':
+                # El else no desciende: el tamaño sigue siendo lineal
+                self.lines.append(f"{indent}}} else {{")
+                self.block(0, indent, min(2, self.config.statements))
+            self.lines.append(f"{indent}}}")
+
+    # Sentencias
+
+    def statement(self, indent: str) -> None:
+        choice = self.random.random()
+        scope = self.scopes[-1]
+        free = [f"v{n}" for n in range(self.config.identifiers) if f"v{n}" not in scope]
+        assignable = [data_type for data_type in TYPES if self.visible(data_type)]
+        if choice < 0.35 and free:
+            data_type = self.random.choice(TYPES)
+            name = self.random.choice(free)
+            if self.random.random() < 0.1:
+                # scan solo puede ser el inicializador completo
+                value = f"{SCANS[data_type]}()"
+            else:
+                value = self.expression(data_type)
+            self.simple(f"{data_type} {name} = {value};", indent)
+            self.declare(name, data_type)
+        elif choice < 0.6 and assignable:
+            data_type = self.random.choice(assignable)
+            name = self.random.choice(self.visible(data_type))
+            self.simple(f"{name} = {self.expression(data_type)};", indent)
+        elif choice < 0.8:
+            if self.random.random() < 0.2:
+                self.simple(f'printStr("{self.random.choice(("x", "valor: ", "fin"))}");', indent)
+            else:
+                data_type = self.random.choice(TYPES)
+                self.simple(f"{PRINTS[data_type]}({self.expression(data_type)});", indent)
+        elif choice < 0.95 and self.signatures:
+            self.simple(f"{self.call(self.random.choice(self.signatures), 1)};", indent)
+        else:
+            self.simple(";", indent)
+
+    def simple(self, text: str, indent: str) -> None:
+        self.slots.append((len(self.lines), indent))
+        self.lines.append(indent + text)
+
+    # Ámbitos
+
+    def enter_scope(self) -> None:
+        self.scopes.append({})
+        self.visible_cache = None
+
+    def exit_scope(self) -> None:
+        self.scopes.pop()
+        self.visible_cache = None
+
+    def declare(self, name: str, data_type: str) -> None:
+        self.scopes[-1][name] = data_type
+        self.visible_cache = None
+
+    def visible(self, data_type: str) -> List[str]:
+        """Variables visibles del tipo (el ámbito más interno oculta a los externos)"""
+        if self.visible_cache is None:
+            names: Dict[str, str] = {}
+            for scope in self.scopes:
+                names.update(scope)
+            self.visible_cache = {t: [] for t in TYPES}
+            for name, variable_type in names.items():
+                self.visible_cache[variable_type].append(name)
+        return self.visible_cache[data_type]
+
+    # Expresiones
+
+    def expression(self, data_type: str, depth: int = 0) -> str:
+        """Expresión del tipo pedido con hasta expression_length operandos"""
+        length = self.random.randint(1, max(1, self.config.expression_length))
+        if data_type == 'char':
+            # Un char no admite operadores (el resultado sería un int)
+            return self.char_operand(depth)
+        if data_type == 'float':
+            # Solo aritmética y al menos un operando float: el resultado es float
+            parts = [self.float_operand(depth)]
+            for _ in range(length - 1):
+                operand = self.float_operand(depth) if self.random.random() < 0.5 \
+                    else self.int_operand(depth)
+                parts.append(f"{self.random.choice(ARITHMETIC)} {operand}")
+            return " ".join(parts)
+        parts = [self.int_operand(depth)]
+        for _ in range(length - 1):
+            parts.append(f"{self.random.choice(INT_OPERATORS)} {self.int_operand(depth)}")
+        return " ".join(parts)
+
+    def int_operand(self, depth: int) -> str:
+        choice = self.random.random()
+        if depth < self.config.expression_depth:
+            if choice < 0.1:
+                return f"({self.expression('int', depth + 1)})"
+            if choice < 0.15:
+                # Comparación de floats o de chars: también es un int
+                data_type = self.random.choice(('float', 'char'))
+                return (f"({self.operand(data_type, depth + 1)} "
+                        f"{self.random.choice(COMPARISONS)} {self.operand(data_type, depth + 1)})")
+            call = self.call_returning('int', depth)
+            if choice < 0.25 and call is not None:
+                return call
+        return self.variable_or_literal('int')
+
+    def float_operand(self, depth: int) -> str:
+        choice = self.random.random()
+        if depth < self.config.expression_depth:
+            if choice < 0.1:
+                return f"({self.expression('float', depth + 1)})"
+            call = self.call_returning('float', depth)
+            if choice < 0.2 and call is not None:
+                return call
+        return self.variable_or_literal('float')
+
+    def char_operand(self, depth: int) -> str:
+        if depth < self.config.expression_depth and self.random.random() < 0.15:
+            call = self.call_returning('char', depth)
+            if call is not None:
+                return call
+        return self.variable_or_literal('char')
+
+    def operand(self, data_type: str, depth: int) -> str:
+        if data_type == 'float':
+            return self.float_operand(depth)
+        if data_type == 'char':
+            return self.char_operand(depth)
+        return self.int_operand(depth)
+
+    def variable_or_literal(self, data_type: str) -> str:
+        names = self.visible(data_type)
+        if names and self.random.random() < 0.7:
+            return self.random.choice(names)
+        return self.literal(data_type)
+
+    def literal(self, data_type: str) -> str:
+        if data_type == 'float':
+            return f"{self.random.randint(0, 99)}.{self.random.randint(0, 99)}"
+        if data_type == 'char':
+            return f"'{self.random.choice('abcxyz')}'"
+        return str(self.random.randint(0, 999))
+
+    def call_returning(self, data_type: str, depth: int) -> Optional[str]:
+        candidates = [signature for signature in self.signatures
+                      if signature.return_type == data_type]
+        if not candidates:
+            return None
+        return self.call(self.random.choice(candidates), depth + 1)
+
+    def call(self, signature: Signature, depth: int) -> str:
+        """Llamada con argumentos del tipo exacto de cada parámetro"""
+        arguments = ", ".join(self.expression(data_type, depth)
+                              for data_type in signature.parameters)
+        return f"{signature.name}({arguments})"
+
+    # Errores controlados
+
+    def inject_errors(self) -> None:
+        """
+        Inserta config.errors sentencias erróneas antes de sentencias simples
+        elegidas al azar; cada error usa nombres nuevos y no afecta al resto
+        """
+        kinds = [kind for kind in self.config.error_kinds.split(",") if kind]
+        count = min(self.config.errors, len(self.slots))
+        if not kinds or count <= 0:
+            return
+        chosen = sorted(self.random.sample(self.slots, count), reverse=True)
+        inserted = []
+        for n, (index, indent) in enumerate(chosen):
+            kind = self.random.choice(kinds)
+            if kind == 'arguments' and not any(s.parameters for s in self.signatures):
+                kind = 'undeclared'
+            self.lines.insert(index, indent + self.error_statement(kind, n))
+            inserted.append((index, kind))
+        # Cada inserción desplaza las posteriores (se insertó de atrás hacia adelante)
+        for position, (index, kind) in enumerate(sorted(inserted)):
+            self.errors.append(InjectedError(kind, index + position + 1))
+
+    def error_statement(self, kind: str, n: int) -> str:
+        if kind == 'syntax':
+            return f"int e{n} = ;"
+        if kind == 'type':
+            return f"int e{n} = 2.5;"
+        if kind == 'undeclared':
+            return f"printInt(u{n});"
+        if kind == 'uninitialized':
+            return f"int e{n}; printInt(e{n});"
+        if kind == 'arguments':
+            signature = self.random.choice([s for s in self.signatures if s.parameters])
+            arguments = ", ".join("1" for _ in range(len(signature.parameters) + 1))
+            return f"{signature.name}({arguments});"
+        raise ValueError(f"Tipo de error desconocido: {kind}")
+
+def generate(config: GeneratorConfig) -> str:
+    """Programa generado para config (el mismo para la misma semilla)"""
+    return ProgramGenerator(config).generate()
+
+def parse_config(arguments: List[str]) -> Tuple[GeneratorConfig, List[str]]:
+    """GeneratorConfig a partir de argumentos --clave=valor; retorna también el resto"""
+    config = GeneratorConfig()
+    types = {field.name: field.type for field in fields(GeneratorConfig)}
+    rest = []
+    for argument in arguments:
+        if argument.startswith('--') and '=' in argument:
+            key, value = argument[2:].split('=', 1)
+            key = key.replace('-', '_')
+            if key not in types:
+                raise SystemExit(f"Opción desconocida: --{key}")
+            setattr(config, key, value if types[key] is str else int(value))
+        else:
+            rest.append(argument)
+    return config, rest
+
+def main():
+    config, rest = parse_config(sys.argv[1:])
+    generator = ProgramGenerator(config)
+    text = generator.generate()
+    if rest:
+        with open(rest[0], 'w', encoding='utf-8') as file:
+            file.write(text)
+        print(f"Programa de {len(text.splitlines())} líneas escrito en {rest[0]}")
+        for error in generator.errors:
+            print(f"  línea {error.line}: error {error.kind}")
+    else:
+        sys.stdout.write(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark del análisis incremental.
+
+Genera un programa de N funciones (por defecto 10000), lo analiza una vez
+con IncrementalFrontEnd y luego aplica ediciones de una línea con
+Lexer.relex: un cambio dentro del cuerpo de una función y un cambio en la
+firma de una función llamada por otras. Compara cada actualización contra
+Parser.parse seguido de SemanticChecker.check sobre la misma entrada.
+
+Uso: python -m bench.incremental_bench [funciones]
+"""
+import sys
+import time
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from semantic.checker import SemanticChecker
+from semantic.incremental import IncrementalFrontEnd
+
+FUNCTION = """int f{n}(int a) {{
+    int b = a + {n};
+    if (b > 3) {{
+        b = b - 1;
+    }}
+    return b;
+}}
+"""
+
+def generate_program(functions: int) -> str:
+    """Programa válido: N funciones y un main que llama a la última"""
+    parts = ["int total = 0;\n"]
+    parts.extend(FUNCTION.format(n=n) for n in range(functions))
+    # Unas pocas funciones llaman a f0, para el cambio de firma
+    parts.append("float g(int a) {\n    float r = f0(a) + f0(a + 1);\n    return r;\n}\n")
+    parts.append(f"int main() {{\n    total = f{functions - 1}(2);\n    g(1);\n    return total;\n}}\n")
+    return "".join(parts)
+
+def full_analysis(tokens) -> float:
+    start = time.perf_counter()
+    program = Parser(tokens).parse()
+    SemanticChecker().check(program)
+    return time.perf_counter() - start
+
+def edit(lexer: Lexer, tokens, old: str, new: str, front_end: IncrementalFrontEnd):
+    """Aplica la edición con relex y mide la actualización incremental"""
+    position = lexer.text.index(old)
+    start = time.perf_counter()
+    tokens = lexer.relex(tokens, position, position + len(old), new)
+    relex_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    front_end.update(tokens)
+    update_time = time.perf_counter() - start
+
+    stats = front_end.stats
+    print(f"  relex:         {relex_time * 1000:.1f} ms")
+    print(f"  incremental:   {update_time * 1000:.1f} ms "
+          f"({stats.reparsed} re-analizados y {stats.rechecked} re-verificados de {stats.items})")
+    full_time = full_analysis(tokens)
+    print(f"  completo:      {full_time * 1000:.1f} ms ({full_time / update_time:.1f}x)")
+    return tokens
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    lexer = Lexer(generate_program(functions))
+    tokens = lexer.tokenize()
+    print(f"Programa: {functions} funciones, {len(tokens)} tokens")
+
+    front_end = IncrementalFrontEnd()
+    start = time.perf_counter()
+    front_end.update(tokens)
+    print(f"Primer análisis incremental: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    middle = functions // 2
+    print(f"Edición en el cuerpo de f{middle}:")
+    tokens = edit(lexer, tokens, f"int b = a + {middle};", f"int b = a * {middle};", front_end)
+
+    print("Edición en la firma de f0 (g la llama):")
+    tokens = edit(lexer, tokens, "int f0(int a)", "float f0(int a)", front_end)
+
+if __name__ == "__main__":
+    main()
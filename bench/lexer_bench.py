@@ -0,0 +1,109 @@
+"""
+Benchmark del analizador léxico.
+
+Compara el escáner de una sola regex (Lexer.tokenize) contra el bucle
+anterior que probaba todos los patrones en cada posición.
+
+Uso: python -m bench.lexer_bench [archivo_fuente] [repeticiones]
+"""
+import glob
+import re
+import sys
+import time
+from typing import List, Pattern, Tuple
+from lexer.lexer import Lexer, TOKEN_PATTERNS
+from lexer.token import Token
+from lexer.token_type import TokenType
+from utils.error_handler import LexicalError
+
+def _compile_token_patterns() -> List[Tuple[Pattern, TokenType]]:
+    return [(re.compile(pattern), token_type) 
+            for pattern, token_type in TOKEN_PATTERNS]
+
+# Un patrón compilado por token, como los probaba el bucle anterior
+TOKEN_SPECS = _compile_token_patterns()
+
+def legacy_tokenize(lexer: Lexer) -> List[Token]:
+    """Bucle original: prueba cada patrón y se queda con el más largo"""
+    tokens = []
+    pos = 0
+    
+    while pos < len(lexer.text):
+        match = None
+        match_token_type = None
+        match_length = 0
+        
+        for pattern, token_type in TOKEN_SPECS:
+            regex_match = pattern.match(lexer.text, pos)
+            if regex_match:
+                current_match = regex_match.group(0)
+                if len(current_match) > match_length:
+                    match = current_match
+                    match_token_type = token_type
+                    match_length = len(current_match)
+        
+        if match:
+            if match_token_type:
+                if match_token_type == TokenType.ID and match in lexer.keywords:
+                    token_type = lexer.keywords[match]
+                else:
+                    token_type = match_token_type
+                
+                if token_type != TokenType.NEWLINE and token_type != TokenType.COMMENT:
+                    tokens.append(Token(token_type, match, lexer.line, lexer.column, pos))
+            
+            if match_token_type == TokenType.NEWLINE:
+                lexer.line += 1
+                lexer.column = 1
+            else:
+                lexer.column += len(match)
+            pos += len(match)
+        else:
+            raise LexicalError(
+                f"Carácter no reconocido: {lexer.text[pos]}", 
+                lexer.line, 
+                lexer.column
+            )
+    
+    tokens.append(Token(TokenType.EOF, '', lexer.line, lexer.column, pos))
+    return tokens
+
+def load_corpus(path: str = None, repeat: int = 2000) -> str:
+    """Carga el archivo indicado o concatena los casos de prueba válidos"""
+    if path:
+        with open(path, 'r') as file:
+            return file.read()
+    sources = []
+    for file_path in sorted(glob.glob('tests/valid/*.c')):
+        with open(file_path, 'r') as file:
+            sources.append(file.read())
+    return '\n'.join(sources) * repeat
+
+def measure(label: str, func, code: str) -> List[Token]:
+    """Ejecuta una función de tokenización e imprime el tiempo"""
+    start = time.perf_counter()
+    tokens = func(Lexer(code))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {elapsed:8.3f} s  {len(tokens) / elapsed:12.0f} tokens/s")
+    return tokens
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    code = load_corpus(path, repeat)
+    print(f"Entrada: {len(code)} caracteres, {code.count(chr(10)) + 1} líneas")
+    print("-"*50)
+    
+    legacy = measure("Bucle anterior", legacy_tokenize, code)
+    current = measure("Regex combinada", lambda lexer: lexer.tokenize(), code)
+    
+    # El bucle anterior contaba mal las líneas de los comentarios multilínea,
+    # así que se comparan tipo, valor y posición en la entrada
+    if [(t.type, t.value, t.offset) for t in legacy] != \
+            [(t.type, t.value, t.offset) for t in current]:
+        print("❌ Los flujos de tokens no coinciden")
+        sys.exit(1)
+    print("✓ Flujos de tokens idénticos")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark del análisis paralelo por funciones.
+
+Compara Parser seguido de SemanticChecker contra ParallelChecker sobre un
+programa de N funciones (por defecto 20000), con distintas cantidades de
+procesos. La tokenización del proceso principal no se cuenta.
+
+Uso: python -m bench.parallel_bench [funciones | archivo_fuente]
+"""
+import os
+import sys
+import time
+from bench.incremental_bench import generate_program
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from semantic.checker import SemanticChecker
+from semantic.parallel import ParallelChecker
+
+def main():
+    argument = sys.argv[1] if len(sys.argv) > 1 else "20000"
+    if argument.isdigit():
+        text = generate_program(int(argument))
+    else:
+        with open(argument, encoding='utf-8') as file:
+            text = file.read()
+    tokens = Lexer(text).tokenize()
+    print(f"Entrada: {len(tokens)} tokens, {os.cpu_count()} CPU")
+
+    start = time.perf_counter()
+    SemanticChecker().check(Parser(tokens).parse())
+    sequential = time.perf_counter() - start
+    print(f"Secuencial:       {sequential:.2f} s")
+
+    workers = 2
+    while workers <= max(2, os.cpu_count() or 1):
+        start = time.perf_counter()
+        ParallelChecker(workers).check(text, tokens)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:2d} procesos:      {elapsed:.2f} s ({sequential / elapsed:.1f}x)")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark de escalamiento con programas generados (bench.gen).
+
+Duplica un parámetro de GeneratorConfig por vez (funciones, sentencias por
+bloque, profundidad de anidamiento, largo de las expresiones e
+identificadores) y mide el lexer, el parser y la verificación semántica.
+El costo por token debería mantenerse constante; si crece con el tamaño el
+paso es super-lineal en ese parámetro (por ejemplo, recursión por cada
+operando o búsquedas que recorren toda la cadena de ámbitos).
+
+Uso: python -m bench.scaling_bench [pasos] [--clave=valor ...]
+     (las claves fijan la configuración base, como en bench.gen)
+"""
+import sys
+import time
+from dataclasses import replace
+from bench.gen import GeneratorConfig, generate, parse_config
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from semantic.checker import SemanticChecker
+from utils.error_handler import CompilerError
+
+KNOBS = ('functions', 'statements', 'depth', 'expression_length', 'identifiers')
+REPEAT = 3
+# Crecimiento del costo por token (último tamaño contra el primero) que se reporta
+SUPERLINEAR = 1.5
+
+def measure(text: str) -> tuple:
+    """Tokens y mejor tiempo de cada fase (segundos)"""
+    best = [float('inf')] * 3
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        tokens = Lexer(text).tokenize()
+        lexed = time.perf_counter()
+        program = Parser(tokens).parse()
+        parsed = time.perf_counter()
+        SemanticChecker().check(program)
+        checked = time.perf_counter()
+        for n, elapsed in enumerate((lexed - start, parsed - lexed, checked - parsed)):
+            best[n] = min(best[n], elapsed)
+    return len(tokens), best
+
+def scale(base: GeneratorConfig, knob: str, steps: int) -> None:
+    print(f"\n{knob} (base {getattr(base, knob)}):")
+    print(f"  {'valor':>8} {'tokens':>9} {'lexer':>9} {'parser':>9} {'semántico':>10}  (µs/token)")
+    first = None
+    value = max(1, getattr(base, knob))
+    for _ in range(steps):
+        text = generate(replace(base, **{knob: value}))
+        try:
+            count, times = measure(text)
+        except (CompilerError, RecursionError) as e:
+            print(f"  {value:>8} error: {e}")
+            break
+        per_token = [elapsed * 1e6 / count for elapsed in times]
+        print(f"  {value:>8} {count:>9} {per_token[0]:>9.2f} {per_token[1]:>9.2f} {per_token[2]:>10.2f}")
+        if first is None:
+            first = per_token
+        value *= 2
+    if first is None:
+        return
+    for phase, before, after in zip(('lexer', 'parser', 'semántico'), first, per_token):
+        if after > before * SUPERLINEAR:
+            print(f"  ⚠ {phase}: el costo por token crece {after / before:.1f}x (super-lineal)")
+
+def main():
+    base, rest = parse_config(sys.argv[1:])
+    steps = int(rest[0]) if rest else 5
+    for knob in KNOBS:
+        scale(base, knob, steps)
+
+if __name__ == "__main__":
+    main()
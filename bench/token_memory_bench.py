@@ -0,0 +1,48 @@
+"""
+Benchmark de memoria de los tokens.
+
+Compara los bytes por token de la lista de Token (tokenize) contra el
+TokenBuffer de arreglos paralelos (tokenize_buffer), y verifica que el
+parser produce el mismo resultado sobre ambos.
+
+Uso: python -m bench.token_memory_bench [archivo_fuente] [repeticiones]
+"""
+import sys
+import tracemalloc
+from bench.lexer_bench import load_corpus
+from lexer.lexer import Lexer
+from parser.parser import Parser
+
+def measure(label: str, build, code: str):
+    """Mide la memoria retenida por la estructura de tokens construida"""
+    lexer = Lexer(code)
+    tracemalloc.start()
+    tokens = build(lexer)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {len(tokens):>10} tokens  {retained / len(tokens):8.1f} bytes/token")
+    return tokens
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    code = load_corpus(path, repeat)
+    print(f"Entrada: {len(code)} caracteres")
+    print("-"*50)
+    
+    token_list = measure("Lista de Token", lambda lexer: lexer.tokenize(), code)
+    token_buffer = measure("TokenBuffer", lambda lexer: lexer.tokenize_buffer(), code)
+    print(f"{'Arreglos (nbytes)':<20} {'':>10}         {token_buffer.nbytes() / len(token_buffer):8.1f} bytes/token")
+    
+    if list(token_buffer) != token_list:
+        print("❌ Los flujos de tokens no coinciden")
+        sys.exit(1)
+    print("✓ Flujos de tokens idénticos")
+    
+    # El parser recorre el buffer igual que una lista
+    if path:
+        Parser(token_buffer).parse()
+        print("✓ Parser ejecutado sobre el TokenBuffer")
+
+if __name__ == "__main__":
+    main()
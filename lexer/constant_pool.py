@@ -0,0 +1,93 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from .token_type import TokenType
+
+# Secuencias de escape admitidas en literales de carácter y de cadena
+_ESCAPES = {
+    'n': '\n',
+    't': '\t',
+    'r': '\r',
+    '0': '\0',
+    '\\': '\\',
+    '\'': '\'',
+    '"': '"',
+}
+_ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+
+def decode_escapes(text: str) -> str:
+    """Procesa las secuencias de escape; las desconocidas conservan el carácter"""
+    return _ESCAPE_PATTERN.sub(lambda match: _ESCAPES.get(match.group(1), match.group(1)), text)
+
+def decode_literal(token_type: TokenType, text: str) -> Any:
+    """
+    Decodifica el texto de un literal a su valor:
+    int, float, punto de código (char) o bytes con los escapes procesados (cadena).
+    Un literal de carácter que no contiene exactamente un carácter retorna None.
+    """
+    if token_type == TokenType.INTEGER_LITERAL:
+        return int(text)
+    if token_type == TokenType.FLOAT_LITERAL:
+        return float(text)
+    if token_type == TokenType.CHAR_LITERAL:
+        char = decode_escapes(text[1:-1])
+        return ord(char) if len(char) == 1 else None
+    if token_type == TokenType.STRING_LITERAL:
+        return decode_escapes(text[1:-1]).encode('utf-8')
+    raise ValueError(f"{token_type} no es un literal")
+
+class ConstantPool:
+    """
+    Tabla de constantes literales decodificadas, sin duplicados.
+    Cada valor distinto se guarda una sola vez y tiene un índice estable;
+    los tokens repetidos comparten el mismo objeto decodificado.
+    """
+    def __init__(self):
+        self.values: List[Any] = []
+        self.indexes: Dict[Tuple[type, Any], int] = {}
+        # Texto ya decodificado: evita volver a decodificar literales repetidos
+        self.decoded: Dict[Tuple[TokenType, str], Any] = {}
+
+    def add(self, value: Any) -> int:
+        """Agrega un valor (si no existe) y retorna su índice"""
+        # El tipo forma parte de la clave para no mezclar 1 y 1.0
+        key = (type(value), value)
+        index = self.indexes.get(key)
+        if index is None:
+            index = len(self.values)
+            self.indexes[key] = index
+            self.values.append(value)
+        return index
+
+    def index(self, value: Any) -> Optional[int]:
+        """Índice de un valor en la tabla, o None si no está"""
+        return self.indexes.get((type(value), value))
+
+    def decode(self, token_type: TokenType, text: str) -> Any:
+        """Decodifica un literal una sola vez y retorna el valor compartido"""
+        key = (token_type, text)
+        if key in self.decoded:
+            return self.decoded[key]
+        value = decode_literal(token_type, text)
+        if value is not None:
+            value = self.values[self.add(value)]
+        self.decoded[key] = value
+        return value
+
+    def reset(self) -> None:
+        """Vacía la tabla entre compilaciones (los tokens conservan sus valores)"""
+        self.values.clear()
+        self.indexes.clear()
+        self.decoded.clear()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+# Tabla compartida por todas las etapas del compilador
+CONSTANTS = ConstantPool()
+
+LITERAL_TYPES = frozenset({
+    TokenType.INTEGER_LITERAL,
+    TokenType.FLOAT_LITERAL,
+    TokenType.CHAR_LITERAL,
+    TokenType.STRING_LITERAL,
+})
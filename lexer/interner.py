@@ -0,0 +1,39 @@
+from typing import Dict, List
+
+class Interner:
+    """
+    Tabla de internado de identificadores.
+    Asigna a cada nombre distinto un ID entero pequeño y guarda su texto
+    una sola vez; todos los tokens con el mismo nombre comparten el str.
+    """
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        """Retorna el ID del nombre, asignándole uno nuevo si no existe"""
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = len(self.names)
+            self.ids[name] = symbol
+            self.names.append(name)
+        return symbol
+
+    def reset(self) -> None:
+        """
+        Vacía la tabla entre compilaciones. Los IDs ya entregados dejan de ser
+        válidos: no debe quedar ningún token ni AST de la compilación anterior
+        """
+        self.ids.clear()
+        self.names.clear()
+
+    def name(self, symbol: int) -> str:
+        """Retorna el texto de un ID"""
+        return self.names[symbol]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+# Tabla compartida por el lexer, los parsers y el análisis semántico,
+# de modo que un mismo nombre tiene el mismo ID en todas las etapas
+SYMBOLS = Interner()
@@ -1,129 +1,647 @@
+import mmap
+import os
 import re
-from typing import List, Tuple, Pattern
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Pattern, Union
 from .token import Token
+from .token_buffer import TokenBuffer, _TOKEN_TYPES
+from .line_index import LineIndex
+from .interner import SYMBOLS
+from .constant_pool import CONSTANTS, LITERAL_TYPES
+from .table_scanner import TableScanner
+from .trivia import TriviaTable
 from .token_type import TokenType
 from utils.error_handler import LexicalError
 
+# Palabras reservadas actualizadas
+KEYWORDS: Dict[str, TokenType] = {
+    'int': TokenType.INT,
+    'char': TokenType.CHAR,
+    'float': TokenType.FLOAT,
+    'void': TokenType.VOID,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'while': TokenType.WHILE,
+    'do': TokenType.DO,
+    'return': TokenType.RETURN,
+    'printInt': TokenType.PRINT_INT,
+    'printFloat': TokenType.PRINT_FLOAT,
+    'printChar': TokenType.PRINT_CHAR,
+    'printStr': TokenType.PRINT_STR,
+    'scanInt': TokenType.SCAN_INT,
+    'scanFloat': TokenType.SCAN_FLOAT,
+    'scanChar': TokenType.SCAN_CHAR
+}
+
+KEYWORD_BYTES: Dict[bytes, TokenType] = {word.encode(): token_type
+                                         for word, token_type in KEYWORDS.items()}
+
+# Texto fijo de palabras reservadas y operadores (no hace falta decodificarlo)
+FIXED_VALUES: Dict[TokenType, str] = {token_type: word for word, token_type in KEYWORDS.items()}
+FIXED_VALUES.update({
+    TokenType.PLUS: '+',
+    TokenType.MINUS: '-',
+    TokenType.TIMES: '*',
+    TokenType.DIVIDE: '/',
+    TokenType.AND: '&&',
+    TokenType.OR: '||',
+    TokenType.EQUALS: '==',
+    TokenType.NOT_EQUALS: '!=',
+    TokenType.LESS_EQUAL: '<=',
+    TokenType.GREATER_EQUAL: '>=',
+    TokenType.LESS: '<',
+    TokenType.GREATER: '>',
+    TokenType.ASSIGN: '=',
+    TokenType.SEMICOLON: ';',
+    TokenType.COMMA: ',',
+    TokenType.LPAREN: '(',
+    TokenType.RPAREN: ')',
+    TokenType.LBRACE: '{',
+    TokenType.RBRACE: '}',
+    TokenType.EOF: '',
+})
+
+# Patrones de tokens en orden de prioridad.
+# El orden garantiza que la primera alternativa que coincide es también
+# la más larga (comentarios antes de '/', '==' antes de '=', flotantes
+# antes de enteros, etc.), lo que permite combinarlos en una sola regex.
+TOKEN_PATTERNS: List[Tuple[str, Optional[TokenType]]] = [
+    # Espacios en blanco (ignorar); '\r' cubre los finales de línea CRLF,
+    # que el mmap ya no convierte como la lectura en modo texto
+    (r'[ \t\r]+', None),
+    # Saltos de línea
+    (r'\n', TokenType.NEWLINE),
+    # Comentarios
+    (r'//[^\n]*', TokenType.COMMENT),
+    (r'/\*[\s\S]*?\*/', TokenType.COMMENT),
+    # Operadores aritméticos
+    (r'\+', TokenType.PLUS),
+    (r'-', TokenType.MINUS),
+    (r'\*', TokenType.TIMES),
+    (r'/', TokenType.DIVIDE),
+    # Operadores lógicos
+    (r'&&', TokenType.AND),
+    (r'\|\|', TokenType.OR),
+    # Operadores de comparación
+    (r'==', TokenType.EQUALS),
+    (r'!=', TokenType.NOT_EQUALS),
+    (r'<=', TokenType.LESS_EQUAL),
+    (r'>=', TokenType.GREATER_EQUAL),
+    (r'<', TokenType.LESS),
+    (r'>', TokenType.GREATER),
+    # Asignación
+    (r'=', TokenType.ASSIGN),
+    # Símbolos especiales
+    (r';', TokenType.SEMICOLON),
+    (r',', TokenType.COMMA),
+    (r'\(', TokenType.LPAREN),
+    (r'\)', TokenType.RPAREN),
+    (r'\{', TokenType.LBRACE),
+    (r'\}', TokenType.RBRACE),
+    # Literales
+    # [0-9] y no \d: en str \d acepta dígitos Unicode y en bytes solo ASCII
+    (r'[0-9]+\.[0-9]+', TokenType.FLOAT_LITERAL),
+    (r'[0-9]+', TokenType.INTEGER_LITERAL),
+    (r'\'[^\']*\'', TokenType.CHAR_LITERAL),
+    (r'"[^"]*"', TokenType.STRING_LITERAL),
+    # Identificadores
+    (r'[A-Za-z_][A-Za-z0-9_]*', TokenType.ID),
+]
+
+def _compile_master_pattern() -> Tuple[Pattern, List[Optional[TokenType]]]:
+    """
+    Combina todos los patrones en una sola alternancia con grupos nombrados.
+    Retorna la regex y una lista que asocia cada índice de grupo con su tipo.
+    """
+    master = '|'.join(f'(?P<T{i}>{pattern})'
+                      for i, (pattern, _) in enumerate(TOKEN_PATTERNS))
+    # El grupo 0 es la coincidencia completa, los grupos empiezan en 1
+    group_types = [None] + [token_type for _, token_type in TOKEN_PATTERNS]
+    return re.compile(master), group_types
+
+# Tablas compiladas una sola vez y compartidas por todas las instancias
+MASTER_PATTERN, GROUP_TYPES = _compile_master_pattern()
+MASTER_BYTES_PATTERN = re.compile(MASTER_PATTERN.pattern.encode())
+
+# Prescan del modo paralelo: solo comentarios y literales, los únicos tokens
+# que pueden contener un salto de línea. Se usan los mismos patrones del lexer
+# para que ambos coincidan en dónde empieza y termina cada uno.
+PRESCAN_PATTERN = re.compile('|'.join(
+    pattern for pattern, token_type in TOKEN_PATTERNS
+    if token_type in (TokenType.COMMENT, TokenType.CHAR_LITERAL, TokenType.STRING_LITERAL)))
+PRESCAN_BYTES_PATTERN = re.compile(PRESCAN_PATTERN.pattern.encode())
+
+# Tamaño mínimo de la entrada para que el modo paralelo compense el costo
+# de arrancar los procesos y transferir los fragmentos
+PARALLEL_THRESHOLD = 16 * 1024 * 1024
+
+# Versión de las reglas léxicas: incrementarla invalida las cachés de tokens
+LEXER_VERSION = 3
+
+# Motores de escaneo disponibles: regex combinada o tabla de clases de carácter
+ENGINES = ('regex', 'table')
+
+def reset_shared_tables() -> None:
+    """
+    Vacía las tablas compartidas por todo el proceso (identificadores
+    internados y constantes decodificadas), que solo crecen. Se llama entre
+    compilaciones, cuando ya no queda ningún token ni AST de la anterior.
+    """
+    SYMBOLS.reset()
+    CONSTANTS.reset()
+
+@dataclass
+class LexResult:
+    """Resultado del análisis léxico con recuperación de errores"""
+    tokens: List[Token]
+    errors: List[LexicalError]
+
 class Lexer:
-    def __init__(self, text: str):
+    def __init__(self, text: Union[str, bytes, mmap.mmap], recover: bool = False,
+                 engine: str = 'regex', trivia: bool = False):
+        # Las tablas son compartidas: construir un lexer no recompila nada
+        self.keywords = KEYWORDS
+        self.keyword_bytes = KEYWORD_BYTES
+        self.fixed_values = FIXED_VALUES
+        self.master_pattern = MASTER_PATTERN
+        self.master_bytes_pattern = MASTER_BYTES_PATTERN
+        self.group_types = GROUP_TYPES
+        
+        # En modo de recuperación los caracteres no reconocidos generan un
+        # token ERROR y un diagnóstico en self.errors, y el escaneo continúa
+        self.recover = recover
+        
+        # Motor de escaneo; ambos producen exactamente los mismos tokens
+        if engine not in ENGINES:
+            raise ValueError(f"Motor de escaneo desconocido: {engine}")
+        self.engine = engine
+        
+        # Con trivia=True, espacios, saltos de línea y comentarios se guardan
+        # en una tabla lateral (self.trivia); el flujo de tokens no cambia
+        self.keep_trivia = trivia
+        
+        self.reset(text)
+    
+    def reset(self, text: Union[str, bytes, mmap.mmap]) -> None:
+        """Prepara el lexer para escanear una nueva entrada"""
         self.text = text
+        # Con bytes (o un mmap) se escanea el búfer directamente, sin copiarlo a un str
+        self.is_bytes = not isinstance(text, str)
         self.pos = 0
         self.line = 1
         self.column = 1
+        self.errors: List[LexicalError] = []
+        # Tabla de inicios de línea, construida al escanear por primera vez
+        self.lines: Optional[LineIndex] = None
+        self.trivia: Optional[TriviaTable] = TriviaTable(text, self.is_bytes) if self.keep_trivia else None
+    
+    @classmethod
+    def from_file(cls, file_path: str, recover: bool = False, engine: str = 'regex',
+                  trivia: bool = False) -> 'Lexer':
+        """
+        Crea un lexer sobre el archivo mapeado en memoria.
+        El contenido no se copia a un str: solo se decodifican los
+        identificadores y literales cuando se genera su token.
+        """
+        with open(file_path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap no admite archivos vacíos
+                buffer = b''
+        return cls(buffer, recover, engine, trivia)
+    
+    def close(self) -> None:
+        """Libera el mapeo de memoria si el lexer se creó con from_file"""
+        if isinstance(self.text, mmap.mmap):
+            self.text.close()
+    
+    def __enter__(self) -> 'Lexer':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def line_index(self) -> LineIndex:
+        """Retorna la tabla de inicios de línea de la entrada actual"""
+        if self.lines is None:
+            self.lines = LineIndex(self.text)
+        return self.lines
+    
+    def tokenize(self, parallel: bool = False, workers: Optional[int] = None) -> List[Token]:
+        """
+        Tokeniza la entrada completa.
+        Con parallel=True, las entradas de al menos PARALLEL_THRESHOLD bytes se
+        dividen en fragmentos que se escanean en un pool de procesos; el
+        resultado es idéntico al del escaneo secuencial.
+        """
+        if parallel and self.trivia is None:
+            workers = workers or os.cpu_count() or 1
+            if workers > 1 and len(self.text) >= PARALLEL_THRESHOLD:
+                return self._tokenize_parallel(workers)
+        return list(self.iter_tokens())
+    
+    def tokenize_with_errors(self) -> LexResult:
+        """
+        Tokeniza la entrada completa en modo de recuperación y retorna
+        los tokens junto con todos los errores léxicos encontrados.
+        """
+        recover = self.recover
+        self.recover = True
+        try:
+            tokens = self.tokenize()
+        finally:
+            self.recover = recover
+        return LexResult(tokens, self.errors)
+    
+    def tokenize_buffer(self) -> TokenBuffer:
+        """
+        Tokeniza la entrada completa en un TokenBuffer compacto
+        (arreglos paralelos en lugar de una lista de objetos Token).
+        """
+        buffer = TokenBuffer(self.text, self.line_index(),
+                             self.fixed_values if self.is_bytes else None)
+        append = buffer.append
+        for token_type, start, end in self._scan():
+            append(token_type, start, end - start)
+        return buffer
+    
+    def iter_tokens(self) -> Iterator[Token]:
+        """
+        Genera los tokens uno a uno, a medida que se reconocen.
+        Permite que el parser consuma la entrada sin materializar la lista completa.
+        La línea y la columna de cada token se resuelven solo si se piden.
+        """
+        return self._build_tokens(self._scan())
+    
+    def _build_tokens(self, scanned: Iterable[Tuple[TokenType, int, int]]) -> Iterator[Token]:
+        """Construye los tokens a partir de las tuplas (tipo, inicio, fin) del escáner"""
+        text = self.text
+        lines = self.line_index()
+        symbol_ids = SYMBOLS.ids
+        symbol_names = SYMBOLS.names
+        intern = SYMBOLS.intern
+        decode_literal = CONSTANTS.decode
+        is_bytes = self.is_bytes
+        fixed_values = self.fixed_values
+        
+        for token_type, start, end in scanned:
+            if is_bytes:
+                # Solo se decodifican identificadores y literales
+                value = fixed_values.get(token_type)
+                if value is not None:
+                    yield Token(token_type, value, None, None, start, lines)
+                    continue
+                value = text[start:end].decode('utf-8')
+            else:
+                value = text[start:end]
+            
+            if token_type == TokenType.ID:
+                # Internar el identificador: un solo str por nombre distinto
+                symbol = symbol_ids.get(value)
+                if symbol is None:
+                    symbol = intern(value)
+                yield Token(token_type, symbol_names[symbol], None, None, start, lines, symbol)
+            elif token_type in LITERAL_TYPES:
+                # Decodificar el literal una sola vez (compartido en la tabla de constantes)
+                yield Token(token_type, value, None, None, start, lines,
+                            literal=decode_literal(token_type, value))
+            else:
+                yield Token(token_type, value, None, None, start, lines)
+    
+    def _tokenize_parallel(self, workers: int) -> List[Token]:
+        """
+        Escanea fragmentos de la entrada en paralelo y los une en orden.
+        Los procesos solo producen (tipo, inicio, longitud); los tokens se
+        construyen aquí para que los IDs internados y los literales
+        decodificados sean los del proceso principal.
+        """
+        text = self.text
+        boundaries = [0] + self._safe_boundaries(workers) + [len(text)]
+        chunks = [(text[start:end], self.recover, self.engine)
+                  for start, end in zip(boundaries, boundaries[1:])]
+        lines = self.line_index()
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_chunk, chunks))
         
-        # Palabras reservadas actualizadas
-        self.keywords = {
-            'int': TokenType.INT,
-            'char': TokenType.CHAR,
-            'float': TokenType.FLOAT,
-            'void': TokenType.VOID,
-            'if': TokenType.IF,
-            'else': TokenType.ELSE,
-            'while': TokenType.WHILE,
-            'do': TokenType.DO,
-            'return': TokenType.RETURN,
-            'printInt': TokenType.PRINT_INT,
-            'printFloat': TokenType.PRINT_FLOAT,
-            'printChar': TokenType.PRINT_CHAR,
-            'printStr': TokenType.PRINT_STR,
-            'scanInt': TokenType.SCAN_INT,
-            'scanFloat': TokenType.SCAN_FLOAT,
-            'scanChar': TokenType.SCAN_CHAR
-        }
-        
-        # Compilar patrones de tokens
-        self.token_specs: List[Tuple[Pattern, TokenType]] = self._compile_token_patterns()
-    
-    def _compile_token_patterns(self) -> List[Tuple[Pattern, TokenType]]:
-        token_patterns = [
-            # Espacios en blanco (ignorar)
-            (r'[ \t]+', None),
-            # Saltos de línea
-            (r'\n', TokenType.NEWLINE),
-            # Comentarios
-            (r'//[^\n]*', TokenType.COMMENT),
-            (r'/\*[\s\S]*?\*/', TokenType.COMMENT),
-            # Operadores aritméticos
-            (r'\+', TokenType.PLUS),
-            (r'-', TokenType.MINUS),
-            (r'\*', TokenType.TIMES),
-            (r'/', TokenType.DIVIDE),
-            # Operadores lógicos
-            (r'&&', TokenType.AND),
-            (r'\|\|', TokenType.OR),
-            # Operadores de comparación
-            (r'==', TokenType.EQUALS),
-            (r'!=', TokenType.NOT_EQUALS),
-            (r'<=', TokenType.LESS_EQUAL),
-            (r'>=', TokenType.GREATER_EQUAL),
-            (r'<', TokenType.LESS),
-            (r'>', TokenType.GREATER),
-            # Asignación
-            (r'=', TokenType.ASSIGN),
-            # Símbolos especiales
-            (r';', TokenType.SEMICOLON),
-            (r',', TokenType.COMMA),
-            (r'\(', TokenType.LPAREN),
-            (r'\)', TokenType.RPAREN),
-            (r'\{', TokenType.LBRACE),
-            (r'\}', TokenType.RBRACE),
-            # Literales
-            (r'\d+\.\d+', TokenType.FLOAT_LITERAL),
-            (r'\d+', TokenType.INTEGER_LITERAL),
-            (r'\'[^\']*\'', TokenType.CHAR_LITERAL),
-            (r'"[^"]*"', TokenType.STRING_LITERAL),
-            # Identificadores
-            (r'[A-Za-z_][A-Za-z0-9_]*', TokenType.ID),
-        ]
-        
-        return [(re.compile(pattern), token_type) 
-                for pattern, token_type in token_patterns]
-    
-    def tokenize(self) -> List[Token]:
-        tokens = []
+        scanned = []
+        for base, (kinds, starts, lengths, errors, error) in zip(boundaries, results):
+            # Cada fragmento empieza tras un salto de línea: basta con desplazar la línea
+            base_line = lines.position(base)[0] - 1
+            self.errors.extend(LexicalError(message, line + base_line, column)
+                               for message, line, column in errors)
+            if error is not None:
+                message, line, column = error
+                self.line, self.column = line + base_line, column
+                raise LexicalError(message, self.line, self.column)
+            # El EOF de cada fragmento se descarta salvo el del último
+            scanned.append((base, kinds[:-1], starts[:-1], lengths[:-1]))
+        
+        tokens = list(self._build_tokens(chain.from_iterable(
+            ((_TOKEN_TYPES[kind], base + start, base + start + length)
+             for kind, start, length in zip(kinds, starts, lengths))
+            for base, kinds, starts, lengths in scanned)))
+        tokens.append(Token(TokenType.EOF, '', None, None, len(text), lines))
+        self.line, self.column = lines.position(len(text))
+        return tokens
+    
+    def _safe_boundaries(self, parts: int) -> List[int]:
+        """
+        Busca hasta parts - 1 puntos de corte seguros, repartidos de forma
+        aproximadamente uniforme: posiciones justo después de un salto de
+        línea que no está dentro de un comentario ni de un literal.
+        """
+        text = self.text
+        end = len(text)
+        if self.is_bytes:
+            pattern, newline = PRESCAN_BYTES_PATTERN, b'\n'
+        else:
+            pattern, newline = PRESCAN_PATTERN, '\n'
+        step = end // parts
+        target = step
+        boundaries: List[int] = []
         pos = 0
         
-        while pos < len(self.text):
-            match = None
-            match_token_type = None
-            match_length = 0
+        # Los saltos de línea seguros son los que quedan entre dos coincidencias
+        for match in chain(pattern.finditer(text), [None]):
+            gap_end = match.start() if match is not None else end
+            while target < gap_end:
+                cut = text.find(newline, max(pos, target), gap_end)
+                if cut == -1:
+                    break
+                boundaries.append(cut + 1)
+                if len(boundaries) == parts - 1:
+                    return boundaries
+                target = max(target + step, cut + 1)
+            if match is None:
+                break
+            pos = match.end()
+        return boundaries
+    
+    def relex(self, tokens: List[Token], start: int, end: int, replacement: str) -> List[Token]:
+        """
+        Re-escanea incrementalmente después de reemplazar self.text[start:end]
+        por replacement. tokens debe ser el resultado de tokenizar el texto
+        actual del lexer; sus objetos se reutilizan en la lista retornada.
+        
+        Solo se re-escanea desde el último punto seguro antes de la edición
+        hasta que el flujo de tokens se resincroniza con el anterior; a partir
+        de ahí los tokens viejos solo se desplazan. En modo de recuperación
+        self.errors se reconstruye a partir de los tokens ERROR resultantes.
+        """
+        if self.is_bytes:
+            raise ValueError("relex solo admite entradas de tipo str")
+        if self.trivia is not None:
+            raise ValueError("relex no admite el modo con trivias")
+        
+        old_text = self.text
+        delta = len(replacement) - (end - start)
+        new_end = start + len(replacement)
+        self.text = old_text[:start] + replacement + old_text[end:]
+        self.lines = None
+        lines = self.line_index()
+        
+        # Punto de reinicio: último token que termina antes de la edición
+        # (un token que llega hasta la edición podría extenderse)
+        restart = bisect_left(tokens, start, key=lambda token: token.offset) - 1
+        while restart >= 0 and tokens[restart].offset + len(tokens[restart].value) >= start:
+            restart -= 1
+        restart = self._safe_restart(tokens, restart, old_text)
+        
+        if restart < 0:
+            restart, pos = 0, 0
+        else:
+            pos = tokens[restart].offset
+        
+        new_tokens = tokens[:restart]
+        # Primer token viejo posterior a la edición
+        old_index = bisect_left(tokens, end, key=lambda token: token.offset)
+        text = self.text
+        
+        for token_type, token_start, token_end in self._scan(pos):
+            if token_start >= new_end:
+                # Buscar un token viejo que empiece en la misma posición desplazada
+                while old_index < len(tokens) and tokens[old_index].offset + delta < token_start:
+                    old_index += 1
+                if old_index < len(tokens) and tokens[old_index].offset + delta == token_start:
+                    for token in tokens[old_index:]:
+                        token.shift(delta, lines)
+                    new_tokens.extend(tokens[old_index:])
+                    self.line, self.column = lines.position(len(text))
+                    return self._relexed(new_tokens)
+            new_tokens.append(self._make_token(token_type, text[token_start:token_end],
+                                               token_start, lines))
+        return self._relexed(new_tokens)
+    
+    def _relexed(self, tokens: List[Token]) -> List[Token]:
+        """
+        Tras relex, los errores de la versión anterior quedan desplazados o ya
+        no existen: cada token ERROR corresponde a un diagnóstico
+        """
+        if self.recover:
+            self.errors = [LexicalError(f"Carácter no reconocido: {token.value}",
+                                        token.line, token.column)
+                           for token in tokens if token.type == TokenType.ERROR]
+        return tokens
+    
+    def _make_token(self, token_type: TokenType, value: str, offset: int, lines: LineIndex) -> Token:
+        """Construye un token fuera del bucle principal (interna IDs y decodifica literales)"""
+        if token_type == TokenType.ID:
+            symbol = SYMBOLS.intern(value)
+            return Token(token_type, SYMBOLS.names[symbol], None, None, offset, lines, symbol)
+        if token_type in LITERAL_TYPES:
+            return Token(token_type, value, None, None, offset, lines,
+                         literal=CONSTANTS.decode(token_type, value))
+        return Token(token_type, value, None, None, offset, lines)
+    
+    def _safe_restart(self, tokens: List[Token], restart: int, old_text: str) -> int:
+        """
+        Retrocede el punto de reinicio antes de cualquier '/*' sin cerrar,
+        ya que la edición podría cerrarlo y convertirlo en un comentario.
+        Un '/*' sin cerrar solo puede estar después del último '*/' del texto.
+        En modo de recuperación también antes de la primera comilla sin
+        cerrar (un token ERROR), que la edición podría convertir en literal.
+        """
+        if restart < 0:
+            return restart
+        if self.recover:
+            for index in range(restart + 1):
+                token = tokens[index]
+                if token.type == TokenType.ERROR and ("'" in token.value or '"' in token.value):
+                    restart = index
+                    break
+        last_close = old_text.rfind('*/')
+        # El '/*' debe empezar antes del token de reinicio
+        unclosed = old_text.find('/*', max(0, last_close - 1), tokens[restart].offset + 1)
+        if unclosed == -1:
+            return restart
+        return bisect_right(tokens, unclosed, key=lambda token: token.offset) - 1
+    
+    def _scan(self, pos: int = 0) -> Iterator[Tuple[TokenType, int, int]]:
+        """
+        Núcleo del escáner: produce (tipo, inicio, fin) para cada token a
+        partir de pos, sin construir su valor ni calcular línea y columna.
+        """
+        if self.trivia is not None:
+            # Cada escaneo completo llena una tabla nueva (relex no admite trivias)
+            self.trivia = TriviaTable(self.text, self.is_bytes)
+        scanned = self._scan_table(pos) if self.engine == 'table' else self._scan_regex(pos)
+        if self.trivia is not None:
+            return self._close_trivia(scanned)
+        return scanned
+    
+    def _close_trivia(self, scanned: Iterator[Tuple[TokenType, int, int]]) -> Iterator[Tuple[TokenType, int, int]]:
+        """Asocia las trivias registradas con el token que las sigue"""
+        close_token = self.trivia.close_token
+        for item in scanned:
+            close_token()
+            yield item
+    
+    def _scan_regex(self, pos: int) -> Iterator[Tuple[TokenType, int, int]]:
+        """Escaneo con la regex combinada"""
+        text = self.text
+        end = len(text)
+        if self.is_bytes:
+            match_at = self.master_bytes_pattern.match
+            keywords = self.keyword_bytes
+        else:
+            match_at = self.master_pattern.match
+            keywords = self.keywords
+        group_types = self.group_types
+        trivia = self.trivia
+        
+        while pos < end:
+            # Una sola búsqueda por token: la alternancia está ordenada de modo
+            # que la primera coincidencia es la más larga
+            regex_match = match_at(text, pos)
+            if regex_match is None:
+                start = pos
+                pos = self._unrecognized(pos, lambda pos: match_at(text, pos) is not None)
+                yield TokenType.ERROR, start, pos
+                continue
             
-            # Buscar el patrón más largo que coincida
-            for pattern, token_type in self.token_specs:
-                regex_match = pattern.match(self.text, pos)
-                if regex_match:
-                    current_match = regex_match.group(0)
-                    if len(current_match) > match_length:
-                        match = current_match
-                        match_token_type = token_type
-                        match_length = len(current_match)
+            start = pos
+            pos = regex_match.end()
+            match_token_type = group_types[regex_match.lastindex]
             
-            if match:
-                if match_token_type:  # Ignorar si el token_type es None
-                    if match_token_type == TokenType.ID and match in self.keywords:
-                        # Si es un identificador pero coincide con una palabra reservada
-                        token_type = self.keywords[match]
-                    else:
-                        token_type = match_token_type
-                    
-                    if token_type != TokenType.NEWLINE and token_type != TokenType.COMMENT:
-                        tokens.append(Token(token_type, match, self.line, self.column))
-                
-                # Actualizar posición y columna
-                if match_token_type == TokenType.NEWLINE:
-                    self.line += 1
-                    self.column = 1
-                else:
-                    self.column += len(match)
-                pos += len(match)
+            # Espacios, saltos de línea y comentarios se ignoran
+            if match_token_type is None or match_token_type == TokenType.NEWLINE \
+                    or match_token_type == TokenType.COMMENT:
+                if trivia is not None:
+                    trivia.add(match_token_type, start, pos)
+                continue
+            
+            if match_token_type == TokenType.ID:
+                # Si es un identificador pero coincide con una palabra reservada
+                yield keywords.get(regex_match.group(), TokenType.ID), start, pos
+            else:
+                yield match_token_type, start, pos
+        
+        self.line, self.column = self.line_index().position(end)
+        
+        # Agregar token de fin de archivo
+        yield TokenType.EOF, end, end
+    
+    def _scan_table(self, pos: int) -> Iterator[Tuple[TokenType, int, int]]:
+        """Escaneo con la tabla de clases de carácter (TableScanner)"""
+        text = self.text
+        end = len(text)
+        keywords = self.keyword_bytes if self.is_bytes else self.keywords
+        match = TableScanner(text, self.is_bytes).match
+        trivia = self.trivia
+        
+        while pos < end:
+            result = match(pos)
+            if result is None:
+                start = pos
+                pos = self._unrecognized(pos, lambda pos: match(pos) is not None)
+                yield TokenType.ERROR, start, pos
+                continue
+            
+            start = pos
+            match_token_type, pos = result
+            
+            # Espacios, saltos de línea y comentarios se ignoran
+            if match_token_type is None or match_token_type == TokenType.NEWLINE \
+                    or match_token_type == TokenType.COMMENT:
+                if trivia is not None:
+                    trivia.add(match_token_type, start, pos)
+                continue
+            
+            if match_token_type == TokenType.ID:
+                # Si es un identificador pero coincide con una palabra reservada
+                yield keywords.get(text[start:pos], TokenType.ID), start, pos
             else:
-                # Carácter no reconocido
-                raise LexicalError(
-                    f"Carácter no reconocido: {self.text[pos]}", 
-                    self.line, 
-                    self.column
-                )
+                yield match_token_type, start, pos
+        
+        self.line, self.column = self.line_index().position(end)
         
         # Agregar token de fin de archivo
-        tokens.append(Token(TokenType.EOF, '', self.line, self.column))
-        return tokens
\ No newline at end of file
+        yield TokenType.EOF, end, end
+    
+    def _unrecognized(self, pos: int, matches) -> int:
+        """
+        Maneja un carácter no reconocido en pos. Sin recuperación lanza
+        LexicalError; en modo de recuperación registra el error y retorna el
+        fin de la racha de caracteres no reconocidos (según matches).
+        """
+        line, column = self.line_index().position(pos)
+        if not self.recover:
+            # Carácter no reconocido
+            self.line, self.column = line, column
+            raise LexicalError(
+                f"Carácter no reconocido: {self._char_at(pos)}", 
+                line, 
+                column
+            )
+        
+        # Agrupar los caracteres no reconocidos consecutivos en un token ERROR
+        start = pos
+        end = len(self.text)
+        pos += 1
+        while pos < end and not matches(pos):
+            pos += 1
+        self.errors.append(LexicalError(
+            f"Carácter no reconocido: {self._text_between(start, pos)}",
+            line,
+            column
+        ))
+        return pos
+    
+    def _text_between(self, start: int, end: int) -> str:
+        """Texto entre dos posiciones de la entrada (decodificado si es necesario)"""
+        if self.is_bytes:
+            return self.text[start:end].decode('utf-8', errors='replace')
+        return self.text[start:end]
+    
+    def _char_at(self, pos: int) -> str:
+        """Carácter en una posición de la entrada (decodificado si es necesario)"""
+        if self.is_bytes:
+            return self.text[pos:pos + 4].decode('utf-8', errors='replace')[0]
+        return self.text[pos]
+
+def _scan_chunk(args: Tuple[Union[str, bytes], bool, str]):
+    """
+    Escanea un fragmento en un proceso del pool. Retorna arreglos compactos
+    (tipos, inicios, longitudes), los errores recuperados y el error que
+    detuvo el escaneo, con posiciones relativas al fragmento.
+    """
+    chunk, recover, engine = args
+    lexer = Lexer(chunk, recover, engine)
+    kinds, starts, lengths = array('B'), array('Q'), array('I')
+    error = None
+    try:
+        for token_type, start, end in lexer._scan():
+            kinds.append(token_type.value)
+            starts.append(start)
+            lengths.append(end - start)
+    except LexicalError as e:
+        error = (e.message, e.line, e.column)
+    # Las excepciones con varios argumentos no se serializan bien: enviar tuplas
+    errors = [(e.message, e.line, e.column) for e in lexer.errors]
+    return kinds, starts, lengths, errors, error
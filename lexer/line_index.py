@@ -0,0 +1,32 @@
+import re
+from array import array
+from bisect import bisect_right
+from typing import Tuple
+
+_NEWLINE = re.compile('\n')
+_NEWLINE_BYTES = re.compile(b'\n')
+
+class LineIndex:
+    """
+    Tabla de offsets de inicio de cada línea.
+    Se construye una sola vez con un escaneo rápido de saltos de línea y
+    permite resolver (línea, columna) de cualquier offset por búsqueda binaria.
+    """
+    def __init__(self, text):
+        self.text = text
+        self.is_bytes = not isinstance(text, str)
+        newline = _NEWLINE_BYTES if self.is_bytes else _NEWLINE
+        self.starts = array('Q', [0])
+        self.starts.extend(match.end() for match in newline.finditer(text))
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Retorna (línea, columna) de un offset, ambas desde 1"""
+        line = bisect_right(self.starts, offset)
+        line_start = self.starts[line - 1]
+        if self.is_bytes:
+            # La columna se cuenta en caracteres, no en bytes
+            return line, len(self.text[line_start:offset].decode('utf-8', errors='replace')) + 1
+        return line, offset - line_start + 1
+
+    def __len__(self) -> int:
+        return len(self.starts)
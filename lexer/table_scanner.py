@@ -0,0 +1,154 @@
+from typing import Dict, List, Optional, Tuple, Union
+from .token_type import TokenType
+
+# Clases de carácter
+OTHER = 0          # No puede iniciar ningún token
+SPACE = 1          # ' ', '\t' y '\r'
+NEWLINE = 2        # '\n'
+LETTER = 3         # [A-Za-z_]
+DIGIT = 4          # [0-9]
+SLASH = 5          # '/': división o comentario
+QUOTE = 6          # '\''
+DOUBLE_QUOTE = 7   # '"'
+OPERATOR = 8       # Operadores y símbolos especiales
+
+def _build_char_classes() -> List[int]:
+    classes = [OTHER] * 256
+    classes[ord(' ')] = classes[ord('\t')] = classes[ord('\r')] = SPACE
+    classes[ord('\n')] = NEWLINE
+    for code in range(256):
+        char = chr(code)
+        if ('a' <= char <= 'z') or ('A' <= char <= 'Z') or char == '_':
+            classes[code] = LETTER
+        elif '0' <= char <= '9':
+            classes[code] = DIGIT
+    classes[ord('/')] = SLASH
+    classes[ord('\'')] = QUOTE
+    classes[ord('"')] = DOUBLE_QUOTE
+    for char in '+-*=!<>&|;,(){}':
+        classes[ord(char)] = OPERATOR
+    return classes
+
+# Tabla de 256 entradas: código de carácter -> clase
+CHAR_CLASSES = _build_char_classes()
+
+# Transiciones de operadores: primer carácter -> (tipo si queda solo,
+# {segundo carácter: tipo del operador de dos caracteres})
+OPERATOR_TRANSITIONS: Dict[int, Tuple[Optional[TokenType], Dict[int, TokenType]]] = {
+    ord('+'): (TokenType.PLUS, {}),
+    ord('-'): (TokenType.MINUS, {}),
+    ord('*'): (TokenType.TIMES, {}),
+    ord('='): (TokenType.ASSIGN, {ord('='): TokenType.EQUALS}),
+    ord('!'): (None, {ord('='): TokenType.NOT_EQUALS}),
+    ord('<'): (TokenType.LESS, {ord('='): TokenType.LESS_EQUAL}),
+    ord('>'): (TokenType.GREATER, {ord('='): TokenType.GREATER_EQUAL}),
+    ord('&'): (None, {ord('&'): TokenType.AND}),
+    ord('|'): (None, {ord('|'): TokenType.OR}),
+    ord(';'): (TokenType.SEMICOLON, {}),
+    ord(','): (TokenType.COMMA, {}),
+    ord('('): (TokenType.LPAREN, {}),
+    ord(')'): (TokenType.RPAREN, {}),
+    ord('{'): (TokenType.LBRACE, {}),
+    ord('}'): (TokenType.RBRACE, {}),
+}
+
+class TableScanner:
+    """
+    Escáner escrito a mano, alternativo a la regex combinada.
+    Clasifica cada carácter con CHAR_CLASSES y resuelve los operadores de
+    uno o dos caracteres con OPERATOR_TRANSITIONS. Reconoce exactamente los
+    mismos tokens que TOKEN_PATTERNS.
+    """
+    def __init__(self, text: Union[str, bytes], is_bytes: bool):
+        self.text = text
+        self.end = len(text)
+        self.is_bytes = is_bytes
+        if is_bytes:
+            self.newline, self.quote, self.double_quote = b'\n', b'\'', b'"'
+            self.comment_close = b'*/'
+        else:
+            self.newline, self.quote, self.double_quote = '\n', '\'', '"'
+            self.comment_close = '*/'
+
+    def code_at(self, pos: int) -> int:
+        """Código del carácter en pos"""
+        return self.text[pos] if self.is_bytes else ord(self.text[pos])
+
+    def class_at(self, pos: int) -> int:
+        """Clase del carácter en pos"""
+        if self.is_bytes:
+            return CHAR_CLASSES[self.text[pos]]
+        code = ord(self.text[pos])
+        return CHAR_CLASSES[code] if code < 256 else OTHER
+
+    def match(self, pos: int) -> Optional[Tuple[Optional[TokenType], int]]:
+        """
+        Reconoce el token que empieza en pos y retorna (tipo, fin), o None si
+        ningún token empieza ahí. Como en GROUP_TYPES, el tipo es None para
+        espacios y NEWLINE o COMMENT para saltos de línea y comentarios; los
+        identificadores se retornan como ID (sin resolver palabras reservadas).
+        """
+        text = self.text
+        end = self.end
+        char_class = self.class_at(pos)
+
+        if char_class == LETTER:
+            pos += 1
+            while pos < end and self.class_at(pos) in (LETTER, DIGIT):
+                pos += 1
+            return TokenType.ID, pos
+
+        if char_class == SPACE:
+            pos += 1
+            while pos < end and self.class_at(pos) == SPACE:
+                pos += 1
+            return None, pos
+
+        if char_class == NEWLINE:
+            return TokenType.NEWLINE, pos + 1
+
+        if char_class == OPERATOR:
+            single, pairs = OPERATOR_TRANSITIONS[self.code_at(pos)]
+            if pairs and pos + 1 < end:
+                pair = pairs.get(self.code_at(pos + 1))
+                if pair is not None:
+                    return pair, pos + 2
+            if single is None:
+                return None
+            return single, pos + 1
+
+        if char_class == DIGIT:
+            pos = self._skip_digits(pos + 1)
+            # Flotante: dígitos, punto y al menos un dígito más
+            if pos + 1 < end and self.code_at(pos) == ord('.') \
+                    and self.class_at(pos + 1) == DIGIT:
+                return TokenType.FLOAT_LITERAL, self._skip_digits(pos + 2)
+            return TokenType.INTEGER_LITERAL, pos
+
+        if char_class == SLASH:
+            if pos + 1 < end:
+                following = self.code_at(pos + 1)
+                if following == ord('/'):
+                    close = text.find(self.newline, pos + 2)
+                    return TokenType.COMMENT, end if close == -1 else close
+                if following == ord('*'):
+                    close = text.find(self.comment_close, pos + 2)
+                    # Un '/*' sin cerrar no es comentario: queda como división
+                    if close != -1:
+                        return TokenType.COMMENT, close + 2
+            return TokenType.DIVIDE, pos + 1
+
+        if char_class == QUOTE:
+            close = text.find(self.quote, pos + 1)
+            return None if close == -1 else (TokenType.CHAR_LITERAL, close + 1)
+
+        if char_class == DOUBLE_QUOTE:
+            close = text.find(self.double_quote, pos + 1)
+            return None if close == -1 else (TokenType.STRING_LITERAL, close + 1)
+
+        return None
+
+    def _skip_digits(self, pos: int) -> int:
+        while pos < self.end and self.class_at(pos) == DIGIT:
+            pos += 1
+        return pos
@@ -1,13 +1,79 @@
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 from .token_type import TokenType
+from .line_index import LineIndex
 
-@dataclass
 class Token:
-    type: TokenType
-    value: Any
-    line: int
-    column: int
+    """
+    Token léxico.
+    Los identificadores llevan su ID internado en symbol y los literales
+    su valor ya decodificado en literal.
+    Los tokens generados por el lexer solo guardan su offset: la línea y la
+    columna se resuelven con el LineIndex la primera vez que se piden
+    (por ejemplo, al reportar un diagnóstico o crear un nodo del árbol).
+    """
+    __slots__ = ('type', 'value', 'offset', 'symbol', 'literal', '_line', '_column', '_lines')
+
+    def __init__(self, type: TokenType, value: Any, line: Optional[int] = None,
+                 column: Optional[int] = None, offset: int = 0,
+                 lines: Optional[LineIndex] = None, symbol: Optional[int] = None,
+                 literal: Any = None):
+        self.type = type
+        self.value = value
+        self.offset = offset  # Posición del token en la entrada (caracteres o bytes)
+        self.symbol = symbol  # ID internado del identificador (solo tokens ID)
+        self.literal = literal  # Valor decodificado del literal (solo literales)
+        self._line = line
+        self._column = column
+        self._lines = lines
+
+    def _resolve(self) -> None:
+        self._line, self._column = self._lines.position(self.offset)
+
+    @property
+    def line(self) -> int:
+        if self._line is None:
+            self._resolve()
+        return self._line
+
+    @line.setter
+    def line(self, value: int) -> None:
+        self._line = value
+
+    @property
+    def column(self) -> int:
+        if self._column is None:
+            self._resolve()
+        return self._column
+
+    @column.setter
+    def column(self, value: int) -> None:
+        self._column = value
+
+    def shift(self, delta: int, lines: LineIndex) -> None:
+        """Desplaza el token tras una edición y descarta la posición ya resuelta"""
+        self.offset += delta
+        self._line = None
+        self._column = None
+        self._lines = lines
+
+    def relocate(self, other: 'Token') -> None:
+        """Toma la posición de other: el mismo token en otra versión de la entrada"""
+        self.offset = other.offset
+        self._line = other._line
+        self._column = other._column
+        self._lines = other._lines
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+        return (self.type, self.value, self.offset, self.line, self.column) == \
+               (other.type, other.value, other.offset, other.line, other.column)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Token(type={self.type!r}, value={self.value!r}, line={self.line}, "
+                f"column={self.column}, offset={self.offset})")
     
     def __str__(self) -> str:
-        return f"Token(type={self.type.name}, value='{self.value}', line={self.line}, column={self.column})"
\ No newline at end of file
+        return f"Token(type={self.type.name}, value='{self.value}', line={self.line}, column={self.column})"
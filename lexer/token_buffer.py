@@ -0,0 +1,90 @@
+from array import array
+from typing import Dict, Optional
+from .token import Token
+from .token_type import TokenType
+from .line_index import LineIndex
+from .interner import SYMBOLS
+from .constant_pool import CONSTANTS, LITERAL_TYPES
+
+# Tipos de token indexados por su valor numérico
+_TOKEN_TYPES = [None] * (max(token_type.value for token_type in TokenType) + 1)
+for _token_type in TokenType:
+    _TOKEN_TYPES[_token_type.value] = _token_type
+
+# Tokens materializados que se conservan: cubre peek, previous y el lookahead del parser
+RECENT_TOKENS = 8
+
+class TokenBuffer:
+    """
+    Almacén compacto de tokens en arreglos paralelos (struct-of-arrays).
+    Cada token ocupa unos pocos bytes: tipo, inicio y longitud.
+    El valor se recorta de la entrada y la línea y columna se resuelven con
+    el LineIndex solo cuando se piden.
+    Se indexa como una lista de Token, así que Parser y TableParser pueden
+    recorrerlo con sus métodos peek/advance/check/match habituales. Los
+    últimos tokens materializados se conservan: el parser lee varias veces
+    la misma posición y recibe siempre el mismo objeto.
+    """
+    def __init__(self, text, lines: LineIndex,
+                 fixed_values: Optional[Dict[TokenType, str]] = None):
+        self.text = text
+        self.lines = lines
+        # Si se indica, la entrada son bytes y estos valores evitan decodificar
+        self.fixed_values = fixed_values
+        self.kinds = array('B')
+        self.starts = array('Q')
+        self.lengths = array('I')
+        # Índice -> Token de los últimos RECENT_TOKENS materializados
+        self.recent: Dict[int, Token] = {}
+
+    def append(self, token_type: TokenType, start: int, length: int) -> None:
+        self.kinds.append(token_type.value)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        """Token en la posición indicada (reutiliza los materializados hace poco)"""
+        if index < 0:
+            index += len(self.kinds)
+        recent = self.recent
+        token = recent.get(index)
+        if token is None:
+            token = self.materialize(index)
+            if len(recent) >= RECENT_TOKENS:
+                # Descartar el más antiguo (orden de inserción)
+                del recent[next(iter(recent))]
+            recent[index] = token
+        return token
+
+    def materialize(self, index: int) -> Token:
+        """Construye el token en la posición indicada"""
+        token_type = self.type_at(index)
+        value = self.value_at(index)
+        offset = self.starts[index]
+        if token_type == TokenType.ID:
+            symbol = SYMBOLS.intern(value)
+            return Token(token_type, SYMBOLS.names[symbol], None, None, offset, self.lines, symbol)
+        if token_type in LITERAL_TYPES:
+            return Token(token_type, value, None, None, offset, self.lines,
+                         literal=CONSTANTS.decode(token_type, value))
+        return Token(token_type, value, None, None, offset, self.lines)
+
+    def type_at(self, index: int) -> TokenType:
+        return _TOKEN_TYPES[self.kinds[index]]
+
+    def value_at(self, index: int) -> str:
+        """Recorta el valor del token desde la entrada"""
+        start = self.starts[index]
+        value = self.text[start:start + self.lengths[index]]
+        if self.fixed_values is not None:
+            fixed = self.fixed_values.get(self.type_at(index))
+            return fixed if fixed is not None else value.decode('utf-8')
+        return value
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arreglos de tokens (sin contar la entrada)"""
+        return sum(len(column) * column.itemsize
+                   for column in (self.kinds, self.starts, self.lengths))
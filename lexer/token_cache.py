@@ -0,0 +1,147 @@
+import hashlib
+import os
+import struct
+from array import array
+from typing import Dict, List, Optional
+from .lexer import Lexer, LEXER_VERSION
+from .token import Token
+from .token_type import TokenType
+from .token_buffer import _TOKEN_TYPES
+from .line_index import LineIndex
+from .interner import SYMBOLS
+from .constant_pool import CONSTANTS, LITERAL_TYPES
+
+TOKEN_CACHE_DIR = '.token_cache'
+
+# Encabezado: firma, versión del formato, versión del lexer, hash del
+# contenido, cantidad de tokens y de cadenas
+_MAGIC = b'CTOK'
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHH32sQI')
+
+class TokenCache:
+    """
+    Caché en disco del flujo de tokens de un archivo, indexada por el hash
+    de su contenido. Formato binario compacto: encabezado, tabla de cadenas
+    internadas (los valores distintos) y tres arreglos paralelos con el tipo,
+    el desplazamiento y el índice del valor de cada token. Los arreglos se
+    guardan en el orden de bytes nativo: la caché es local a la máquina.
+    Una entrada con otra versión del lexer se trata como ausente. La clave
+    incluye la unidad de los offsets (caracteres o bytes), así el modo str y
+    el modo mmap no comparten entradas.
+    """
+    def __init__(self, directory: str = TOKEN_CACHE_DIR):
+        self.directory = directory
+
+    def path_for(self, digest: bytes) -> str:
+        return os.path.join(self.directory, digest.hex() + '.tok')
+
+    def tokenize(self, lexer: Lexer) -> List[Token]:
+        """
+        Retorna los tokens de la entrada del lexer: los carga de la caché si
+        el contenido no cambió; si no, tokeniza y guarda el resultado.
+        En modo de recuperación o con trivias no se usa la caché: las entradas
+        no guardan los diagnósticos (lexer.errors) ni la tabla de trivias.
+        """
+        if lexer.recover or lexer.trivia is not None:
+            return lexer.tokenize()
+        digest = _digest(lexer.text)
+        tokens = self.load(digest, lexer.line_index())
+        if tokens is None:
+            tokens = lexer.tokenize(parallel=True)
+            self.store(digest, tokens)
+        return tokens
+
+    def load(self, digest: bytes, lines: LineIndex) -> Optional[List[Token]]:
+        """Carga los tokens guardados para el hash indicado, o None si no hay"""
+        try:
+            with open(self.path_for(digest), 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        try:
+            magic, format_version, lexer_version, stored_digest, count, string_count = \
+                _HEADER.unpack_from(data)
+            if magic != _MAGIC or format_version != _FORMAT_VERSION \
+                    or lexer_version != LEXER_VERSION or stored_digest != digest:
+                return None
+            pos = _HEADER.size
+            string_lengths, pos = _read_array('I', data, pos, string_count)
+            strings = []
+            for length in string_lengths:
+                strings.append(data[pos:pos + length].decode('utf-8'))
+                pos += length
+            kinds, pos = _read_array('B', data, pos, count)
+            offsets, pos = _read_array('Q', data, pos, count)
+            values, pos = _read_array('I', data, pos, count)
+            if pos != len(data):
+                return None
+        except (struct.error, ValueError, UnicodeDecodeError):
+            # Archivo truncado o corrupto: se re-tokeniza
+            return None
+
+        tokens = []
+        for kind, offset, value_index in zip(kinds, offsets, values):
+            token_type = _TOKEN_TYPES[kind]
+            value = strings[value_index]
+            if token_type == TokenType.ID:
+                symbol = SYMBOLS.intern(value)
+                tokens.append(Token(token_type, SYMBOLS.names[symbol], None, None, offset, lines, symbol))
+            elif token_type in LITERAL_TYPES:
+                tokens.append(Token(token_type, value, None, None, offset, lines,
+                                    literal=CONSTANTS.decode(token_type, value)))
+            else:
+                tokens.append(Token(token_type, value, None, None, offset, lines))
+        return tokens
+
+    def store(self, digest: bytes, tokens: List[Token]) -> None:
+        """Guarda los tokens para el hash indicado"""
+        string_ids: Dict[str, int] = {}
+        strings: List[bytes] = []
+        kinds, offsets, values = array('B'), array('Q'), array('I')
+        for token in tokens:
+            value_index = string_ids.get(token.value)
+            if value_index is None:
+                value_index = string_ids[token.value] = len(strings)
+                strings.append(token.value.encode('utf-8'))
+            kinds.append(token.type.value)
+            offsets.append(token.offset)
+            values.append(value_index)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(digest)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, LEXER_VERSION, digest,
+                                    len(tokens), len(strings)))
+            file.write(array('I', map(len, strings)).tobytes())
+            file.write(b''.join(strings))
+            file.write(kinds.tobytes())
+            file.write(offsets.tobytes())
+            file.write(values.tobytes())
+        # Reemplazo atómico: una lectura concurrente nunca ve un archivo a medias
+        os.replace(temp_path, path)
+
+def _digest(text) -> bytes:
+    """
+    Hash SHA-256 del contenido (str, bytes o mmap) y de la unidad de los
+    offsets: un lexer sobre str usa caracteres y uno sobre bytes usa bytes,
+    que difieren si hay texto no ASCII
+    """
+    if isinstance(text, str):
+        digest = hashlib.sha256(b'chars\0')
+        digest.update(text.encode('utf-8'))
+    else:
+        digest = hashlib.sha256(b'bytes\0')
+        digest.update(text)
+    return digest.digest()
+
+def _read_array(typecode: str, data: bytes, pos: int, count: int):
+    """Lee count elementos de un arreglo desde data[pos:]; retorna el arreglo y la nueva posición"""
+    values = array(typecode)
+    end = pos + count * values.itemsize
+    if end > len(data):
+        raise ValueError("caché truncada")
+    values.frombytes(data[pos:end])
+    return values, end
@@ -0,0 +1,55 @@
+from collections import deque
+from typing import Deque, Iterable, Iterator
+from .token import Token
+
+class TokenStream:
+    """
+    Fuente de tokens perezosa con búfer acotado.
+    Se indexa como una lista (stream[i]) pero solo conserva una ventana
+    deslizante de tokens, de modo que la memoria no crece con el tamaño
+    del archivo y el parser puede empezar antes de que termine el léxico.
+    """
+    # Máximo adelanto usado por el parser: classify_top_level mira hasta
+    # peek(2), es decir, actual + 2
+    LOOKAHEAD = 3
+    # Tokens ya consumidos que se conservan (previous())
+    HISTORY = 1
+
+    def __init__(self, tokens: Iterable[Token], lookahead: int = LOOKAHEAD):
+        self._source: Iterator[Token] = iter(tokens)
+        self._buffer: Deque[Token] = deque()
+        self._base = 0  # Índice absoluto del primer token del búfer
+        self._capacity = lookahead + self.HISTORY
+        self._exhausted = False
+
+    def __getitem__(self, index: int) -> Token:
+        # Los índices negativos solo aparecen al pedir previous() al inicio
+        if index < 0:
+            index = 0
+        
+        while index >= self._base + len(self._buffer) and not self._exhausted:
+            self._fill()
+        
+        if index < self._base:
+            raise IndexError(
+                f"El token {index} ya salió de la ventana de {self._capacity} tokens"
+            )
+        
+        offset = index - self._base
+        if offset >= len(self._buffer):
+            # Fuera del final: se repite el último token (EOF)
+            return self._buffer[-1]
+        return self._buffer[offset]
+
+    def _fill(self) -> None:
+        """Lee un token más de la fuente y descarta el más antiguo si hace falta"""
+        try:
+            token = next(self._source)
+        except StopIteration:
+            self._exhausted = True
+            return
+        
+        self._buffer.append(token)
+        if len(self._buffer) > self._capacity:
+            self._buffer.popleft()
+            self._base += 1
@@ -62,4 +62,5 @@ class TokenType(Enum):
     
     # Especiales
     EOF = auto()
-    NEWLINE = auto()
\ No newline at end of file
+    NEWLINE = auto()
+    ERROR = auto()    # Caracteres no reconocidos (modo de recuperación)
\ No newline at end of file
@@ -0,0 +1,61 @@
+from array import array
+from typing import List, Optional, Tuple
+from .token_type import TokenType
+from .token_buffer import _TOKEN_TYPES
+
+class TriviaTable:
+    """
+    Tabla lateral compacta con las trivias (espacios, saltos de línea y
+    comentarios) que el lexer descarta del flujo de tokens.
+    Cada trivia ocupa unos pocos bytes: tipo, inicio y longitud. Las trivias
+    se asocian al token que las sigue: bounds[i] es la cantidad de trivias
+    anteriores al token i, así que las del token i son las que van de
+    bounds[i - 1] a bounds[i]. Las que quedan al final pertenecen al EOF.
+    """
+    def __init__(self, text, is_bytes: bool = False):
+        self.text = text
+        self.is_bytes = is_bytes
+        # Tipo 0 = espacios (None en GROUP_TYPES); si no, el valor del TokenType
+        self.kinds = array('B')
+        self.starts = array('Q')
+        self.lengths = array('I')
+        self.bounds = array('I')
+
+    def add(self, token_type: Optional[TokenType], start: int, end: int) -> None:
+        """Registra una trivia que precede al próximo token"""
+        self.kinds.append(0 if token_type is None else token_type.value)
+        self.starts.append(start)
+        self.lengths.append(end - start)
+
+    def close_token(self) -> None:
+        """Marca que se generó un token: las trivias pendientes son suyas"""
+        self.bounds.append(len(self.kinds))
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def leading(self, token_index: int) -> List[Tuple[Optional[TokenType], str]]:
+        """Trivias que preceden al token indicado, como pares (tipo, texto)"""
+        first = self.bounds[token_index - 1] if token_index > 0 else 0
+        return [(self.type_at(index), self.text_at(index))
+                for index in range(first, self.bounds[token_index])]
+
+    def comments(self, token_index: int) -> List[str]:
+        """Comentarios que preceden al token indicado"""
+        return [text for token_type, text in self.leading(token_index)
+                if token_type == TokenType.COMMENT]
+
+    def type_at(self, index: int) -> Optional[TokenType]:
+        """Tipo de la trivia: None (espacios), NEWLINE o COMMENT"""
+        kind = self.kinds[index]
+        return _TOKEN_TYPES[kind] if kind else None
+
+    def text_at(self, index: int) -> str:
+        start = self.starts[index]
+        text = self.text[start:start + self.lengths[index]]
+        return text.decode('utf-8') if self.is_bytes else text
+
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arreglos de la tabla (sin contar la entrada)"""
+        return sum(len(column) * column.itemsize
+                   for column in (self.kinds, self.starts, self.lengths, self.bounds))
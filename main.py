@@ -1,37 +1,85 @@
+import os
 import sys
-from lexer.lexer import Lexer
-from parser.parser import Parser
-from utils.error_handler import CompilerError
-from semantic.analyzer import SemanticAnalyzer
+import time
+from lexer.lexer import Lexer, PARALLEL_THRESHOLD, reset_shared_tables
+from lexer.token_stream import TokenStream
+from lexer.token_cache import TokenCache
+from lexer.interner import SYMBOLS
+from lexer.constant_pool import CONSTANTS
+from parser.parser import Parser, MAX_ERRORS
+from parser.builders import NullBuilder
+from parser.table_parser import TableParser
+from utils.error_handler import CompilerError, LexicalError
+from semantic.checker import SemanticChecker
+from semantic.incremental import IncrementalFrontEnd
+from semantic.parallel import ParallelChecker
 
-def compile_file(file_path: str) -> None:
+# Crecimiento mínimo de las tablas compartidas antes de vaciarlas en el modo watch
+TABLE_SLACK = 4096
+
+def compile_file(file_path: str, use_cache: bool = False, table_driven: bool = False,
+                 recover: bool = False, max_errors: int = MAX_ERRORS,
+                 syntax_only: bool = False, parallel: bool = False) -> None:
     """
     Compila un archivo fuente completo.
+    Con table_driven se usa el parser LL(1) dirigido por tabla (TableParser).
+    Con recover se reportan todos los errores sintácticos y semánticos (hasta
+    max_errors) en lugar de detenerse en el primero.
+    Con syntax_only solo se valida la sintaxis, sin construir el AST.
+    Con parallel las funciones se analizan y verifican en un pool de procesos.
     """
+    # Los IDs y constantes de una compilación anterior ya no se usan
+    reset_shared_tables()
     try:
-        # Leer el archivo
-        with open(file_path, 'r') as file:
-            code = file.read()
+        # Mapear el archivo en memoria en lugar de leerlo completo a un str;
+        # el mapeo se libera al salir del bloque
+        with Lexer.from_file(file_path) as lexer:
+            print(f"\nCompilando archivo: {file_path}")
+            print("="*50)
         
-        print(f"\nCompilando archivo: {file_path}")
-        print("="*50)
+            # Análisis léxico (perezoso: el parser consume los tokens a medida que se generan).
+            # Los archivos muy grandes se tokenizan en paralelo en varios procesos.
+            # Con use_cache, un archivo sin cambios reutiliza los tokens guardados en disco.
+            if use_cache:
+                tokens = TokenCache().tokenize(lexer)
+            elif parallel or len(lexer.text) >= PARALLEL_THRESHOLD:
+                tokens = lexer.tokenize(parallel=True)
+            else:
+                tokens = TokenStream(lexer.iter_tokens())
         
-        # Análisis léxico
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
-        
-        # Análisis sintáctico y semántico
-        print("\nAnálisis Sintáctico y Semántico:")
-        print("-"*20)
-        semantic_analyzer = SemanticAnalyzer()
-        parser = Parser(tokens)
-        semantic_analyzer.analyze(parser)
-        parser.parse()
-        print("✓ Programa sintáctica y semánticamente correcto")
+            # Análisis sintáctico (construye el AST) y luego semántico sobre el AST
+            print("\nAnálisis Sintáctico y Semántico:")
+            print("-"*20)
+            if parallel:
+                checker = ParallelChecker(max_errors=max_errors)
+                if recover:
+                    print_errors(checker.check_with_errors(lexer.text, tokens), max_errors)
+                    return
+                checker.check(lexer.text, tokens)
+                print("✓ Programa sintáctica y semánticamente correcto")
+                return
+            if recover:
+                report_all_errors(tokens, max_errors)
+                return
+            if syntax_only:
+                Parser(tokens, builder=NullBuilder()).parse()
+                print("✓ Programa sintácticamente correcto")
+                return
+            parser = TableParser(tokens) if table_driven else Parser(tokens)
+            program = parser.parse()
+            SemanticChecker().check(program)
+            print("✓ Programa sintáctica y semánticamente correcto")
         
     except FileNotFoundError:
         print(f"Error: No se pudo encontrar el archivo '{file_path}'")
         sys.exit(1)
+    except LexicalError:
+        # Reportar todos los errores léxicos del archivo en una sola pasada
+        with Lexer.from_file(file_path) as lexer:
+            errors = lexer.tokenize_with_errors().errors
+        for error in errors:
+            print(f"\n❌ Error: {error}")
+        sys.exit(1)
     except CompilerError as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
@@ -39,6 +87,124 @@ def compile_file(file_path: str) -> None:
         print(f"\n❌ Error inesperado: {e}")
         sys.exit(1)
 
+def report_all_errors(tokens, max_errors: int) -> None:
+    """
+    Análisis sintáctico y semántico en modo de recuperación: imprime todos
+    los diagnósticos (hasta max_errors) en una sola pasada.
+    """
+    result = Parser(tokens, max_errors=max_errors).parse_with_errors()
+    errors = list(result.errors)
+    if len(errors) < max_errors:
+        # El AST recuperado se verifica igual; las construcciones con errores
+        # sintácticos no forman parte de él
+        checker = SemanticChecker(max_errors=max_errors - len(errors))
+        errors.extend(checker.check_with_errors(result.program))
+    print_errors(errors, max_errors)
+
+def print_errors(errors: list, max_errors: int) -> None:
+    """Imprime los diagnósticos ordenados por posición y termina con error si hay alguno"""
+    if not errors:
+        print("✓ Programa sintáctica y semánticamente correcto")
+        return
+    for error in sorted(errors, key=lambda error: (error.line, error.column)):
+        print(f"\n❌ Error: {error}")
+    if len(errors) >= max_errors:
+        print(f"\nSe alcanzó el máximo de {max_errors} errores; se omiten los demás")
+    print(f"\n{len(errors)} error(es) encontrados")
+    sys.exit(1)
+
+def watch_file(file_path: str, interval: float = 0.5) -> None:
+    """
+    Vuelve a analizar el archivo cada vez que cambia. Solo se re-escanea la
+    región editada (Lexer.relex) y solo se re-analizan las funciones que
+    cambiaron o cuyo entorno global cambió (IncrementalFrontEnd).
+    """
+    front_end = IncrementalFrontEnd()
+    lexer = None
+    tokens = None
+    modified = None
+    # Tamaño de las tablas compartidas tras el primer análisis desde que se vaciaron
+    table_sizes = None
+    print(f"\nObservando archivo: {file_path} (Ctrl+C para terminar)")
+    try:
+        while True:
+            try:
+                current = os.stat(file_path).st_mtime_ns
+            except FileNotFoundError:
+                print(f"Error: No se pudo encontrar el archivo '{file_path}'")
+                sys.exit(1)
+            if current != modified:
+                modified = current
+                with open(file_path, encoding='utf-8') as f:
+                    text = f.read()
+                start_time = time.perf_counter()
+                try:
+                    if table_sizes is not None and tables_outgrown(table_sizes):
+                        # Las tablas guardan nombres y literales de versiones
+                        # anteriores: vaciarlas y empezar de nuevo (sus IDs
+                        # invalidan los tokens y el caché del front end)
+                        reset_shared_tables()
+                        front_end = IncrementalFrontEnd()
+                        tokens = None
+                        table_sizes = None
+                    if tokens is None:
+                        lexer = Lexer(text)
+                        tokens = lexer.tokenize()
+                        if table_sizes is None:
+                            table_sizes = shared_table_sizes()
+                    else:
+                        start, end, replacement = changed_region(lexer.text, text)
+                        tokens = lexer.relex(tokens, start, end, replacement)
+                    front_end.update(tokens)
+                    stats = front_end.stats
+                    print(f"✓ Programa sintáctica y semánticamente correcto "
+                          f"({stats.reparsed} re-analizados, {stats.rechecked} re-verificados, "
+                          f"{(time.perf_counter() - start_time) * 1000:.0f} ms)")
+                except LexicalError as e:
+                    # El próximo cambio se tokeniza completo
+                    tokens = None
+                    print(f"❌ Error: {e}")
+                except CompilerError as e:
+                    print(f"❌ Error: {e}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+def shared_table_sizes() -> tuple:
+    """Cantidad de identificadores internados y de literales decodificados"""
+    return len(SYMBOLS), len(CONSTANTS.decoded)
+
+def tables_outgrown(sizes: tuple) -> bool:
+    """Alguna tabla compartida creció más del doble desde que se midió sizes"""
+    return any(current > 2 * size + TABLE_SLACK
+               for current, size in zip(shared_table_sizes(), sizes))
+
+def changed_region(old: str, new: str) -> tuple:
+    """
+    Edición que transforma old en new: (start, end, replacement) con
+    old[start:end] reemplazado por replacement. Las comparaciones de
+    prefijo y sufijo se hacen por bisección sobre rebanadas.
+    """
+    limit = min(len(old), len(new))
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = low
+
+    low, high = 0, limit - prefix
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[len(old) - middle:] == new[len(new) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    suffix = low
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
+
 def run_tests() -> None:
     """
     Ejecuta la suite de pruebas incorporada.
@@ -170,36 +336,69 @@ def run_tests() -> None:
     
     print("="*50)
     
+    # Un solo lexer reutilizado para todos los casos
+    lexer = Lexer('')
+    
     for i, code in enumerate(test_cases, 1):
         print(f"\nCaso de prueba #{i}")
         print("="*50)
         
         try:
             # Análisis léxico
-            lexer = Lexer(code)
+            lexer.reset(code)
+            reset_shared_tables()
             tokens = lexer.tokenize()
             
-            # Análisis sintáctico y semántico
+            # Análisis sintáctico (construye el AST) y luego semántico sobre el AST
             print("\nAnálisis Sintáctico y Semántico:")
             print("-"*20)
-            semantic_analyzer = SemanticAnalyzer()
-            parser = Parser(tokens)
-            semantic_analyzer.analyze(parser)
-            parser.parse()
+            program = Parser(tokens).parse()
+            SemanticChecker().check(program)
             print("✓ Programa sintáctica y semánticamente correcto")
             
         except CompilerError as e:
             print(f"\n❌ Error: {e}")
 
 def main():
-    if len(sys.argv) == 1:
+    # --cache: guardar y reutilizar los tokens de archivos sin cambios
+    use_cache = '--cache' in sys.argv[1:]
+    # --ll1: usar el parser dirigido por la tabla LL(1)
+    table_driven = '--ll1' in sys.argv[1:]
+    # --recover: reportar todos los errores; --max-errors=N limita cuántos
+    recover = '--recover' in sys.argv[1:]
+    # --syntax-only: solo validar la sintaxis (sin AST ni análisis semántico)
+    syntax_only = '--syntax-only' in sys.argv[1:]
+    # --parallel: analizar y verificar las funciones en varios procesos
+    parallel = '--parallel' in sys.argv[1:]
+    # --watch: volver a analizar el archivo cada vez que cambia (incremental)
+    watch = '--watch' in sys.argv[1:]
+    max_errors = MAX_ERRORS
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--max-errors='):
+            recover = True
+            value = arg.split('=', 1)[1]
+            try:
+                max_errors = int(value)
+            except ValueError:
+                max_errors = 0
+            if max_errors <= 0:
+                print(f"Error: --max-errors espera un entero positivo, se recibió '{value}'")
+                sys.exit(1)
+        elif arg not in ('--cache', '--ll1', '--recover', '--syntax-only', '--watch', '--parallel'):
+            args.append(arg)
+    if not args:
         # Sin argumentos, ejecutar suite de pruebas
         print("No se proporcionó archivo. Ejecutando suite de pruebas...")
         run_tests()
     else:
         # Compilar el archivo proporcionado
-        file_path = sys.argv[1]
-        compile_file(file_path)
+        file_path = args[0]
+        if watch:
+            watch_file(file_path)
+            return
+        compile_file(file_path, use_cache, table_driven, recover, max_errors, syntax_only,
+                     parallel)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,254 @@
+from typing import Any, NamedTuple, Optional
+from anytree import Node
+from lexer.token import Token
+from lexer.token_type import TokenType
+from parser.builders import NullBuilder
+from parser.parser import BINARY_PRECEDENCE
+from .parse_tree import ParseTree
+
+# Nodos de cada nivel de expresión y de sus operaciones, por la precedencia
+# de BINARY_PRECEDENCE. Debajo del último nivel están los nodos Factor.
+EXPRESSION_LEVELS = {
+    1: ("LogicExpr", "LogicOperation"),
+    2: ("CompExpr", "ComparisonOperation"),
+    3: ("AddExpr", "AddOperation"),
+    4: ("MultExpr", "MultOperation"),
+}
+
+LITERAL_NODES = {
+    TokenType.INTEGER_LITERAL: "IntegerLiteral",
+    TokenType.FLOAT_LITERAL: "FloatLiteral",
+    TokenType.CHAR_LITERAL: "CharLiteral",
+    TokenType.STRING_LITERAL: "StringLiteral",
+}
+
+SCAN_TYPES = {
+    TokenType.SCAN_INT: "INT",
+    TokenType.SCAN_FLOAT: "FLOAT",
+    TokenType.SCAN_CHAR: "CHAR",
+}
+
+class Operation(NamedTuple):
+    """Operación binaria pendiente: sus nodos se crean al completarse la expresión"""
+    operator: Token
+    left: Any
+    right: Any
+
+class CSTBuilder(NullBuilder):
+    """
+    Construye el árbol de parseo (ParseTree) con los mismos nodos que
+    generaba el parser con árbol: un nodo por regla gramatical, incluidos
+    los niveles LogicExpr, CompExpr, AddExpr, MultExpr y Factor de cada
+    expresión. El árbol se arma de abajo hacia arriba; program retorna el
+    ParseTree completo.
+    """
+    def __init__(self):
+        self.tree = ParseTree()
+
+    def node(self, name: str, *children: Node, value: Optional[str] = None) -> Node:
+        return self.tree.build_node(name, children, value)
+
+    def statement(self, statement: Node) -> Node:
+        return self.node("Statement", statement)
+
+    # Nivel superior
+
+    def program(self, globals: list, functions: list) -> ParseTree:
+        root = self.node("Program", *globals, self.node("FunctionList", *functions))
+        self.tree.root = self.tree.current_node = root
+        return self.tree
+
+    def global_decl(self, type_token: Token, name: Token, initializer) -> Node:
+        children = [
+            self.node("Type", value=type_token.value),
+            self.node("Type", value=type_token.value),
+            self.node("Identifier", value=name.value),
+        ]
+        if initializer is not None:
+            children.append(self.node("Assignment", self.expression(initializer)))
+        children.append(self.node("Semicolon", value=";"))
+        return self.node("GlobalDeclaration", *children)
+
+    def function(self, type_token: Token, name: Token, parameters: list, body: Node) -> Node:
+        function = self.node(
+            "Function",
+            self.node("Type", value=type_token.value),
+            self.node("FunctionName", value=name.value),
+            self.node("Parameters", self.node("ParameterList", *self.separated(parameters))),
+            self.node("Body", body),
+        )
+        if name.value == "main":
+            return self.node("Function", self.node("MainFunction"), function)
+        return self.node("Function", function)
+
+    def param(self, type_token: Token, name: Token) -> Node:
+        return self.node(
+            "Parameter",
+            self.node("Type", value=type_token.value),
+            self.node("Identifier", value=name.value),
+        )
+
+    def separated(self, items: list) -> list:
+        """Intercala un nodo Comma entre los elementos de una lista"""
+        children = []
+        for item in items:
+            if children:
+                children.append(self.node("Comma", value=","))
+            children.append(item)
+        return children
+
+    # Sentencias
+
+    def var_decl(self, type_token: Token, name: Token, initializer) -> Node:
+        children = [
+            self.node("Type", value=type_token.value),
+            self.node("Identifier", value=name.value),
+        ]
+        if initializer is not None:
+            children.append(self.node("Initialization", self.expression(initializer)))
+        children.append(self.node("Semicolon", value=";"))
+        return self.node("Declaration", *children)
+
+    def assignment(self, name: Token, value) -> Node:
+        return self.node(
+            "Assignment",
+            self.node("Identifier", value=name.value),
+            self.node("Operator", value="="),
+            self.node("Expression", self.expression(value)),
+            self.node("Semicolon", value=";"),
+        )
+
+    def call_stmt(self, name: Token, arguments: list) -> Node:
+        return self.node(
+            "FunctionCall",
+            self.node("Identifier", value=name.value),
+            self.node("ArgumentList", self.argument_list(arguments)),
+        )
+
+    def if_stmt(self, token: Token, condition, then_branch: Node, else_branch) -> Node:
+        children = [
+            self.node("If", value=token.value),
+            self.node("Condition", self.expression(condition)),
+            self.node("Then", self.statement(then_branch)),
+        ]
+        if else_branch is not None:
+            children.append(self.node("Else", self.statement(else_branch)))
+        return self.node("IfStatement", *children)
+
+    def while_stmt(self, token: Token, condition, body: Node) -> Node:
+        return self.node(
+            "WhileStatement",
+            self.node("While", value=token.value),
+            self.node("Condition", self.expression(condition)),
+            self.node("Body", self.statement(body)),
+        )
+
+    def do_while(self, token: Token, body: Node, condition) -> Node:
+        return self.node(
+            "DoWhileStatement",
+            self.node("Do", value=token.value),
+            self.node("Body", self.statement(body)),
+            self.node("Condition", self.expression(condition)),
+            self.node("Semicolon", value=";"),
+        )
+
+    def return_stmt(self, token: Token, value) -> Node:
+        children = [self.node("Return", value=token.value)]
+        if value is not None:
+            children.append(self.node("ReturnValue", self.expression(value)))
+        children.append(self.node("Semicolon", value=";"))
+        return self.node("ReturnStatement", *children)
+
+    def io_stmt(self, token: Token, argument) -> Node:
+        children = [self.node("IOFunction", value=token.value)]
+        if argument is not None:
+            children.append(self.node("Value", self.expression(argument)))
+        children.append(self.node("Semicolon", value=";"))
+        return self.node("IOStatement", *children)
+
+    def block(self, statements: list) -> Node:
+        return self.node(
+            "CompoundStatement",
+            self.node("LeftBrace", value="{"),
+            *(self.node("Statement", self.statement(statement)) for statement in statements),
+            self.node("RightBrace", value="}"),
+        )
+
+    def empty_stmt(self, token: Token) -> Node:
+        return self.node("EmptyStatement", value=token.value)
+
+    def error_stmt(self, token: Token, name: Optional[Token]) -> Node:
+        return self.node("SyntaxError", value=token.value)
+
+    # Expresiones
+
+    def expression(self, expr) -> Node:
+        """
+        Nodo Expression de una expresión completa. Las operaciones pendientes
+        se reparten en los niveles de precedencia como lo haría el descenso
+        recursivo.
+        """
+        if type(expr) is Node and expr.name == "ScanOperation":
+            return self.node("Expression", expr)
+        return self.node("Expression", self.level(1, expr))
+
+    def level(self, precedence: int, expr) -> Node:
+        """
+        Nivel de expresión: el primer operando y una cadena de operaciones
+        anidadas, cada una con su operador y su operando derecho.
+        """
+        if precedence not in EXPRESSION_LEVELS:
+            return expr  # Nodo Factor
+        level_name, operation_name = EXPRESSION_LEVELS[precedence]
+
+        # Las operaciones de este nivel forman la rama izquierda (asociatividad izquierda)
+        operations = []
+        while type(expr) is Operation and BINARY_PRECEDENCE[expr.operator.type] == precedence:
+            operations.append(expr)
+            expr = expr.left
+
+        # La última operación queda anidada más adentro: se construye primero
+        nested = ()
+        for operation in operations:
+            nested = (self.node(
+                operation_name,
+                self.node("Operator", value=operation.operator.value),
+                self.level(precedence + 1, operation.right),
+                *nested,
+            ),)
+        return self.node(level_name, self.level(precedence + 1, expr), *nested)
+
+    def argument_list(self, arguments: list) -> Node:
+        return self.node("ArgumentList", *self.separated(
+            [self.node("Argument", self.expression(argument)) for argument in arguments]))
+
+    def scan_call(self, token: Token) -> Node:
+        return self.node(
+            "ScanOperation",
+            self.node("ScanFunction", value=token.value),
+            self.node("ReturnType", value=SCAN_TYPES[token.type]),
+        )
+
+    def binary(self, operator: Token, left, right) -> Operation:
+        return Operation(operator, left, right)
+
+    def group(self, expr) -> Node:
+        return self.node(
+            "Factor",
+            self.node("LeftParen", value="("),
+            self.expression(expr),
+            self.node("RightParen", value=")"),
+        )
+
+    def literal(self, token: Token) -> Node:
+        return self.node("Factor", self.node(LITERAL_NODES[token.type], value=token.value))
+
+    def variable(self, name: Token) -> Node:
+        return self.node("Factor", self.node("Identifier", value=name.value))
+
+    def call(self, name: Token, arguments: list) -> Node:
+        return self.node(
+            "Factor",
+            self.node("Identifier", value=name.value),
+            self.node("FunctionCall", self.node("Arguments", self.argument_list(arguments))),
+        )
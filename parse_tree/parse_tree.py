@@ -1,6 +1,6 @@
 # parse_tree/parse_tree.py
 from anytree import Node, RenderTree
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterable, List, Any
 from lexer.token import Token
 from lexer.token_type import TokenType
 
@@ -30,6 +30,20 @@ class ParseTree :
         self.nodes[id(node)] = node
         return node
 
+    def build_node(self, name: str, children: Iterable[Node] = (), value: Optional[str] = None) -> Node:
+        """
+        Crea un nodo con sus hijos ya construidos, para armar el árbol de
+        abajo hacia arriba (CSTBuilder).
+        Args:
+            name: Nombre del nodo
+            children: Hijos del nodo, en orden
+            value: Lexema que se muestra junto al nombre (opcional)
+        """
+        node_name = f"{name} [{value}]" if value is not None else name
+        node = Node(node_name, children=children)
+        self.nodes[id(node)] = node
+        return node
+
     def set_root(self, name: str) -> None:
         """Establece el nodo raíz del árbol"""
         self.root = self.create_node(name)
@@ -0,0 +1,137 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+from lexer.token import Token
+from semantic.types import DataType
+
+# Árbol de sintaxis abstracta que construye Parser.
+# Los nodos guardan los tokens relevantes (nombre, operador, palabra clave)
+# para conservar la posición y el ID internado de los identificadores.
+# data_type de las expresiones lo completa el análisis semántico.
+# Todos los nodos usan __slots__ (sin __dict__ por instancia): los programas
+# grandes generan millones de nodos.
+
+# Expresiones
+
+@dataclass(slots=True)
+class Literal:
+    """Literal entero, flotante, de carácter o de cadena"""
+    token: Token
+    data_type: Optional[DataType] = None
+
+@dataclass(slots=True)
+class VariableRef:
+    """Uso de una variable"""
+    name: Token
+    data_type: Optional[DataType] = None
+
+@dataclass(slots=True)
+class Call:
+    """Llamada a función"""
+    name: Token
+    arguments: List['Expr'] = field(default_factory=list)
+    data_type: Optional[DataType] = None
+
+@dataclass(slots=True)
+class ScanCall:
+    """scanInt(), scanFloat() o scanChar() usada como expresión"""
+    token: Token
+    data_type: Optional[DataType] = None
+
+@dataclass(slots=True)
+class BinaryOp:
+    """Operación binaria (aritmética, de comparación o lógica)"""
+    operator: Token
+    left: 'Expr'
+    right: 'Expr'
+    data_type: Optional[DataType] = None
+
+Expr = Union[Literal, VariableRef, Call, ScanCall, BinaryOp]
+
+# Sentencias
+
+@dataclass(slots=True)
+class VarDecl:
+    """Declaración de variable (global o local) con inicialización opcional"""
+    data_type: DataType
+    name: Token
+    initializer: Optional[Expr] = None
+
+@dataclass(slots=True)
+class Assignment:
+    name: Token
+    value: Expr
+
+@dataclass(slots=True)
+class CallStmt:
+    """Llamada a función usada como sentencia"""
+    call: Call
+
+@dataclass(slots=True)
+class If:
+    token: Token
+    condition: Expr
+    then_branch: 'Stmt'
+    else_branch: Optional['Stmt'] = None
+
+@dataclass(slots=True)
+class While:
+    token: Token
+    condition: Expr
+    body: 'Stmt'
+
+@dataclass(slots=True)
+class DoWhile:
+    token: Token
+    body: 'Stmt'
+    condition: Expr
+
+@dataclass(slots=True)
+class Return:
+    token: Token
+    value: Optional[Expr] = None
+
+@dataclass(slots=True)
+class IOStmt:
+    """Sentencia de E/S: las de impresión llevan argumento, las de lectura no"""
+    token: Token
+    argument: Optional[Expr] = None
+
+@dataclass(slots=True)
+class Block:
+    statements: List['Stmt'] = field(default_factory=list)
+
+@dataclass(slots=True)
+class EmptyStmt:
+    token: Token
+
+@dataclass(slots=True)
+class ErrorStmt:
+    """
+    Sentencia descartada por un error sintáctico (modo de recuperación).
+    Si era una declaración, declaration conserva el tipo y el nombre para
+    que el análisis semántico no reporte después la variable como no declarada.
+    """
+    token: Token
+    declaration: Optional[VarDecl] = None
+
+Stmt = Union[VarDecl, Assignment, CallStmt, If, While, DoWhile, Return, IOStmt, Block,
+             EmptyStmt, ErrorStmt]
+
+# Nivel superior
+
+@dataclass(slots=True)
+class Param:
+    data_type: DataType
+    name: Token
+
+@dataclass(slots=True)
+class FunctionDecl:
+    return_type: DataType
+    name: Token
+    parameters: List[Param]
+    body: Block
+
+@dataclass(slots=True)
+class Program:
+    globals: List[VarDecl] = field(default_factory=list)
+    functions: List[FunctionDecl] = field(default_factory=list)
@@ -0,0 +1,171 @@
+from typing import List, Optional
+from lexer.token import Token
+from lexer.token_type import TokenType
+from semantic.types import DataType
+from .ast_nodes import (
+    Assignment, BinaryOp, Block, Call, CallStmt, DoWhile, EmptyStmt, ErrorStmt,
+    FunctionDecl, If, IOStmt, Literal, Param, Program, Return, ScanCall,
+    VarDecl, VariableRef, While,
+)
+
+DATA_TYPES = {
+    TokenType.INT: DataType.INT,
+    TokenType.FLOAT: DataType.FLOAT,
+    TokenType.CHAR: DataType.CHAR,
+    TokenType.VOID: DataType.VOID,
+}
+
+class NullBuilder:
+    """
+    Interfaz de eventos de Parser. Cada construcción reconocida llama a un
+    evento con los tokens relevantes y los valores que el builder retornó
+    para sus partes; lo que retorna el evento es el valor de la construcción.
+    NullBuilder no construye nada: el parser solo valida la sintaxis.
+    """
+
+    # Nivel superior
+
+    def program(self, globals: list, functions: list):
+        return None
+
+    def global_decl(self, type_token: Token, name: Token, initializer):
+        return None
+
+    def function(self, type_token: Token, name: Token, parameters: list, body):
+        return None
+
+    def param(self, type_token: Token, name: Token):
+        return None
+
+    # Sentencias
+
+    def var_decl(self, type_token: Token, name: Token, initializer):
+        return None
+
+    def assignment(self, name: Token, value):
+        return None
+
+    def call_stmt(self, name: Token, arguments: list):
+        return None
+
+    def if_stmt(self, token: Token, condition, then_branch, else_branch):
+        return None
+
+    def while_stmt(self, token: Token, condition, body):
+        return None
+
+    def do_while(self, token: Token, body, condition):
+        return None
+
+    def return_stmt(self, token: Token, value):
+        return None
+
+    def io_stmt(self, token: Token, argument):
+        return None
+
+    def block(self, statements: list):
+        return None
+
+    def empty_stmt(self, token: Token):
+        return None
+
+    def error_stmt(self, token: Token, name: Optional[Token]):
+        """Sentencia descartada en modo de recuperación; name si era una declaración"""
+        return None
+
+    # Expresiones
+
+    def scan_call(self, token: Token):
+        return None
+
+    def binary(self, operator: Token, left, right):
+        return None
+
+    def group(self, expr):
+        """Expresión entre paréntesis"""
+        return None
+
+    def literal(self, token: Token):
+        return None
+
+    def variable(self, name: Token):
+        return None
+
+    def call(self, name: Token, arguments: list):
+        return None
+
+class ASTBuilder(NullBuilder):
+    """
+    Construye el AST de parser/ast_nodes.py. Los eventos cuyos argumentos
+    coinciden con los campos del nodo son directamente su constructor.
+    """
+    program = Program
+    assignment = Assignment
+    if_stmt = If
+    while_stmt = While
+    do_while = DoWhile
+    return_stmt = Return
+    io_stmt = IOStmt
+    block = Block
+    empty_stmt = EmptyStmt
+    scan_call = ScanCall
+    binary = BinaryOp
+    literal = Literal
+    variable = VariableRef
+    call = Call
+
+    def global_decl(self, type_token: Token, name: Token, initializer) -> VarDecl:
+        return VarDecl(DATA_TYPES[type_token.type], name, initializer)
+
+    def function(self, type_token: Token, name: Token, parameters: List[Param],
+                 body: Block) -> FunctionDecl:
+        return FunctionDecl(DATA_TYPES[type_token.type], name, parameters, body)
+
+    def param(self, type_token: Token, name: Token) -> Param:
+        return Param(DATA_TYPES[type_token.type], name)
+
+    def var_decl(self, type_token: Token, name: Token, initializer) -> VarDecl:
+        return VarDecl(DATA_TYPES[type_token.type], name, initializer)
+
+    def call_stmt(self, name: Token, arguments: list) -> CallStmt:
+        return CallStmt(Call(name, arguments))
+
+    def error_stmt(self, token: Token, name: Optional[Token]) -> ErrorStmt:
+        declaration = None
+        if name is not None:
+            declaration = VarDecl(DATA_TYPES[token.type], name)
+        return ErrorStmt(token, declaration)
+
+    def group(self, expr):
+        # Los paréntesis solo agrupan: el AST no los conserva
+        return expr
+
+class Pair(tuple):
+    """Valor de TeeBuilder: (valor del primer builder, valor del segundo)"""
+
+class TeeBuilder:
+    """
+    Envía cada evento a dos builders, para obtener por ejemplo el AST y el
+    árbol de parseo en un solo análisis. Sus valores son pares (Pair).
+    """
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+
+    def __getattr__(self, name: str):
+        first = getattr(self.first, name)
+        second = getattr(self.second, name)
+
+        def event(*args):
+            return Pair((first(*[_side(arg, 0) for arg in args]),
+                         second(*[_side(arg, 1) for arg in args])))
+        setattr(self, name, event)
+        return event
+
+def _side(value, index: int):
+    """Parte de un valor de TeeBuilder que corresponde a un builder"""
+    if type(value) is Pair:
+        return value[index]
+    if type(value) is list:
+        return [_side(item, index) for item in value]
+    return value
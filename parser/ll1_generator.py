@@ -0,0 +1,186 @@
+"""
+Generador de la tabla predictiva LL(1).
+
+Lee la gramática de parser/grammar.ll1, calcula los conjuntos FIRST y
+FOLLOW y emite parser/ll1_table.py, que usa TableParser.
+
+Uso: python -m parser.ll1_generator [gramática] [salida]
+"""
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+from lexer.token_type import TokenType
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(__file__), 'grammar.ll1')
+TABLE_PATH = os.path.join(os.path.dirname(__file__), 'll1_table.py')
+
+EPSILON = 'ε'
+ACTION_PREFIX = '@'
+
+@dataclass
+class Grammar:
+    """Producciones en orden de aparición; la primera define el símbolo inicial"""
+    productions: List[Tuple[str, Tuple[str, ...]]] = field(default_factory=list)
+
+    @property
+    def start(self) -> str:
+        return self.productions[0][0]
+
+    @property
+    def nonterminals(self) -> List[str]:
+        return list(dict.fromkeys(head for head, _ in self.productions))
+
+def is_action(symbol: str) -> bool:
+    return symbol.startswith(ACTION_PREFIX)
+
+def read_grammar(path: str = GRAMMAR_PATH) -> Grammar:
+    with open(path, 'r', encoding='utf-8') as file:
+        return parse_grammar(file.read())
+
+def parse_grammar(text: str) -> Grammar:
+    """Lee producciones de la forma 'A -> x y | z', con continuaciones '| ...'"""
+    grammar = Grammar()
+    head = None
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if '->' in line:
+            head, body = (part.strip() for part in line.split('->', 1))
+            if not head.isidentifier():
+                raise ValueError(f"Línea {line_number}: no terminal inválido '{head}'")
+        elif line.startswith('|') and head is not None:
+            body = line[1:]
+        else:
+            raise ValueError(f"Línea {line_number}: se esperaba 'A -> ...' o '| ...'")
+        for alternative in body.split('|'):
+            symbols = tuple(symbol for symbol in alternative.split() if symbol != EPSILON)
+            grammar.productions.append((head, symbols))
+
+    if not grammar.productions:
+        raise ValueError("La gramática no tiene producciones")
+    _validate(grammar)
+    return grammar
+
+def _validate(grammar: Grammar) -> None:
+    """Todo símbolo debe ser un no terminal definido, un TokenType o una acción"""
+    nonterminals = set(grammar.nonterminals)
+    for head, body in grammar.productions:
+        for symbol in body:
+            if symbol not in nonterminals and not is_action(symbol) \
+                    and symbol not in TokenType.__members__:
+                raise ValueError(f"Símbolo desconocido '{symbol}' en la producción de {head}")
+
+def first_sets(grammar: Grammar) -> Tuple[Dict[str, Set[str]], Set[str]]:
+    """FIRST de cada no terminal y el conjunto de no terminales anulables"""
+    first: Dict[str, Set[str]] = {name: set() for name in grammar.nonterminals}
+    nullable: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for head, body in grammar.productions:
+            body_first, body_nullable = sequence_first(body, first, nullable)
+            if not body_first <= first[head]:
+                first[head] |= body_first
+                changed = True
+            if body_nullable and head not in nullable:
+                nullable.add(head)
+                changed = True
+    return first, nullable
+
+def sequence_first(symbols, first: Dict[str, Set[str]], nullable: Set[str]) -> Tuple[Set[str], bool]:
+    """FIRST de una secuencia de símbolos y si puede derivar ε (las acciones se ignoran)"""
+    result: Set[str] = set()
+    for symbol in symbols:
+        if is_action(symbol):
+            continue
+        if symbol not in first:
+            result.add(symbol)
+            return result, False
+        result |= first[symbol]
+        if symbol not in nullable:
+            return result, False
+    return result, True
+
+def follow_sets(grammar: Grammar, first: Dict[str, Set[str]], nullable: Set[str]) -> Dict[str, Set[str]]:
+    """FOLLOW de cada no terminal; el símbolo inicial puede ir seguido de EOF"""
+    follow: Dict[str, Set[str]] = {name: set() for name in grammar.nonterminals}
+    follow[grammar.start].add(TokenType.EOF.name)
+    changed = True
+    while changed:
+        changed = False
+        for head, body in grammar.productions:
+            for index, symbol in enumerate(body):
+                if symbol not in follow:
+                    continue
+                rest_first, rest_nullable = sequence_first(body[index + 1:], first, nullable)
+                update = rest_first | follow[head] if rest_nullable else rest_first
+                if not update <= follow[symbol]:
+                    follow[symbol] |= update
+                    changed = True
+    return follow
+
+def build_table(grammar: Grammar) -> Tuple[Dict[str, Dict[str, int]], List[Tuple[str, str, int, int]]]:
+    """
+    Tabla predictiva: no terminal -> {terminal: índice de la producción}.
+    Ante un conflicto se conserva la producción que aparece primero en la
+    gramática; los conflictos se retornan como (no terminal, terminal,
+    producción elegida, producción descartada).
+    """
+    first, nullable = first_sets(grammar)
+    follow = follow_sets(grammar, first, nullable)
+    table: Dict[str, Dict[str, int]] = {name: {} for name in grammar.nonterminals}
+    conflicts = []
+    for index, (head, body) in enumerate(grammar.productions):
+        lookaheads, body_nullable = sequence_first(body, first, nullable)
+        if body_nullable:
+            lookaheads = lookaheads | follow[head]
+        for terminal in sorted(lookaheads, key=lambda name: TokenType[name].value):
+            chosen = table[head].setdefault(terminal, index)
+            if chosen != index:
+                conflicts.append((head, terminal, chosen, index))
+    return table, conflicts
+
+def emit(grammar: Grammar, table: Dict[str, Dict[str, int]], conflicts, source: str) -> str:
+    """Código fuente del módulo con la tabla"""
+    lines = [
+        f"# Generado por parser/ll1_generator.py a partir de {source}. No editar a mano.",
+        "",
+        f"START = {grammar.start!r}",
+        "",
+        "# (no terminal, símbolos del lado derecho)",
+        "PRODUCTIONS = [",
+    ]
+    for index, production in enumerate(grammar.productions):
+        lines.append(f"    {production!r},  # {index}")
+    lines += ["]", "", "# no terminal -> {terminal: índice en PRODUCTIONS}", "TABLE = {"]
+    for head, row in table.items():
+        lines.append(f"    {head!r}: {row!r},")
+    lines += [
+        "}",
+        "",
+        "# Conflictos resueltos con la primera producción: (no terminal,",
+        "# terminal, producción elegida, producción descartada)",
+        f"CONFLICTS = {conflicts!r}",
+    ]
+    return "\n".join(lines) + "\n"
+
+def main():
+    grammar_path = sys.argv[1] if len(sys.argv) > 1 else GRAMMAR_PATH
+    table_path = sys.argv[2] if len(sys.argv) > 2 else TABLE_PATH
+    grammar = read_grammar(grammar_path)
+    table, conflicts = build_table(grammar)
+
+    source = os.path.relpath(grammar_path).replace(os.sep, '/')
+    with open(table_path, 'w', encoding='utf-8') as file:
+        file.write(emit(grammar, table, conflicts, source))
+
+    print(f"{len(grammar.nonterminals)} no terminales, {len(grammar.productions)} producciones")
+    for head, terminal, chosen, discarded in conflicts:
+        print(f"Conflicto en {head} con {terminal}: se usa la producción {chosen}, "
+              f"se descarta la {discarded}")
+    print(f"Tabla escrita en {table_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Generado por parser/ll1_generator.py a partir de parser/grammar.ll1. No editar a mano.
+
+START = 'Start'
+
+# (no terminal, símbolos del lado derecho)
+PRODUCTIONS = [
+    ('Start', ('@begin_program', 'Program', 'EOF', '@end_program')),  # 0
+    ('Program', ('Type', 'ID', 'GlobalOrFunction')),  # 1
+    ('Program', ()),  # 2
+    ('GlobalOrFunction', ('VarInit', 'SEMICOLON', '@global_decl', 'Program')),  # 3
+    ('GlobalOrFunction', ('LPAREN', 'ParameterList', 'RPAREN', 'CompoundStmt', '@function', 'FunctionList')),  # 4
+    ('FunctionList', ('Type', 'ID', 'LPAREN', 'ParameterList', 'RPAREN', 'CompoundStmt', '@function', 'FunctionList')),  # 5
+    ('FunctionList', ()),  # 6
+    ('ParameterList', ('@begin_list', 'Parameters')),  # 7
+    ('Parameters', ('Parameter', '@append', 'ParameterListTail')),  # 8
+    ('Parameters', ()),  # 9
+    ('ParameterListTail', ('COMMA', '@drop', 'Parameter', '@append', 'ParameterListTail')),  # 10
+    ('ParameterListTail', ()),  # 11
+    ('Parameter', ('Type', 'ID', '@param')),  # 12
+    ('Type', ('INT',)),  # 13
+    ('Type', ('CHAR',)),  # 14
+    ('Type', ('FLOAT',)),  # 15
+    ('Type', ('VOID',)),  # 16
+    ('VarInit', ('ASSIGN', 'Expression', '@initializer')),  # 17
+    ('VarInit', ('@none',)),  # 18
+    ('CompoundStmt', ('LBRACE', '@begin_list', 'StatementList', 'RBRACE', '@block')),  # 19
+    ('StatementList', ('Statement', '@append', 'StatementList')),  # 20
+    ('StatementList', ()),  # 21
+    ('Statement', ('Type', 'ID', 'VarInit', 'SEMICOLON', '@declaration_stmt')),  # 22
+    ('Statement', ('ID', 'IdStatement')),  # 23
+    ('Statement', ('IF', 'LPAREN', 'Expression', 'RPAREN', 'Statement', 'ElsePart', '@if_stmt')),  # 24
+    ('Statement', ('WHILE', 'LPAREN', 'Expression', 'RPAREN', 'Statement', '@while_stmt')),  # 25
+    ('Statement', ('DO', 'Statement', 'WHILE', 'LPAREN', 'Expression', 'RPAREN', 'SEMICOLON', '@do_while_stmt')),  # 26
+    ('Statement', ('RETURN', 'ReturnValue', 'SEMICOLON', '@return_stmt')),  # 27
+    ('Statement', ('PrintFunction', 'LPAREN', 'Expression', 'RPAREN', 'SEMICOLON', '@print_stmt')),  # 28
+    ('Statement', ('ScanFunction', 'LPAREN', 'RPAREN', 'SEMICOLON', '@scan_stmt')),  # 29
+    ('Statement', ('CompoundStmt',)),  # 30
+    ('Statement', ('SEMICOLON', '@empty_stmt')),  # 31
+    ('IdStatement', ('LPAREN', 'ArgumentList', 'RPAREN', 'SEMICOLON', '@call_stmt')),  # 32
+    ('IdStatement', ('ASSIGN', 'Expression', 'SEMICOLON', '@assignment_stmt')),  # 33
+    ('ElsePart', ('ELSE', 'Statement', '@else_branch')),  # 34
+    ('ElsePart', ('@none',)),  # 35
+    ('ReturnValue', ('Expression',)),  # 36
+    ('ReturnValue', ('@none',)),  # 37
+    ('PrintFunction', ('PRINT_INT',)),  # 38
+    ('PrintFunction', ('PRINT_FLOAT',)),  # 39
+    ('PrintFunction', ('PRINT_CHAR',)),  # 40
+    ('PrintFunction', ('PRINT_STR',)),  # 41
+    ('ScanFunction', ('SCAN_INT',)),  # 42
+    ('ScanFunction', ('SCAN_FLOAT',)),  # 43
+    ('ScanFunction', ('SCAN_CHAR',)),  # 44
+    ('Expression', ('ScanFunction', 'LPAREN', 'RPAREN', '@scan_call')),  # 45
+    ('Expression', ('LogicExpr',)),  # 46
+    ('LogicExpr', ('CompExpr', 'LogicExprTail')),  # 47
+    ('LogicExprTail', ('LogicOperator', 'CompExpr', '@binary', 'LogicExprTail')),  # 48
+    ('LogicExprTail', ()),  # 49
+    ('CompExpr', ('AddExpr', 'CompExprTail')),  # 50
+    ('CompExprTail', ('CompOperator', 'AddExpr', '@binary', 'CompExprTail')),  # 51
+    ('CompExprTail', ()),  # 52
+    ('AddExpr', ('MultExpr', 'AddExprTail')),  # 53
+    ('AddExprTail', ('AddOperator', 'MultExpr', '@binary', 'AddExprTail')),  # 54
+    ('AddExprTail', ()),  # 55
+    ('MultExpr', ('Factor', 'MultExprTail')),  # 56
+    ('MultExprTail', ('MultOperator', 'Factor', '@binary', 'MultExprTail')),  # 57
+    ('MultExprTail', ()),  # 58
+    ('LogicOperator', ('AND',)),  # 59
+    ('LogicOperator', ('OR',)),  # 60
+    ('CompOperator', ('EQUALS',)),  # 61
+    ('CompOperator', ('NOT_EQUALS',)),  # 62
+    ('CompOperator', ('LESS',)),  # 63
+    ('CompOperator', ('LESS_EQUAL',)),  # 64
+    ('CompOperator', ('GREATER',)),  # 65
+    ('CompOperator', ('GREATER_EQUAL',)),  # 66
+    ('AddOperator', ('PLUS',)),  # 67
+    ('AddOperator', ('MINUS',)),  # 68
+    ('MultOperator', ('TIMES',)),  # 69
+    ('MultOperator', ('DIVIDE',)),  # 70
+    ('Factor', ('LPAREN', 'Expression', 'RPAREN', '@group')),  # 71
+    ('Factor', ('ID', 'FactorTail')),  # 72
+    ('Factor', ('INTEGER_LITERAL', '@literal')),  # 73
+    ('Factor', ('FLOAT_LITERAL', '@literal')),  # 74
+    ('Factor', ('CHAR_LITERAL', '@literal')),  # 75
+    ('Factor', ('STRING_LITERAL', '@literal')),  # 76
+    ('FactorTail', ('LPAREN', 'ArgumentList', 'RPAREN', '@call')),  # 77
+    ('FactorTail', ('@variable',)),  # 78
+    ('ArgumentList', ('@begin_list', 'Arguments')),  # 79
+    ('Arguments', ('Expression', '@append', 'ArgumentListTail')),  # 80
+    ('Arguments', ()),  # 81
+    ('ArgumentListTail', ('COMMA', '@drop', 'Expression', '@append', 'ArgumentListTail')),  # 82
+    ('ArgumentListTail', ()),  # 83
+]
+
+# no terminal -> {terminal: índice en PRODUCTIONS}
+TABLE = {
+    'Start': {'INT': 0, 'CHAR': 0, 'FLOAT': 0, 'VOID': 0, 'EOF': 0},
+    'Program': {'INT': 1, 'CHAR': 1, 'FLOAT': 1, 'VOID': 1, 'EOF': 2},
+    'GlobalOrFunction': {'ASSIGN': 3, 'SEMICOLON': 3, 'LPAREN': 4},
+    'FunctionList': {'INT': 5, 'CHAR': 5, 'FLOAT': 5, 'VOID': 5, 'EOF': 6},
+    'ParameterList': {'INT': 7, 'CHAR': 7, 'FLOAT': 7, 'VOID': 7, 'RPAREN': 7},
+    'Parameters': {'INT': 8, 'CHAR': 8, 'FLOAT': 8, 'VOID': 8, 'RPAREN': 9},
+    'ParameterListTail': {'COMMA': 10, 'RPAREN': 11},
+    'Parameter': {'INT': 12, 'CHAR': 12, 'FLOAT': 12, 'VOID': 12},
+    'Type': {'INT': 13, 'CHAR': 14, 'FLOAT': 15, 'VOID': 16},
+    'VarInit': {'ASSIGN': 17, 'SEMICOLON': 18},
+    'CompoundStmt': {'LBRACE': 19},
+    'StatementList': {'INT': 20, 'CHAR': 20, 'FLOAT': 20, 'VOID': 20, 'IF': 20, 'WHILE': 20, 'DO': 20, 'RETURN': 20, 'PRINT_INT': 20, 'PRINT_FLOAT': 20, 'PRINT_CHAR': 20, 'PRINT_STR': 20, 'SCAN_INT': 20, 'SCAN_FLOAT': 20, 'SCAN_CHAR': 20, 'SEMICOLON': 20, 'LBRACE': 20, 'ID': 20, 'RBRACE': 21},
+    'Statement': {'INT': 22, 'CHAR': 22, 'FLOAT': 22, 'VOID': 22, 'ID': 23, 'IF': 24, 'WHILE': 25, 'DO': 26, 'RETURN': 27, 'PRINT_INT': 28, 'PRINT_FLOAT': 28, 'PRINT_CHAR': 28, 'PRINT_STR': 28, 'SCAN_INT': 29, 'SCAN_FLOAT': 29, 'SCAN_CHAR': 29, 'LBRACE': 30, 'SEMICOLON': 31},
+    'IdStatement': {'LPAREN': 32, 'ASSIGN': 33},
+    'ElsePart': {'ELSE': 34, 'INT': 35, 'CHAR': 35, 'FLOAT': 35, 'VOID': 35, 'IF': 35, 'WHILE': 35, 'DO': 35, 'RETURN': 35, 'PRINT_INT': 35, 'PRINT_FLOAT': 35, 'PRINT_CHAR': 35, 'PRINT_STR': 35, 'SCAN_INT': 35, 'SCAN_FLOAT': 35, 'SCAN_CHAR': 35, 'SEMICOLON': 35, 'LBRACE': 35, 'RBRACE': 35, 'ID': 35},
+    'ReturnValue': {'SCAN_INT': 36, 'SCAN_FLOAT': 36, 'SCAN_CHAR': 36, 'LPAREN': 36, 'ID': 36, 'INTEGER_LITERAL': 36, 'FLOAT_LITERAL': 36, 'CHAR_LITERAL': 36, 'STRING_LITERAL': 36, 'SEMICOLON': 37},
+    'PrintFunction': {'PRINT_INT': 38, 'PRINT_FLOAT': 39, 'PRINT_CHAR': 40, 'PRINT_STR': 41},
+    'ScanFunction': {'SCAN_INT': 42, 'SCAN_FLOAT': 43, 'SCAN_CHAR': 44},
+    'Expression': {'SCAN_INT': 45, 'SCAN_FLOAT': 45, 'SCAN_CHAR': 45, 'LPAREN': 46, 'ID': 46, 'INTEGER_LITERAL': 46, 'FLOAT_LITERAL': 46, 'CHAR_LITERAL': 46, 'STRING_LITERAL': 46},
+    'LogicExpr': {'LPAREN': 47, 'ID': 47, 'INTEGER_LITERAL': 47, 'FLOAT_LITERAL': 47, 'CHAR_LITERAL': 47, 'STRING_LITERAL': 47},
+    'LogicExprTail': {'AND': 48, 'OR': 48, 'SEMICOLON': 49, 'COMMA': 49, 'RPAREN': 49},
+    'CompExpr': {'LPAREN': 50, 'ID': 50, 'INTEGER_LITERAL': 50, 'FLOAT_LITERAL': 50, 'CHAR_LITERAL': 50, 'STRING_LITERAL': 50},
+    'CompExprTail': {'EQUALS': 51, 'NOT_EQUALS': 51, 'LESS': 51, 'LESS_EQUAL': 51, 'GREATER': 51, 'GREATER_EQUAL': 51, 'AND': 52, 'OR': 52, 'SEMICOLON': 52, 'COMMA': 52, 'RPAREN': 52},
+    'AddExpr': {'LPAREN': 53, 'ID': 53, 'INTEGER_LITERAL': 53, 'FLOAT_LITERAL': 53, 'CHAR_LITERAL': 53, 'STRING_LITERAL': 53},
+    'AddExprTail': {'PLUS': 54, 'MINUS': 54, 'AND': 55, 'OR': 55, 'EQUALS': 55, 'NOT_EQUALS': 55, 'LESS': 55, 'LESS_EQUAL': 55, 'GREATER': 55, 'GREATER_EQUAL': 55, 'SEMICOLON': 55, 'COMMA': 55, 'RPAREN': 55},
+    'MultExpr': {'LPAREN': 56, 'ID': 56, 'INTEGER_LITERAL': 56, 'FLOAT_LITERAL': 56, 'CHAR_LITERAL': 56, 'STRING_LITERAL': 56},
+    'MultExprTail': {'TIMES': 57, 'DIVIDE': 57, 'PLUS': 58, 'MINUS': 58, 'AND': 58, 'OR': 58, 'EQUALS': 58, 'NOT_EQUALS': 58, 'LESS': 58, 'LESS_EQUAL': 58, 'GREATER': 58, 'GREATER_EQUAL': 58, 'SEMICOLON': 58, 'COMMA': 58, 'RPAREN': 58},
+    'LogicOperator': {'AND': 59, 'OR': 60},
+    'CompOperator': {'EQUALS': 61, 'NOT_EQUALS': 62, 'LESS': 63, 'LESS_EQUAL': 64, 'GREATER': 65, 'GREATER_EQUAL': 66},
+    'AddOperator': {'PLUS': 67, 'MINUS': 68},
+    'MultOperator': {'TIMES': 69, 'DIVIDE': 70},
+    'Factor': {'LPAREN': 71, 'ID': 72, 'INTEGER_LITERAL': 73, 'FLOAT_LITERAL': 74, 'CHAR_LITERAL': 75, 'STRING_LITERAL': 76},
+    'FactorTail': {'LPAREN': 77, 'PLUS': 78, 'MINUS': 78, 'TIMES': 78, 'DIVIDE': 78, 'AND': 78, 'OR': 78, 'EQUALS': 78, 'NOT_EQUALS': 78, 'LESS': 78, 'LESS_EQUAL': 78, 'GREATER': 78, 'GREATER_EQUAL': 78, 'SEMICOLON': 78, 'COMMA': 78, 'RPAREN': 78},
+    'ArgumentList': {'SCAN_INT': 79, 'SCAN_FLOAT': 79, 'SCAN_CHAR': 79, 'LPAREN': 79, 'RPAREN': 79, 'ID': 79, 'INTEGER_LITERAL': 79, 'FLOAT_LITERAL': 79, 'CHAR_LITERAL': 79, 'STRING_LITERAL': 79},
+    'Arguments': {'SCAN_INT': 80, 'SCAN_FLOAT': 80, 'SCAN_CHAR': 80, 'LPAREN': 80, 'ID': 80, 'INTEGER_LITERAL': 80, 'FLOAT_LITERAL': 80, 'CHAR_LITERAL': 80, 'STRING_LITERAL': 80, 'RPAREN': 81},
+    'ArgumentListTail': {'COMMA': 82, 'RPAREN': 83},
+}
+
+# Conflictos resueltos con la primera producción: (no terminal,
+# terminal, producción elegida, producción descartada)
+CONFLICTS = [('ElsePart', 'ELSE', 34, 35)]
@@ -1,154 +1,229 @@
-from typing import List, Optional, Set
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import List, Optional, Set, Union
 from lexer.token import Token
+from lexer.token_buffer import TokenBuffer
+from lexer.token_stream import TokenStream
 from lexer.token_type import TokenType
-from utils.error_handler import ParserError, SemanticError
-from semantic.analyzer import SemanticAnalyzer
-from semantic.types import DataType, Variable, Function
+from utils.error_handler import ErrorLimitReached, LexicalError, ParserError
+from semantic.types import DataType
+from .ast_nodes import Program
+from .builders import ASTBuilder
+
+LOGIC_OPERATORS = {TokenType.AND, TokenType.OR}
+COMPARISON_OPERATORS = {
+    TokenType.EQUALS, TokenType.NOT_EQUALS,
+    TokenType.LESS, TokenType.LESS_EQUAL,
+    TokenType.GREATER, TokenType.GREATER_EQUAL,
+}
+
+# Precedencia de los operadores binarios (mayor número, mayor precedencia),
+# equivalente a los niveles LogicExpr < CompExpr < AddExpr < MultExpr
+BINARY_PRECEDENCE = {
+    TokenType.AND: 1, TokenType.OR: 1,
+    **{token_type: 2 for token_type in COMPARISON_OPERATORS},
+    TokenType.PLUS: 3, TokenType.MINUS: 3,
+    TokenType.TIMES: 4, TokenType.DIVIDE: 4,
+}
+
+TYPE_TOKENS = {TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.VOID}
+
+class TopLevelKind(Enum):
+    """Clase de un elemento de nivel superior, decidida mirando Type ID ['(']"""
+    GLOBAL = auto()     # Type ID sin '(': declaración de variable global
+    FUNCTION = auto()   # Type ID '('
+    MAIN = auto()       # Type main '('
+
+# Tokens donde se retoma el análisis después de un error: inicio de una
+# declaración o sentencia, o el '}' que cierra el bloque actual
+SYNC_TOKENS = {
+    TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.VOID,
+    TokenType.IF, TokenType.WHILE, TokenType.DO, TokenType.RETURN,
+    TokenType.RBRACE,
+}
+
+# Máximo de diagnósticos por defecto en modo de recuperación
+MAX_ERRORS = 100
+
+@dataclass
+class ParseResult:
+    """Resultado del análisis sintáctico con recuperación de errores"""
+    program: Program  # Valor que construyó el builder
+    errors: List[ParserError]
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    """
+    Análisis sintáctico. Cada construcción reconocida se informa al builder
+    (parser/builders.py), que decide qué se construye: ASTBuilder (por
+    defecto) arma el AST de parser/ast_nodes.py, CSTBuilder el árbol de
+    parseo y NullBuilder nada, para solo validar. No realiza verificaciones
+    semánticas; esas las hace SemanticChecker recorriendo el AST aparte.
+    """
+    def __init__(self, tokens: Union[List[Token], TokenStream, TokenBuffer],
+                 recover: bool = False, max_errors: int = MAX_ERRORS, builder=None):
         self.tokens = tokens
         self.current = 0
         self.has_main_function = False
-        self.semantic_analyzer = SemanticAnalyzer()
+        self.builder = builder if builder is not None else ASTBuilder()
+        
+        # En modo de recuperación, statement() y function() registran el error
+        # en self.errors, sincronizan y continúan; al llegar a max_errors se
+        # detiene el análisis
+        self.recover = recover
+        self.max_errors = max_errors
+        self.errors: List[ParserError] = []
+        # Partes del programa ya reconocidas, para el resultado parcial
+        self.globals: list = []
+        self.functions: list = []
     
-    def function_list(self) -> None:
-        """FunctionList → Function FunctionList | ε"""
+    def function_list(self, kind: Optional[TopLevelKind]) -> list:
+        """
+        FunctionList → Function FunctionList | ε
+        kind es la clasificación del primer elemento, ya calculada por program().
+        """
+        functions = []
         while not self.is_at_end():
-            if self.is_function_declaration():
-                # Verificar si es la función main antes de parsearla
-                if self.is_main_function():
+            if kind is TopLevelKind.FUNCTION or kind is TopLevelKind.MAIN:
+                if kind is TopLevelKind.MAIN:
                     self.has_main_function = True
-                self.function()
+                function = self.function()
+                if function is not None:
+                    functions.append(function)
+            elif self.recover:
+                # Lo que sigue y no es una función se reporta en lugar de ignorarse
+                self.report(ParserError(
+                    "Se esperaba una declaración de función",
+                    self.peek().line,
+                    self.peek().column
+                ))
+                self.synchronize_function()
             else:
                 break
+            kind = self.classify_top_level()
+        return functions
 
-    def is_main_function(self) -> bool:
-        """Verifica si la siguiente función es main()"""
-        if not self.is_type_token(self.peek()):
-            return False
-        
-        # Guardar posición actual
-        saved_pos = self.current
-        try:
-            self.advance()  # tipo (void, int, etc)
-            if not self.check(TokenType.ID):
-                return False
-            return self.peek().value == "main"
-        finally:
-            self.current = saved_pos
-    
-    def program(self) -> None:
+    def classify_top_level(self) -> Optional[TopLevelKind]:
+        """
+        Clasifica el elemento de nivel superior que empieza en el token actual
+        mirando hasta tres tokens con peek(k), sin consumir ni retroceder.
+        Retorna None si no empieza con Type ID.
+        """
+        if self.peek().type not in TYPE_TOKENS:
+            return None
+        name = self.peek(1)
+        if name.type != TokenType.ID:
+            return None
+        if self.peek(2).type != TokenType.LPAREN:
+            return TopLevelKind.GLOBAL
+        return TopLevelKind.MAIN if name.value == "main" else TopLevelKind.FUNCTION
+
+    def program(self):
         """Program → GlobalDeclaration* FunctionList"""
         if self.is_at_end():
-            raise ParserError(
+            self.error(ParserError(
                 "El programa está vacío",
                 self.peek().line,
                 self.peek().column
-            )
+            ))
+            return self.builder.program(self.globals, self.functions)
         
-        # Iniciar ámbito global
-        self.semantic_analyzer.enter_global_scope()
+        # Una sola clasificación por elemento de nivel superior
+        kind = self.classify_top_level()
         
         # Procesar declaraciones globales
-        while not self.is_at_end() and self.is_global_declaration():
-            self.global_declaration()
+        while kind is TopLevelKind.GLOBAL:
+            try:
+                self.globals.append(self.global_declaration())
+            except ParserError as e:
+                if not self.recover:
+                    raise
+                self.report(e)
+                self.synchronize()
+            kind = self.classify_top_level()
 
         # Procesar funciones
-        self.function_list()
+        self.functions = self.function_list(kind)
 
         # Verificar que existe una función main
         if not self.has_main_function:
-            raise ParserError(
+            self.error(ParserError(
                 "No se encontró la función 'main'",
                 self.previous().line,
                 self.previous().column
-            )
-
-    def is_global_declaration(self) -> bool:
-        """
-        Verifica si los siguientes tokens forman una declaración global.
-        """
-        if not self.is_type_token(self.peek()):
-            return False
-        
-        # Necesitamos ver más adelante sin consumir tokens
-        saved_pos = self.current
-        try:
-            self.advance()  # tipo
-            if not self.check(TokenType.ID):
-                return False
-            self.advance()  # identificador
-            # Si sigue un paréntesis, es una función, no una declaración global
-            return not self.check(TokenType.LPAREN)
-        finally:
-            self.current = saved_pos
+            ))
+        return self.builder.program(self.globals, self.functions)
 
-    def global_declaration(self) -> None:
+    def global_declaration(self):
         """GlobalDeclaration → Type ID ['=' Expression] ';'"""
         # Obtener el tipo
         type_token = self.peek()
-        data_type = self.get_data_type(type_token.type)
+        self.get_data_type(type_token.type)
         self.type()  # Consume el tipo
         
         # Consumir el identificador
         id_token = self.consume(TokenType.ID, 
             f"Se esperaba un identificador después de '{type_token.value}'")
         
-        # Registrar la variable en la tabla de símbolos
-        initialized = False
-        
         # Inicialización opcional
+        initializer = None
         if self.match(TokenType.ASSIGN):
-            expr_type = self.expression()
-            self.semantic_analyzer.check_types(
-                data_type, 
-                expr_type,
-                id_token.line,
-                id_token.column
-            )
-            initialized = True
-        
-        # Declarar la variable global
-        self.semantic_analyzer.declare_variable(
-            data_type,
-            id_token.value,
-            initialized,
-            id_token.line,
-            id_token.column
-        )
+            initializer = self.expression()
         
         # Verificar punto y coma
         self.consume(TokenType.SEMICOLON, 
             f"Se esperaba ';' después de la declaración de '{id_token.value}'")
+        return self.builder.global_decl(type_token, id_token, initializer)
     
-    def parse(self) -> None:
+    def parse(self):
         """
-        Punto de entrada principal del parser.
+        Punto de entrada principal del parser. Retorna el valor que el builder
+        construyó para el programa (con ASTBuilder, el AST).
         """
         try:
-            self.program()
-        except ParserError as e:
+            return self.program()
+        except (ParserError, LexicalError, ErrorLimitReached) as e:
+            # Con un TokenStream los errores léxicos aparecen durante el parseo
             raise e
         except Exception as e:
             current_token = self.peek()
             raise ParserError(str(e), current_token.line, current_token.column)
 
-    def is_function_declaration(self) -> bool:
-        """Verifica si los tokens siguientes forman una declaración de función"""
-        if not self.is_type_token(self.peek()):
-            return False
-        
-        # Necesitamos ver más adelante sin consumir tokens
-        saved_pos = self.current
+    def parse_with_errors(self) -> ParseResult:
+        """
+        Analiza el programa completo en modo de recuperación y retorna el
+        programa (sin las construcciones con errores) junto con todos los
+        errores sintácticos encontrados, hasta max_errors.
+        """
+        recover = self.recover
+        self.recover = True
         try:
-            self.advance()  # tipo
-            if not self.check(TokenType.ID):
-                return False
-            self.advance()  # identificador
-            return self.check(TokenType.LPAREN)
+            program = self.parse()
+        except ErrorLimitReached:
+            program = self.builder.program(self.globals, self.functions)
+        except ParserError as e:
+            # Error fuera de una sentencia o función: termina el análisis
+            self.errors.append(e)
+            program = self.builder.program(self.globals, self.functions)
         finally:
-            self.current = saved_pos
+            self.recover = recover
+        return ParseResult(program, self.errors)
+
+    def report(self, error: ParserError) -> None:
+        """Registra un error en modo de recuperación"""
+        self.errors.append(error)
+        if len(self.errors) >= self.max_errors:
+            raise ErrorLimitReached(self.max_errors)
+
+    def error(self, error: ParserError) -> None:
+        """Lanza el error o, en modo de recuperación, lo registra y continúa"""
+        if not self.recover:
+            raise error
+        self.report(error)
+
+    def is_function_declaration(self) -> bool:
+        """Verifica si los tokens siguientes forman una declaración de función"""
+        kind = self.classify_top_level()
+        return kind is TopLevelKind.FUNCTION or kind is TopLevelKind.MAIN
 
     def is_statement_start(self) -> bool:
         """Verifica si el token actual puede iniciar un statement"""
@@ -170,39 +245,26 @@ class Parser:
 
     def is_function_call(self) -> bool:
         """Verifica si los tokens siguientes forman una llamada a función"""
-        if not self.check(TokenType.ID):
-            return False
+        return self.check(TokenType.ID) and self.peek(1).type == TokenType.LPAREN
 
-        # Necesitamos ver más adelante sin consumir tokens
-        saved_pos = self.current
-        try:
-            self.advance()  # identificador
-            return self.check(TokenType.LPAREN)
-        finally:
-            self.current = saved_pos
-
-    def function_call_stmt(self) -> None:
+    def function_call_stmt(self):
         """FunctionCallStmt → ID '(' ArgumentList ')' ';'"""
         id_token = self.consume(TokenType.ID, "Se esperaba un identificador")
         self.consume(TokenType.LPAREN, "Se esperaba '(' después del identificador")
         
-        # Obtener los tipos de los argumentos
-        arg_types = self.argument_list()
-        
-        # Verificar la llamada a función
-        self.semantic_analyzer.check_function_call(
-            id_token.value,
-            arg_types,
-            id_token.line,
-            id_token.column
-        )
+        arguments = self.argument_list()
         
         self.consume(TokenType.RPAREN, "Se esperaba ')'")
         self.consume(TokenType.SEMICOLON, "Se esperaba ';' después de la llamada a función")
+        return self.builder.call_stmt(id_token, arguments)
 
     # Utilidades básicas del parser
-    def peek(self) -> Token:
-        return self.tokens[self.current]
+    def peek(self, k: int = 0) -> Token:
+        """
+        Token k posiciones después del actual, sin consumirlo. El flujo
+        termina en EOF: solo se mira más allá de tokens que no son EOF.
+        """
+        return self.tokens[self.current + k]
 
     def get_data_type(self, token_type: TokenType) -> DataType:
         """Convierte un TokenType a DataType"""
@@ -254,202 +316,74 @@ class Parser:
         )
 
     def synchronize(self) -> None:
-        """Sincroniza el parser y el analizador semántico después de un error"""
-        self.advance()
-
-        # Sincronización sintáctica
+        """
+        Recuperación en modo pánico después de un error en una sentencia:
+        descarta tokens hasta pasar un ';' o hasta el inicio de una nueva
+        construcción (SYNC_TOKENS).
+        """
         while not self.is_at_end():
             if self.previous().type == TokenType.SEMICOLON:
                 # Si encontramos el fin de una declaración, podemos recuperarnos
-                self.semantic_analyzer.synchronize()
                 return
 
-            if self.peek().type in {
-                TokenType.INT, TokenType.CHAR, TokenType.FLOAT, TokenType.VOID,
-                TokenType.IF, TokenType.WHILE, TokenType.DO, TokenType.RETURN
-            }:
+            if self.peek().type in SYNC_TOKENS:
                 # Si encontramos el inicio de una nueva construcción
-                self.semantic_analyzer.synchronize()
                 return
 
             self.advance()
 
-        try:
-            self.program()
-            if not self.is_at_end():
-                raise ParserError(
-                    "Se esperaba fin de archivo",
-                    self.peek().line,
-                    self.peek().column
-                )
-        except ParserError as e:
-            raise e
-        except Exception as e:
-            current_token = self.peek()
-            raise ParserError(str(e), current_token.line, current_token.column)
-    
-    def verify_type_compatibility(self, expected: DataType, found: DataType, token: Token) -> None:
-        """Verifica la compatibilidad de tipos usando el analizador semántico"""
-        try:
-            self.semantic_analyzer.check_types(expected, found, token.line, token.column)
-        except SemanticError as e:
-            # Opcionalmente, podemos manejar el error aquí o dejarlo propagar
-            raise e
-    
-    def get_expression_type(self, token: Token) -> DataType:
-        """Determina el tipo de dato de un token literal o identificador"""
-        if token.type == TokenType.INTEGER_LITERAL:
-            return DataType.INT
-        elif token.type == TokenType.FLOAT_LITERAL:
-            return DataType.FLOAT
-        elif token.type == TokenType.CHAR_LITERAL:
-            return DataType.CHAR
-        elif token.type == TokenType.ID:
-            # Buscar el tipo en la tabla de símbolos
-            variable = self.semantic_analyzer.check_variable_exists(
-                token.value, 
-                token.line, 
-                token.column
-            )
-            return variable.type
-        else:
-            raise ParserError(
-                f"No se puede determinar el tipo de '{token.value}'",
-                token.line,
-                token.column
-            )
-    
-    def verify_variable_initialization(self, var_name: str, token: Token) -> None:
-        """Verifica que una variable esté inicializada antes de su uso"""
-        try:
-            variable = self.semantic_analyzer.check_variable_exists(
-                var_name,
-                token.line,
-                token.column
-            )
-            if not variable.initialized:
-                raise SemanticError(
-                    f"Variable '{var_name}' usada sin inicializar",
-                    token.line,
-                    token.column
-                )
-        except SemanticError as e:
-            raise e
+    def synchronize_function(self) -> None:
+        """
+        Recuperación después de un error en una función: descarta tokens hasta
+        cerrar el cuerpo (llaves balanceadas) o hasta la siguiente declaración
+        de función.
+        """
+        depth = 0
+        while not self.is_at_end():
+            if depth == 0 and self.is_function_declaration():
+                return
+            token = self.advance()
+            if token.type == TokenType.LBRACE:
+                depth += 1
+            elif token.type == TokenType.RBRACE:
+                depth -= 1
+                if depth <= 0:
+                    return
     
     # Implementación de expresiones (nivel más bajo)
-    def expression(self) -> DataType:
-        """Expression → LogicExpr"""
-        if self.check(TokenType.SCAN_INT):
-            self.advance()  # Consumir el token de scan
-            self.consume(TokenType.LPAREN, "Se esperaba '(' después de la función scan")
-            self.consume(TokenType.RPAREN, "Se esperaba ')' después de scan")
-            return DataType.INT
-        elif self.check(TokenType.SCAN_FLOAT):
-            self.advance()
-            self.consume(TokenType.LPAREN, "Se esperaba '(' después de la función scan")
-            self.consume(TokenType.RPAREN, "Se esperaba ')' después de scan")
-            return DataType.FLOAT
-        elif self.check(TokenType.SCAN_CHAR):
-            self.advance()
-            self.consume(TokenType.LPAREN, "Se esperaba '(' después de la función scan")
-            self.consume(TokenType.RPAREN, "Se esperaba ')' después de scan")
-            return DataType.CHAR
-        else:
-            # Continuar con el análisis normal de expresiones
-            return self.logic_expr()
-
-    def logic_expr(self) -> DataType:
-        """LogicExpr → CompExpr LogicExprTail"""
-        expr_type = self.comp_expr()
-        return self.logic_expr_tail(expr_type)
-
-    def logic_expr_tail(self, left_type: DataType) -> DataType:
-        """LogicExprTail → ('&&' | '||') CompExpr LogicExprTail | ε"""
-        if self.match(TokenType.AND, TokenType.OR):
-            operator = self.previous()
-            right_type = self.comp_expr()
-            
-            # Verificar que ambos operandos sean de tipo INT
-            self.verify_type_compatibility(DataType.INT, left_type, operator)
-            self.verify_type_compatibility(DataType.INT, right_type, operator)
-            
-            # Expresiones lógicas siempre retornan INT
-            result_type = DataType.INT
-            return self.logic_expr_tail(result_type)
-        return left_type
-
-    def comp_expr(self) -> DataType:
-        """CompExpr → AddExpr CompExprTail"""
-        expr_type = self.add_expr()
-        return self.comp_expr_tail(expr_type)
-
-    def comp_expr_tail(self, left_type: DataType) -> DataType:
-        """CompExprTail → ('==' | '!=' | '<' | '<=' | '>' | '>=') AddExpr CompExprTail | ε"""
-        if self.match(TokenType.EQUALS, TokenType.NOT_EQUALS,
-                    TokenType.LESS, TokenType.LESS_EQUAL,
-                    TokenType.GREATER, TokenType.GREATER_EQUAL):
-            operator = self.previous()
-            right_type = self.add_expr()
-            
-            # Verificar compatibilidad de tipos
-            if not self.semantic_analyzer.can_compare(left_type, right_type):
-                raise SemanticError(
-                    f"No se pueden comparar tipos {left_type.name} y {right_type.name}",
-                    operator.line,
-                    operator.column
-                )
-            
-            # Comparaciones siempre retornan INT
-            result_type = DataType.INT
-            return self.comp_expr_tail(result_type)
-        return left_type
-
-    def add_expr(self) -> DataType:
-        """AddExpr → MultExpr AddExprTail"""
-        expr_type = self.mult_expr()
-        return self.add_expr_tail(expr_type)
-
-    def add_expr_tail(self, left_type: DataType) -> DataType:
-        """AddExprTail → ('+' | '-') MultExpr AddExprTail | ε"""
-        if self.match(TokenType.PLUS, TokenType.MINUS):
-            operator = self.previous()
-            right_type = self.mult_expr()
-            
-            # Obtener el tipo resultante de la operación
-            result_type = self.semantic_analyzer.get_operation_type(
-                left_type,
-                operator.type,
-                right_type,
-                operator.line,
-                operator.column
-            )
-            
-            return self.add_expr_tail(result_type)
-        return left_type
-
-    def mult_expr(self) -> DataType:
-        """MultExpr → Factor MultExprTail"""
-        expr_type = self.factor()
-        return self.mult_expr_tail(expr_type)
-
-    def mult_expr_tail(self, left_type: DataType) -> DataType:
-        """MultExprTail → ('*' | '/') Factor MultExprTail | ε"""
-        if self.match(TokenType.TIMES, TokenType.DIVIDE):
-            operator = self.previous()
-            right_type = self.factor()
-            
-            result_type = self.semantic_analyzer.get_operation_type(
-                left_type,
-                operator.type,
-                right_type,
-                operator.line,
-                operator.column
-            )
-            
-            return self.mult_expr_tail(result_type)
-        return left_type
-
-    def factor(self) -> DataType:
+    def logic_expr(self):
+        """
+        LogicExpr → CompExpr LogicExprTail, con CompExpr, AddExpr y MultExpr.
+        Precedencia de operadores iterativa: en lugar de una llamada recursiva
+        por operador se usan una pila de operadores y otra de operandos, y se
+        reduce mientras el operador de la pila tenga igual o mayor precedencia
+        (todos son asociativos por la izquierda).
+        """
+        precedence = BINARY_PRECEDENCE
+        operands = [self.factor()]
+        operators: List[Token] = []
+        
+        while True:
+            operator_precedence = precedence.get(self.peek().type)
+            if operator_precedence is None:
+                break
+            while operators and precedence[operators[-1].type] >= operator_precedence:
+                self.reduce_binary(operators, operands)
+            operators.append(self.advance())
+            operands.append(self.factor())
+        
+        while operators:
+            self.reduce_binary(operators, operands)
+        return operands[0]
+
+    def reduce_binary(self, operators: List[Token], operands: list) -> None:
+        """Aplica el operador del tope de la pila a los dos últimos operandos"""
+        operator = operators.pop()
+        right = operands.pop()
+        left = operands.pop()
+        operands.append(self.builder.binary(operator, left, right))
+
+    def factor(self):
         """
         Factor → '(' Expression ')'
             | ID FactorTail
@@ -459,40 +393,21 @@ class Parser:
             | STRING_LITERAL
         """
         if self.match(TokenType.LPAREN):
-            expr_type = self.expression()
+            expr = self.expression()
             self.consume(TokenType.RPAREN, "Se esperaba ')'")
-            return expr_type
+            return self.builder.group(expr)
             
         elif self.match(TokenType.ID):
             id_token = self.previous()
             if self.check(TokenType.LPAREN):
                 # Es una llamada a función
                 return self.factor_tail(id_token)
-            else:
-                # Es una variable
-                variable = self.semantic_analyzer.check_variable_exists(
-                    id_token.value,
-                    id_token.line,
-                    id_token.column
-                )
-                if not variable.initialized:
-                    raise SemanticError(
-                        f"Variable '{id_token.value}' usada sin inicializar",
-                        id_token.line,
-                        id_token.column
-                    )
-                return variable.type
+            # Es una variable
+            return self.builder.variable(id_token)
                 
-        elif self.match(TokenType.INTEGER_LITERAL):
-            return DataType.INT
-        elif self.match(TokenType.FLOAT_LITERAL):
-            token = self.previous()  # Obtener el token actual
-            # Asegurarnos de guardar el tipo float para usarlo en las verificaciones
-            return DataType.FLOAT
-        elif self.match(TokenType.CHAR_LITERAL):
-            return DataType.CHAR
-        elif self.match(TokenType.STRING_LITERAL):
-            return DataType.CHAR
+        elif self.match(TokenType.INTEGER_LITERAL, TokenType.FLOAT_LITERAL,
+                        TokenType.CHAR_LITERAL, TokenType.STRING_LITERAL):
+            return self.builder.literal(self.previous())
             
         raise ParserError(
             "Se esperaba una expresión",
@@ -500,43 +415,58 @@ class Parser:
             self.peek().column
         )
 
-    def factor_tail(self, id_token: Token) -> DataType:
-        """FactorTail → '(' ArgumentList ')' | ε"""
-        if self.match(TokenType.LPAREN):
-            arg_types = self.argument_list()
-            self.consume(TokenType.RPAREN, "Se esperaba ')'")
-            
-            # Verificar la llamada a función y obtener su tipo de retorno
-            return self.semantic_analyzer.check_function_call(
-                id_token.value,
-                arg_types,
-                id_token.line,
-                id_token.column
-            )
-        return DataType.VOID
+    def factor_tail(self, id_token: Token):
+        """FactorTail → '(' ArgumentList ')'"""
+        self.consume(TokenType.LPAREN, "Se esperaba '('")
+        arguments = self.argument_list()
+        self.consume(TokenType.RPAREN, "Se esperaba ')'")
+        return self.builder.call(id_token, arguments)
 
-    def argument_list(self) -> List[DataType]:
+    def argument_list(self) -> list:
         """ArgumentList → Expression ArgumentListTail | ε"""
-        arg_types = []
+        arguments = []
         if not self.check(TokenType.RPAREN):
-            expr_type = self.expression()
-            arg_types.append(expr_type)
-            while self.match(TokenType.COMMA):
-                expr_type = self.expression()
-                arg_types.append(expr_type)
-        return arg_types
-
-    def argument_list_tail(self) -> List[DataType]:
+            arguments.append(self.expression())
+            arguments.extend(self.argument_list_tail())
+        return arguments
+
+    def argument_list_tail(self) -> list:
         """ArgumentListTail → ',' Expression ArgumentListTail | ε"""
-        arg_types = []
-        if self.match(TokenType.COMMA):
-            arg_types.append(self.expression())
-            arg_types.extend(self.argument_list_tail())
-        return arg_types
+        arguments = []
+        while self.match(TokenType.COMMA):
+            arguments.append(self.expression())
+        return arguments
 
     # Statements
 
-    def statement(self) -> None:
+    def statement(self):
+        """
+        Statement con recuperación: en modo de recuperación un error se
+        registra, se sincroniza y la sentencia se reemplaza por el evento
+        error_stmt del builder (ErrorStmt en el AST).
+        """
+        if not self.recover:
+            return self.parse_statement()
+        
+        start = self.current
+        start_token = self.peek()
+        # Posible nombre de una declaración, antes de que salga de la ventana de tokens
+        name_token = start_token if self.is_at_end() else self.peek(1)
+        try:
+            return self.parse_statement()
+        except ParserError as e:
+            self.report(e)
+            # Garantizar avance si el error está en el primer token
+            if self.current == start:
+                self.advance()
+            self.synchronize()
+            
+            # Si era una declaración se informa el nombre declarado
+            if self.is_type_token(start_token) and name_token.type == TokenType.ID:
+                return self.builder.error_stmt(start_token, name_token)
+            return self.builder.error_stmt(start_token, None)
+
+    def parse_statement(self):
         """
         Statement → DeclarationStmt
                  | AssignmentStmt
@@ -550,26 +480,25 @@ class Parser:
                  | ';'
         """
         if self.is_type_token(self.peek()):
-            self.declaration_stmt()
+            return self.declaration_stmt()
         elif self.check(TokenType.ID):
             if self.is_function_call():
-                self.function_call_stmt()
-            else:
-                self.assignment_stmt()
+                return self.function_call_stmt()
+            return self.assignment_stmt()
         elif self.check(TokenType.IF):
-            self.if_stmt()
+            return self.if_stmt()
         elif self.check(TokenType.WHILE):
-            self.while_stmt()
+            return self.while_stmt()
         elif self.check(TokenType.DO):
-            self.do_while_stmt()
+            return self.do_while_stmt()
         elif self.check(TokenType.RETURN):
-            self.return_stmt()
+            return self.return_stmt()
         elif self.is_io_function(self.peek()):
-            self.io_stmt()
+            return self.io_stmt()
         elif self.check(TokenType.LBRACE):
-            self.compound_stmt()
+            return self.compound_stmt()
         elif self.match(TokenType.SEMICOLON):
-            pass  # Statement vacío
+            return self.builder.empty_stmt(self.previous())  # Statement vacío
         else:
             raise ParserError(
                 "Se esperaba el inicio de una declaración",
@@ -586,297 +515,200 @@ class Parser:
                 self.peek().column
             )
 
-    def declaration_stmt(self) -> None:
+    def declaration_stmt(self):
         """DeclarationStmt → Type ID ['=' Expression] ';'"""
         # Obtener el tipo de la variable
         type_token = self.peek()
-        data_type = self.get_data_type(type_token.type)
+        self.get_data_type(type_token.type)
         self.type()
         
         # Obtener el identificador
         id_token = self.consume(TokenType.ID, "Se esperaba un identificador")
         
-        initialized = False
-        expr_type = None
-        
         # Inicialización opcional
+        initializer = None
         if self.match(TokenType.ASSIGN):
-            expr_type = self.expression()
-            if expr_type is None:
-                raise SemanticError(
-                    "No se pudo determinar el tipo de la expresión",
-                    id_token.line,
-                    id_token.column
-                )
-            # Verificar compatibilidad de tipos
-            self.semantic_analyzer.check_types(
-                data_type,
-                expr_type,
-                id_token.line,
-                id_token.column
-            )
-            initialized = True
-        
-        # Declarar la variable en el ámbito actual
-        self.semantic_analyzer.declare_variable(
-            data_type,
-            id_token.value,
-            initialized,
-            id_token.line,
-            id_token.column
-        )
+            initializer = self.expression()
         
         self.consume(TokenType.SEMICOLON, "Se esperaba ';' después de la declaración")
+        return self.builder.var_decl(type_token, id_token, initializer)
 
-    def assignment_stmt(self) -> None:
+    def assignment_stmt(self):
         """AssignmentStmt → ID '=' Expression ';'"""
         id_token = self.consume(TokenType.ID, "Se esperaba un identificador")
         self.consume(TokenType.ASSIGN, "Se esperaba '=' después del identificador")
         
-        # Verificar que la variable existe
-        variable = self.semantic_analyzer.check_variable_exists(
-            id_token.value,
-            id_token.line,
-            id_token.column
-        )
-        
-        # Obtener el tipo de la expresión
-        expr_type = self.expression()
-        if expr_type is None:
-            raise SemanticError(
-                "No se pudo determinar el tipo de la expresión",
-                id_token.line,
-                id_token.column
-            )
-        
-        # Verificar compatibilidad de tipos
-        self.semantic_analyzer.check_types(
-            variable.type,
-            expr_type,
-            id_token.line,
-            id_token.column
-        )
+        value = self.expression()
         
         self.consume(TokenType.SEMICOLON, "Se esperaba ';' después de la asignación")
+        return self.builder.assignment(id_token, value)
 
-    def if_stmt(self) -> None:
+    def if_stmt(self):
         """IfStmt → 'if' '(' Expression ')' Statement ['else' Statement]"""
         if_token = self.consume(TokenType.IF, "Se esperaba 'if'")
         self.consume(TokenType.LPAREN, "Se esperaba '(' después de 'if'")
         
-        # Verificar que la condición es de tipo INT
-        cond_type = self.expression()
-        self.semantic_analyzer.check_condition(
-            cond_type,
-            if_token.line,
-            if_token.column
-        )
+        condition = self.expression()
         
         self.consume(TokenType.RPAREN, "Se esperaba ')' después de la condición")
         
-        # Crear nuevo ámbito para el bloque if
-        self.semantic_analyzer.enter_scope()
-        self.statement()
-        self.semantic_analyzer.exit_scope()
+        then_branch = self.statement()
         
         # Parte else opcional
+        else_branch = None
         if self.match(TokenType.ELSE):
-            self.semantic_analyzer.enter_scope()
-            self.statement()
-            self.semantic_analyzer.exit_scope()
+            else_branch = self.statement()
+        return self.builder.if_stmt(if_token, condition, then_branch, else_branch)
 
-    def while_stmt(self) -> None:
+    def while_stmt(self):
         """WhileStmt → 'while' '(' Expression ')' Statement"""
         while_token = self.consume(TokenType.WHILE, "Se esperaba 'while'")
         self.consume(TokenType.LPAREN, "Se esperaba '(' después de 'while'")
         
-        cond_type = self.expression()
-        self.semantic_analyzer.check_condition(
-            cond_type,
-            while_token.line,
-            while_token.column
-        )
+        condition = self.expression()
         
         self.consume(TokenType.RPAREN, "Se esperaba ')' después de la condición")
         
-        self.semantic_analyzer.enter_scope()
-        self.statement()
-        self.semantic_analyzer.exit_scope()
+        body = self.statement()
+        return self.builder.while_stmt(while_token, condition, body)
 
-    def do_while_stmt(self) -> None:
+    def do_while_stmt(self):
         """DoWhileStmt → 'do' Statement 'while' '(' Expression ')' ';'"""
         do_token = self.consume(TokenType.DO, "Se esperaba 'do'")
         
-        # Crear ámbito para el cuerpo del do-while
-        self.semantic_analyzer.enter_scope()
-        self.statement()
-        self.semantic_analyzer.exit_scope()
+        body = self.statement()
         
         self.consume(TokenType.WHILE, "Se esperaba 'while'")
         self.consume(TokenType.LPAREN, "Se esperaba '(' después de 'while'")
         
-        # Verificar que la condición es de tipo INT
-        cond_type = self.expression()
-        self.semantic_analyzer.check_condition(
-            cond_type,
-            do_token.line,
-            do_token.column
-        )
+        condition = self.expression()
         
         self.consume(TokenType.RPAREN, "Se esperaba ')' después de la condición")
         self.consume(TokenType.SEMICOLON, "Se esperaba ';' después del do-while")
+        return self.builder.do_while(do_token, body, condition)
 
-    def return_stmt(self) -> None:
+    def return_stmt(self):
         """ReturnStmt → 'return' [Expression] ';'"""
         return_token = self.consume(TokenType.RETURN, "Se esperaba 'return'")
         
         # Expresión opcional
-        return_type = None
+        value = None
         if not self.check(TokenType.SEMICOLON):
-            return_type = self.expression()
-        
-        # Verificar que el tipo de retorno coincide con la función
-        self.semantic_analyzer.check_return(
-            return_type,
-            return_token.line,
-            return_token.column
-        )
-        
-        # Marcar que la función tiene un return válido
-        self.semantic_analyzer.has_return = True
+            value = self.expression()
         
         self.consume(TokenType.SEMICOLON, "Se esperaba ';' después de return")
+        return self.builder.return_stmt(return_token, value)
+
+    def function(self):
+        """
+        Function con recuperación: en modo de recuperación un error se
+        registra, se descarta el resto de la función y se retorna None.
+        """
+        if not self.recover:
+            return self.parse_function()
+        
+        try:
+            return self.parse_function()
+        except ParserError as e:
+            self.report(e)
+            self.synchronize_function()
+            return None
 
-    def function(self) -> None:
+    def parse_function(self):
         """Function → Type ID '(' ParameterList ')' CompoundStmt"""
+        type_token, function_name, parameters = self.function_header()
+        
+        # Procesar el cuerpo de la función
+        body = self.compound_stmt()
+        return self.builder.function(type_token, function_name, parameters, body)
+
+    def function_header(self) -> tuple:
+        """
+        Type ID '(' ParameterList ')': la firma de la función, sin el cuerpo.
+        Retorna el token del tipo, el del nombre y los parámetros.
+        """
         # Obtener tipo de retorno
-        return_type = self.get_data_type(self.peek().type)
+        type_token = self.peek()
+        self.get_data_type(type_token.type)
         self.type()  # Consume el tipo
         
         # Obtener nombre de la función
         function_name = self.consume(TokenType.ID, 
             "Se esperaba un nombre de función")
         
-        # Registrar la función y entrar en su ámbito
-        self.semantic_analyzer.enter_function(
-            return_type,
-            function_name.value,
-            function_name.line,
-            function_name.column
-        )
-        
         self.consume(TokenType.LPAREN, 
             f"Se esperaba '(' después de '{function_name.value}'")
-        self.parameter_list()
+        parameters = self.parameter_list()
         self.consume(TokenType.RPAREN, 
             "Se esperaba ')' después de los parámetros")
-        
-        # Procesar el cuerpo de la función
-        self.compound_stmt()
-        
-        # Salir del ámbito de la función
-        self.semantic_analyzer.exit_function()
+        return type_token, function_name, parameters
 
-    def parameter_list(self) -> None:
+    def parameter_list(self) -> list:
         """ParameterList → Parameter ParameterListTail | ε"""
+        parameters = []
         if self.is_type_token(self.peek()):
-            self.parameter()
-            self.parameter_list_tail()
+            parameters.append(self.parameter())
+            parameters.extend(self.parameter_list_tail())
+        return parameters
 
-    def parameter(self) -> None:
+    def parameter(self):
         """Parameter → Type ID"""
         # Obtener el tipo del parámetro
-        param_type = self.get_data_type(self.peek().type)
+        type_token = self.peek()
+        self.get_data_type(type_token.type)
         self.type()
         
         # Obtener el nombre del parámetro
         param_token = self.consume(TokenType.ID, "Se esperaba un nombre de parámetro")
-        
-        # Registrar el parámetro
-        self.semantic_analyzer.add_parameter(
-            param_type,
-            param_token.value,
-            param_token.line,
-            param_token.column
-        )
+        return self.builder.param(type_token, param_token)
 
-    def parameter_list_tail(self) -> None:
+    def parameter_list_tail(self) -> list:
         """ParameterListTail → ',' Parameter ParameterListTail | ε"""
-        if self.match(TokenType.COMMA):
-            self.parameter()
-            self.parameter_list_tail()
+        parameters = []
+        while self.match(TokenType.COMMA):
+            parameters.append(self.parameter())
+        return parameters
 
-    def expression(self) -> DataType:
+    def expression(self):
         """Expression → LogicExpr"""
         if self.check(TokenType.SCAN_INT) or self.check(TokenType.SCAN_FLOAT) or \
         self.check(TokenType.SCAN_CHAR):
             scan_token = self.advance()  # Consumir el token de scan
             self.consume(TokenType.LPAREN, "Se esperaba '(' después de la función scan")
             self.consume(TokenType.RPAREN, "Se esperaba ')' después de scan")
-            
-            # Determinar el tipo de retorno según la función de scan
-            scan_types = {
-                TokenType.SCAN_INT: DataType.INT,
-                TokenType.SCAN_FLOAT: DataType.FLOAT,
-                TokenType.SCAN_CHAR: DataType.CHAR
-            }
-            return scan_types[scan_token.type]
+            return self.builder.scan_call(scan_token)
         else:
             # Continuar con el análisis normal de expresiones
             return self.logic_expr()
 
-    def io_stmt(self) -> None:
+    def io_stmt(self):
         """IOStmt → PrintStmt | ScanStmt"""
         io_token = self.advance()
         self.consume(TokenType.LPAREN, f"Se esperaba '(' después de {io_token.value}")
         
-        if io_token.type in {TokenType.PRINT_INT, TokenType.PRINT_FLOAT,
-                            TokenType.PRINT_CHAR, TokenType.PRINT_STR}:
-            expr_type = self.expression()
-            # Verificar que el tipo coincide con la función de impresión
-            expected_type = {
-                TokenType.PRINT_INT: DataType.INT,
-                TokenType.PRINT_FLOAT: DataType.FLOAT,
-                TokenType.PRINT_CHAR: DataType.CHAR,
-                TokenType.PRINT_STR: DataType.CHAR,
-            }[io_token.type]
-            
-            # No permitir conversiones implícitas para funciones de I/O
-            if expected_type != expr_type:
-                raise SemanticError(
-                    f"Tipo incompatible en función {io_token.value}: "
-                    f"se esperaba {expected_type.name}, se encontró {expr_type.name}",
-                    io_token.line,
-                    io_token.column
-                )
+        argument = None
+        if self.is_print_token(io_token):
+            argument = self.expression()
         
         self.consume(TokenType.RPAREN, f"Se esperaba ')' después de {io_token.value}")
         self.consume(TokenType.SEMICOLON, f"Se esperaba ';' después de {io_token.value}")
+        return self.builder.io_stmt(io_token, argument)
 
-    def compound_stmt(self) -> None:
+    def compound_stmt(self):
         """CompoundStmt → '{' {Statement} '}'"""
         self.consume(TokenType.LBRACE, "Se esperaba '{'")
         
-        # Crear nuevo ámbito
-        self.semantic_analyzer.enter_scope()
-        
+        statements = []
         while not self.check(TokenType.RBRACE) and not self.is_at_end():
-            self.statement()
-        
-        # Salir del ámbito
-        self.semantic_analyzer.exit_scope()
+            statements.append(self.statement())
         
         self.consume(TokenType.RBRACE, "Se esperaba '}'")
+        return self.builder.block(statements)
     
     # Métodos auxiliares
     def is_type_token(self, token: Token) -> bool:
         """Verifica si el token es un tipo de dato"""
-        return token.type in {
-            TokenType.INT,
-            TokenType.CHAR,
-            TokenType.FLOAT,
-            TokenType.VOID
-        }
+        return token.type in TYPE_TOKENS
 
     def is_print_token(self, token: Token) -> bool:
         """Verifica si el token es una función de impresión"""
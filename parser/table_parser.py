@@ -0,0 +1,266 @@
+from typing import Dict, List, Optional, Union
+from lexer.lexer import FIXED_VALUES
+from lexer.token import Token
+from lexer.token_buffer import TokenBuffer
+from lexer.token_stream import TokenStream
+from lexer.token_type import TokenType
+from utils.error_handler import LexicalError, ParserError
+from .ast_nodes import (
+    Assignment, BinaryOp, Block, Call, CallStmt, DoWhile, EmptyStmt,
+    FunctionDecl, If, IOStmt, Literal, Param, Program, Return, ScanCall,
+    VarDecl, VariableRef, While,
+)
+from .builders import DATA_TYPES
+from .ll1_generator import ACTION_PREFIX
+from .ll1_table import PRODUCTIONS, START, TABLE
+
+# Descripción de lo esperado al fallar un no terminal; los que no figuran
+# aquí listan los terminales de su fila en la tabla
+EXPECTED = {
+    'Statement': "el inicio de una declaración",
+    'Type': "un tipo de dato (int, char, float, void)",
+    'Expression': "una expresión",
+    'Factor': "una expresión",
+}
+
+TERMINAL_NAMES = {
+    TokenType.ID: "un identificador",
+    TokenType.INTEGER_LITERAL: "un literal entero",
+    TokenType.FLOAT_LITERAL: "un literal flotante",
+    TokenType.CHAR_LITERAL: "un literal de carácter",
+    TokenType.STRING_LITERAL: "un literal de cadena",
+    TokenType.EOF: "fin de archivo",
+}
+
+def terminal_name(token_type: TokenType) -> str:
+    name = TERMINAL_NAMES.get(token_type)
+    return name if name is not None else f"'{FIXED_VALUES[token_type]}'"
+
+class ASTActions:
+    """
+    Acciones semánticas del driver LL(1) que construyen el mismo AST que
+    Parser. Trabajan sobre una pila de valores: shift apila cada token
+    reconocido y cada acción (@nombre en la gramática) desapila los valores
+    de su producción y apila el resultado.
+    """
+    def __init__(self):
+        self.values: list = []
+        self.previous: Optional[Token] = None
+        self.last: Optional[Token] = None
+
+    def shift(self, token: Token) -> None:
+        self.previous, self.last = self.last, token
+        self.values.append(token)
+
+    def result(self) -> Program:
+        return self.values.pop()
+
+    def pop(self, count: int) -> list:
+        """Desapila los últimos count valores, en orden"""
+        values = self.values[-count:]
+        del self.values[-count:]
+        return values
+
+    # Nivel superior
+
+    def begin_program(self) -> None:
+        self.values.append(Program())
+
+    def end_program(self) -> None:
+        eof = self.values.pop()
+        program = self.values[-1]
+        if not program.globals and not program.functions:
+            raise ParserError("El programa está vacío", eof.line, eof.column)
+        if not any(function.name.value == "main" for function in program.functions):
+            previous = self.previous or eof
+            raise ParserError("No se encontró la función 'main'", previous.line, previous.column)
+
+    def global_decl(self) -> None:
+        type_token, id_token, initializer, _ = self.pop(4)
+        self.values[-1].globals.append(VarDecl(DATA_TYPES[type_token.type], id_token, initializer))
+
+    def function(self) -> None:
+        type_token, id_token, _, parameters, _, body = self.pop(6)
+        self.values[-1].functions.append(
+            FunctionDecl(DATA_TYPES[type_token.type], id_token, parameters, body))
+
+    def param(self) -> None:
+        type_token, id_token = self.pop(2)
+        self.values.append(Param(DATA_TYPES[type_token.type], id_token))
+
+    # Listas y valores opcionales
+
+    def begin_list(self) -> None:
+        self.values.append([])
+
+    def append(self) -> None:
+        item = self.values.pop()
+        self.values[-1].append(item)
+
+    def drop(self) -> None:
+        self.values.pop()
+
+    def none(self) -> None:
+        self.values.append(None)
+
+    def initializer(self) -> None:
+        _, expr = self.pop(2)
+        self.values.append(expr)
+
+    # Sentencias
+
+    def declaration_stmt(self) -> None:
+        type_token, id_token, initializer, _ = self.pop(4)
+        self.values.append(VarDecl(DATA_TYPES[type_token.type], id_token, initializer))
+
+    def assignment_stmt(self) -> None:
+        id_token, _, value, _ = self.pop(4)
+        self.values.append(Assignment(id_token, value))
+
+    def call_stmt(self) -> None:
+        id_token, _, arguments, _, _ = self.pop(5)
+        self.values.append(CallStmt(Call(id_token, arguments)))
+
+    def if_stmt(self) -> None:
+        if_token, _, condition, _, then_branch, else_branch = self.pop(6)
+        self.values.append(If(if_token, condition, then_branch, else_branch))
+
+    def else_branch(self) -> None:
+        _, statement = self.pop(2)
+        self.values.append(statement)
+
+    def while_stmt(self) -> None:
+        while_token, _, condition, _, body = self.pop(5)
+        self.values.append(While(while_token, condition, body))
+
+    def do_while_stmt(self) -> None:
+        do_token, body, _, _, condition, _, _ = self.pop(7)
+        self.values.append(DoWhile(do_token, body, condition))
+
+    def return_stmt(self) -> None:
+        return_token, value, _ = self.pop(3)
+        self.values.append(Return(return_token, value))
+
+    def print_stmt(self) -> None:
+        io_token, _, argument, _, _ = self.pop(5)
+        self.values.append(IOStmt(io_token, argument))
+
+    def scan_stmt(self) -> None:
+        io_token, _, _, _ = self.pop(4)
+        self.values.append(IOStmt(io_token))
+
+    def empty_stmt(self) -> None:
+        self.values.append(EmptyStmt(self.values.pop()))
+
+    def block(self) -> None:
+        _, statements, _ = self.pop(3)
+        self.values.append(Block(statements))
+
+    # Expresiones
+
+    def scan_call(self) -> None:
+        scan_token, _, _ = self.pop(3)
+        self.values.append(ScanCall(scan_token))
+
+    def binary(self) -> None:
+        left, operator, right = self.pop(3)
+        self.values.append(BinaryOp(operator, left, right))
+
+    def group(self) -> None:
+        _, expr, _ = self.pop(3)
+        self.values.append(expr)
+
+    def literal(self) -> None:
+        self.values.append(Literal(self.values.pop()))
+
+    def variable(self) -> None:
+        self.values.append(VariableRef(self.values.pop()))
+
+    def call(self) -> None:
+        id_token, _, arguments, _ = self.pop(4)
+        self.values.append(Call(id_token, arguments))
+
+class TableParser:
+    """
+    Parser predictivo dirigido por la tabla LL(1) de parser/ll1_table.py.
+    Usa una pila explícita en lugar de una función por producción, de modo
+    que la profundidad del programa no depende del límite de recursión de
+    Python. Las acciones semánticas de la gramática (@nombre) se delegan en
+    el objeto actions; por defecto ASTActions, que produce el mismo AST que
+    Parser para que SemanticChecker aplique las verificaciones de siempre.
+    """
+    def __init__(self, tokens: Union[List[Token], TokenStream, TokenBuffer], actions=None):
+        self.tokens = tokens
+        self.current = 0
+        self.actions = actions if actions is not None else ASTActions()
+        self.table = self.bind_table(self.actions)
+
+    @staticmethod
+    def bind_table(actions) -> Dict[str, Dict[TokenType, list]]:
+        """
+        Resuelve la tabla generada: los terminales pasan a TokenType y las
+        acciones a métodos de actions. Cada lado derecho queda invertido,
+        listo para apilarse.
+        """
+        def resolve(symbol: str):
+            if symbol.startswith(ACTION_PREFIX):
+                return getattr(actions, symbol[len(ACTION_PREFIX):])
+            if symbol in TABLE:
+                return symbol
+            return TokenType[symbol]
+
+        bodies = [[resolve(symbol) for symbol in reversed(body)] for _, body in PRODUCTIONS]
+        return {
+            head: {TokenType[terminal]: bodies[index] for terminal, index in row.items()}
+            for head, row in TABLE.items()
+        }
+
+    def parse(self) -> Program:
+        """Punto de entrada del parser. Retorna el resultado de las acciones (el AST)"""
+        try:
+            self.run()
+            return self.actions.result()
+        except (ParserError, LexicalError) as e:
+            raise e
+        except Exception as e:
+            current_token = self.tokens[self.current]
+            raise ParserError(str(e), current_token.line, current_token.column)
+
+    def run(self) -> None:
+        tokens = self.tokens
+        table = self.table
+        shift = self.actions.shift
+        stack = [START]
+        token = tokens[self.current]
+
+        while stack:
+            symbol = stack.pop()
+            symbol_type = type(symbol)
+            if symbol_type is TokenType:
+                if token.type is not symbol:
+                    raise ParserError(
+                        f"Se esperaba {terminal_name(symbol)}. Se encontró '{token.value}'",
+                        token.line,
+                        token.column
+                    )
+                shift(token)
+                if symbol is not TokenType.EOF:
+                    self.current += 1
+                    token = tokens[self.current]
+            elif symbol_type is str:
+                body = table[symbol].get(token.type)
+                if body is None:
+                    raise ParserError(
+                        f"Se esperaba {self.expected(symbol)}. Se encontró '{token.value}'",
+                        token.line,
+                        token.column
+                    )
+                stack.extend(body)
+            else:
+                symbol()
+
+    def expected(self, nonterminal: str) -> str:
+        """Descripción de lo que puede iniciar un no terminal"""
+        if nonterminal in EXPECTED:
+            return EXPECTED[nonterminal]
+        return " o ".join(terminal_name(terminal) for terminal in self.table[nonterminal])
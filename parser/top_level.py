@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+from lexer.token import Token
+from lexer.token_type import TokenType
+from .parser import TYPE_TOKENS, TopLevelKind
+
+@dataclass(slots=True)
+class TopLevelItem:
+    """Declaración global o función: tokens[start:end]"""
+    kind: TopLevelKind
+    start: int
+    end: int
+
+def classify(tokens: Sequence[Token], index: int) -> Optional[TopLevelKind]:
+    """Como Parser.classify_top_level, para el elemento que empieza en tokens[index]"""
+    if tokens[index].type not in TYPE_TOKENS:
+        return None
+    name = tokens[index + 1]
+    if name.type != TokenType.ID:
+        return None
+    if tokens[index + 2].type != TokenType.LPAREN:
+        return TopLevelKind.GLOBAL
+    return TopLevelKind.MAIN if name.value == "main" else TopLevelKind.FUNCTION
+
+def split_top_level(tokens: Sequence[Token],
+                    known_end: Optional[Callable[[int], Optional[int]]] = None
+                    ) -> Optional[List[TopLevelItem]]:
+    """
+    Divide un flujo de tokens (terminado en EOF) en sus elementos de nivel
+    superior sin analizarlos: una declaración global termina en el primer
+    ';' y una función en la '}' que cierra su primera '{'. Sigue el mismo
+    orden que Parser.program (globales y luego funciones; lo que sigue a la
+    última función se ignora igual que en el parser).
+    Retorna None si el flujo está vacío, no empieza con un elemento o
+    termina antes de cerrarse uno: esos casos los decide el parser completo.
+    known_end(index), si se indica, retorna el fin de una función ya conocida
+    que empieza en tokens[index] (o None), para no volver a contar sus llaves.
+    """
+    items: List[TopLevelItem] = []
+    index = 0
+    kind = classify(tokens, index)
+    if kind is None:
+        return None
+
+    while kind is TopLevelKind.GLOBAL:
+        end = index
+        while tokens[end].type != TokenType.SEMICOLON:
+            if tokens[end].type == TokenType.EOF:
+                return None
+            end += 1
+        items.append(TopLevelItem(kind, index, end + 1))
+        index = end + 1
+        kind = classify(tokens, index)
+
+    while kind is TopLevelKind.FUNCTION or kind is TopLevelKind.MAIN:
+        end = known_end(index) if known_end is not None else None
+        if end is None:
+            end = skip_function(tokens, index)
+        if end is None:
+            return None
+        items.append(TopLevelItem(kind, index, end))
+        index = end
+        kind = classify(tokens, index)
+    return items
+
+def skip_function(tokens: Sequence[Token], index: int) -> Optional[int]:
+    """
+    Índice siguiente a la '}' que cierra el cuerpo de la función que empieza
+    en tokens[index], contando llaves; None si el flujo termina antes.
+    """
+    depth = 0
+    while True:
+        token_type = tokens[index].type
+        index += 1
+        if token_type == TokenType.LBRACE:
+            depth += 1
+        elif token_type == TokenType.RBRACE:
+            depth -= 1
+            if depth <= 0:
+                return index
+        elif token_type == TokenType.EOF:
+            return None
@@ -1,45 +1,69 @@
 import sys
 from datetime import datetime
-from lexer.lexer import Lexer
-from parse_tree.tree_parser import TreeParser
-from utils.error_handler import CompilerError
-from semantic.analyzer import SemanticAnalyzer
+from lexer.lexer import Lexer, PARALLEL_THRESHOLD, reset_shared_tables
+from lexer.token_stream import TokenStream
+from lexer.token_cache import TokenCache
+from parser.parser import Parser
+from parser.builders import ASTBuilder, TeeBuilder
+from parse_tree.cst_builder import CSTBuilder
+from utils.error_handler import CompilerError, LexicalError
+from semantic.checker import SemanticChecker
 
-def compile_file(file_path: str) -> None:
+def parse_with_tree(tokens):
+    """
+    Un solo análisis sintáctico que construye el AST y el árbol de parseo;
+    el análisis semántico se hace sobre el AST. Retorna el árbol.
+    """
+    program, tree = Parser(tokens, builder=TeeBuilder(ASTBuilder(), CSTBuilder())).parse()
+    SemanticChecker().check(program)
+    return tree
+
+def compile_file(file_path: str, use_cache: bool = False) -> None:
     """
     Compila un archivo fuente completo y genera el árbol de parseo.
     """
+    # Los IDs y constantes de una compilación anterior ya no se usan
+    reset_shared_tables()
     try:
-        # Leer el archivo
-        with open(file_path, 'r') as file:
-            code = file.read()
-        
-        print(f"\nCompilando archivo: {file_path}")
-        print("="*50)
-        
-        # Análisis léxico
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
-        
-        # Análisis sintáctico y semántico con árbol de parseo
-        print("\nAnálisis Sintáctico y Semántico:")
-        print("-"*20)
-        semantic_analyzer = SemanticAnalyzer()
-        tree_parser = TreeParser(tokens)
-        semantic_analyzer.analyze(tree_parser)
-        parse_tree = tree_parser.parse()
+        # Mapear el archivo en memoria en lugar de leerlo completo a un str;
+        # el mapeo se libera al salir del bloque
+        with Lexer.from_file(file_path) as lexer:
+            print(f"\nCompilando archivo: {file_path}")
+            print("="*50)
+        
+            # Análisis léxico (perezoso: el parser consume los tokens a medida que se generan).
+            # Los archivos muy grandes se tokenizan en paralelo en varios procesos.
+            # Con use_cache, un archivo sin cambios reutiliza los tokens guardados en disco.
+            if use_cache:
+                tokens = TokenCache().tokenize(lexer)
+            elif len(lexer.text) >= PARALLEL_THRESHOLD:
+                tokens = lexer.tokenize(parallel=True)
+            else:
+                tokens = TokenStream(lexer.iter_tokens())
+        
+            # Análisis sintáctico y semántico con árbol de parseo
+            print("\nAnálisis Sintáctico y Semántico:")
+            print("-"*20)
+            parse_tree = parse_with_tree(tokens)
         
-        # Generar archivo del árbol de parseo
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        tree_file = f"parser_tree_{timestamp}.txt"
-        tree_parser.tree.visualize(tree_file)
+            # Generar archivo del árbol de parseo
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            tree_file = f"parser_tree_{timestamp}.txt"
+            parse_tree.visualize(tree_file)
         
-        print("✓ Programa sintáctica y semánticamente correcto")
-        print(f"✓ Árbol de parseo generado en: {tree_file}")
+            print("✓ Programa sintáctica y semánticamente correcto")
+            print(f"✓ Árbol de parseo generado en: {tree_file}")
         
     except FileNotFoundError:
         print(f"Error: No se pudo encontrar el archivo '{file_path}'")
         sys.exit(1)
+    except LexicalError:
+        # Reportar todos los errores léxicos del archivo en una sola pasada
+        with Lexer.from_file(file_path) as lexer:
+            errors = lexer.tokenize_with_errors().errors
+        for error in errors:
+            print(f"\n❌ Error: {error}")
+        sys.exit(1)
     except CompilerError as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
@@ -178,6 +202,9 @@ def run_tests() -> None:
     
     print("="*50)
     
+    # Un solo lexer reutilizado para todos los casos
+    lexer = Lexer('')
+    
     for i, code in enumerate(test_cases, 1):
         print(f"\nCaso de prueba #{i}")
         print("="*50)
@@ -186,7 +213,8 @@ def run_tests() -> None:
             # Análisis léxico
             print("\n1. Análisis Léxico:")
             print("-"*20)
-            lexer = Lexer(code)
+            lexer.reset(code)
+            reset_shared_tables()
             tokens = lexer.tokenize()
             for token in tokens:
                 print(f"  {token}")
@@ -194,15 +222,12 @@ def run_tests() -> None:
             # Análisis sintáctico y semántico con árbol
             print("\nAnálisis Sintáctico y Semántico:")
             print("-"*20)
-            semantic_analyzer = SemanticAnalyzer()
-            tree_parser = TreeParser(tokens)
-            semantic_analyzer.analyze(tree_parser)
-            parse_tree = tree_parser.parse()
+            parse_tree = parse_with_tree(tokens)
             
             # Generar archivo del árbol para cada caso de prueba
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             tree_file = f"parser_tree_test{i}_{timestamp}.txt"
-            tree_parser.tree.visualize(tree_file)
+            parse_tree.visualize(tree_file)
             
             print("✓ Programa sintáctica y semánticamente correcto")
             print(f"✓ Árbol de parseo generado en: {tree_file}")
@@ -211,14 +236,17 @@ def run_tests() -> None:
             print(f"\n❌ Error: {e}")
 
 def main():
-    if len(sys.argv) == 1:
+    # --cache: guardar y reutilizar los tokens de archivos sin cambios
+    use_cache = '--cache' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--cache']
+    if not args:
         # Sin argumentos, ejecutar suite de pruebas
         print("No se proporcionó archivo. Ejecutando suite de pruebas...")
         run_tests()
     else:
         # Compilar el archivo proporcionado
-        file_path = sys.argv[1]
-        compile_file(file_path)
+        file_path = args[0]
+        compile_file(file_path, use_cache)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 from .types import DataType, Variable, Function
 from .symbol_table import SymbolTable
 from utils.error_handler import SemanticError
 from lexer.token_type import TokenType
+from lexer.interner import SYMBOLS
 
 class SemanticAnalyzer:
     def __init__(self):
@@ -10,6 +11,8 @@ class SemanticAnalyzer:
         self.current_return_type: Optional[DataType] = None
         self.is_function_context = False  # Para llamadas a funciones
         self.is_io_context = False  # Para operaciones de I/O
+        # La función actual ya estaba declarada por la pre-pasada de firmas
+        self.signature_declared = False
 
     def analyze(self, parser) -> None:
         """
@@ -59,13 +62,42 @@ class SemanticAnalyzer:
         # Por ahora solo reiniciamos el estado
         self.current_return_type = None
 
-    def enter_function(self, return_type: DataType, name: str, line: int, column: int) -> None:
-            """Llamado cuando el parser entra a una función"""
-            func = Function(name, return_type, line=line, column=column)
-            self.symbol_table.enter_function(func)
+    def abandon_function(self) -> None:
+        """Descarta el ámbito de la función actual después de un error y vuelve al global"""
+        self.symbol_table.current_scope = self.symbol_table.global_scope
+        self.symbol_table.current_function = None
+        self.current_return_type = None
+        self.has_return = False
+
+    def enter_function(self, return_type: DataType, name: str, line: int, column: int,
+                       symbol: Optional[int] = None, declared: Optional[Function] = None) -> None:
+            """
+            Llamado cuando el parser entra a una función.
+            declared es la firma que ya registró la pre-pasada de firmas: no se
+            vuelve a declarar y sus parámetros ya están en ella.
+            """
+            if declared is None:
+                func = Function(name, return_type, line=line, column=column, symbol=self._symbol(name, symbol))
+                self.symbol_table.enter_function(func)
+            else:
+                self.symbol_table.enter_function(declared, define=False)
+            self.signature_declared = declared is not None
             self.current_return_type = return_type
             self.has_return = False  # Reiniciar el flag
 
+    def declare_signature(self, return_type: DataType, name: str, parameters: List[Variable],
+                          line: int, column: int, symbol: Optional[int] = None) -> Optional[Function]:
+        """
+        Registra la firma de una función en el ámbito global antes de verificar
+        su cuerpo. Si ya hay una función con ese nombre no hace nada y retorna None.
+        """
+        symbol = self._symbol(name, symbol)
+        if symbol in self.symbol_table.global_scope.functions:
+            return None
+        func = Function(name, return_type, parameters, line, column, symbol)
+        self.symbol_table.define_function(func)
+        return func
+
     def exit_function(self) -> None:
         """Llamado cuando el parser sale de una función"""
         # Verificar que la función tiene return si lo necesita
@@ -82,25 +114,35 @@ class SemanticAnalyzer:
         self.current_return_type = None
         self.has_return = False
 
-    def add_parameter(self, type: DataType, name: str, line: int, column: int) -> None:
+    def add_parameter(self, type: DataType, name: str, line: int, column: int,
+                      symbol: Optional[int] = None) -> None:
         """Llamado cuando el parser procesa un parámetro de función"""
-        var = Variable(name, type, initialized=True, line=line, column=column)
+        var = Variable(name, type, initialized=True, line=line, column=column,
+                       symbol=self._symbol(name, symbol))
         self.symbol_table.define_variable(var)
-        if self.symbol_table.current_function:
+        if self.symbol_table.current_function and not self.signature_declared:
             self.symbol_table.current_function.parameters.append(var)
 
-    def declare_variable(self, type: DataType, name: str, initialized: bool, line: int, column: int) -> None:
+    def declare_variable(self, type: DataType, name: str, initialized: bool, line: int, column: int,
+                         symbol: Optional[int] = None) -> None:
         """Llamado cuando el parser encuentra una declaración de variable"""
-        var = Variable(name, type, initialized=initialized, line=line, column=column)
+        var = Variable(name, type, initialized=initialized, line=line, column=column,
+                       symbol=self._symbol(name, symbol))
         self.symbol_table.define_variable(var)
 
-    def check_variable_exists(self, name: str, line: int, column: int) -> Variable:
+    def check_variable_exists(self, name: str, line: int, column: int,
+                              symbol: Optional[int] = None) -> Variable:
         """Verifica que una variable exista cuando se usa"""
-        return self.symbol_table.get_variable(name, line, column)
+        return self.symbol_table.get_variable(self._symbol(name, symbol), line, column)
 
-    def check_function_exists(self, name: str, line: int, column: int) -> Function:
+    def check_function_exists(self, name: str, line: int, column: int,
+                              symbol: Optional[int] = None) -> Function:
         """Verifica que una función exista cuando se llama"""
-        return self.symbol_table.get_function(name, line, column)
+        return self.symbol_table.get_function(self._symbol(name, symbol), line, column)
+
+    def _symbol(self, name: str, symbol: Optional[int]) -> int:
+        """ID internado del nombre; los tokens del lexer ya lo traen calculado"""
+        return SYMBOLS.intern(name) if symbol is None else symbol
 
     def can_compare(self, type1: DataType, type2: DataType) -> bool:
         """Verifica si dos tipos pueden ser comparados entre sí"""
@@ -115,9 +157,10 @@ class SemanticAnalyzer:
         
         return False
 
-    def check_function_call(self, name: str, args: list, line: int, column: int) -> DataType:
+    def check_function_call(self, name: str, args: list, line: int, column: int,
+                            symbol: Optional[int] = None) -> DataType:
         """Verifica una llamada a función"""
-        func = self.check_function_exists(name, line, column)
+        func = self.check_function_exists(name, line, column, symbol)
         
         if len(args) != len(func.parameters):
             raise SemanticError(
@@ -205,8 +248,9 @@ class SemanticAnalyzer:
             line, column
         )
 
-    def analyze_assignment(self, var_name: str, value_type: DataType, line: int, column: int) -> None:
+    def analyze_assignment(self, var_name: str, value_type: DataType, line: int, column: int,
+                           symbol: Optional[int] = None) -> None:
         """Verifica una asignación"""
-        var = self.check_variable_exists(var_name, line, column)
+        var = self.check_variable_exists(var_name, line, column, symbol)
         self.check_types(var.type, value_type, line, column)
         var.initialized = True
\ No newline at end of file
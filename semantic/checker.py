@@ -0,0 +1,344 @@
+from typing import Dict, List, Optional
+from lexer.token_type import TokenType
+from parser.ast_nodes import (
+    Assignment, BinaryOp, Block, Call, CallStmt, DoWhile, EmptyStmt, ErrorStmt,
+    Expr, FunctionDecl, If, IOStmt, Literal, Program, Return, ScanCall, Stmt,
+    VarDecl, VariableRef, While,
+)
+from parser.parser import COMPARISON_OPERATORS, LOGIC_OPERATORS, MAX_ERRORS
+from utils.error_handler import ErrorLimitReached, SemanticError
+from .analyzer import SemanticAnalyzer
+from .types import DataType, Variable
+
+LITERAL_TYPES = {
+    TokenType.INTEGER_LITERAL: DataType.INT,
+    TokenType.FLOAT_LITERAL: DataType.FLOAT,
+    TokenType.CHAR_LITERAL: DataType.CHAR,
+    TokenType.STRING_LITERAL: DataType.CHAR,
+}
+
+SCAN_TYPES = {
+    TokenType.SCAN_INT: DataType.INT,
+    TokenType.SCAN_FLOAT: DataType.FLOAT,
+    TokenType.SCAN_CHAR: DataType.CHAR,
+}
+
+PRINT_TYPES = {
+    TokenType.PRINT_INT: DataType.INT,
+    TokenType.PRINT_FLOAT: DataType.FLOAT,
+    TokenType.PRINT_CHAR: DataType.CHAR,
+    TokenType.PRINT_STR: DataType.CHAR,
+}
+
+class SemanticChecker:
+    """
+    Pasada semántica sobre el AST que construye Parser.
+    Aplica las reglas de SemanticAnalyzer en el mismo orden en que el parser
+    las verificaba durante el análisis sintáctico, y anota data_type en cada
+    expresión del árbol.
+    """
+    def __init__(self, analyzer: Optional[SemanticAnalyzer] = None,
+                 recover: bool = False, max_errors: int = MAX_ERRORS):
+        self.analyzer = analyzer or SemanticAnalyzer()
+        
+        # En modo de recuperación los errores de cada sentencia y función se
+        # registran en self.errors y la verificación continúa
+        self.recover = recover
+        self.max_errors = max_errors
+        self.errors: List[SemanticError] = []
+        # Declaración cuya firma registró la pre-pasada, por nombre
+        self.signatures: Dict[int, FunctionDecl] = {}
+        self.statement_checks = {
+            VarDecl: self.var_decl,
+            Assignment: self.assignment,
+            CallStmt: self.call_stmt,
+            If: self.if_stmt,
+            While: self.while_stmt,
+            DoWhile: self.do_while_stmt,
+            Return: self.return_stmt,
+            IOStmt: self.io_stmt,
+            Block: self.block,
+            EmptyStmt: self.empty_stmt,
+            ErrorStmt: self.error_stmt,
+        }
+
+    def check(self, program: Program) -> None:
+        """Verifica el programa completo; lanza SemanticError ante el primer error"""
+        self.analyzer.enter_global_scope()
+        for declaration in program.globals:
+            self.statement(declaration)
+        self.declare_signatures(program.functions)
+        for function in program.functions:
+            self.function(function)
+
+    def declare_signatures(self, functions: List[FunctionDecl]) -> None:
+        """
+        Pre-pasada de firmas: registra cada función en el ámbito global antes
+        de verificar los cuerpos, de modo que puede llamarse antes de su
+        definición (y dos funciones pueden llamarse entre sí). Si un nombre se
+        repite se registra la primera definición; la repetida se reporta al
+        verificarla, en su lugar del programa.
+        """
+        for function in functions:
+            name = function.name
+            parameters = [Variable(parameter.name.value, parameter.data_type, True,
+                                   symbol=parameter.name.symbol)
+                          for parameter in function.parameters]
+            declared = self.analyzer.declare_signature(function.return_type, name.value, parameters,
+                                                       name.line, name.column, symbol=name.symbol)
+            if declared is not None:
+                self.signatures[declared.symbol] = function
+
+    def check_with_errors(self, program: Program) -> List[SemanticError]:
+        """
+        Verifica el programa completo en modo de recuperación y retorna todos
+        los errores semánticos encontrados, hasta max_errors.
+        """
+        recover = self.recover
+        self.recover = True
+        try:
+            self.check(program)
+        except ErrorLimitReached:
+            pass
+        finally:
+            self.recover = recover
+        return self.errors
+
+    def report(self, error: SemanticError) -> None:
+        """Registra un error en modo de recuperación"""
+        self.errors.append(error)
+        if len(self.errors) >= self.max_errors:
+            raise ErrorLimitReached(self.max_errors)
+
+    def function(self, function: FunctionDecl) -> None:
+        if not self.recover:
+            self.check_function(function)
+            return
+        
+        try:
+            self.check_function(function)
+        except SemanticError as e:
+            # Error en la firma o falta de return: descartar el ámbito de la función
+            self.report(e)
+            self.analyzer.abandon_function()
+
+    def check_function(self, function: FunctionDecl) -> None:
+        analyzer = self.analyzer
+        name = function.name
+        # Registrar la función (salvo que la pre-pasada ya lo hiciera) y entrar en su ámbito
+        declared = None
+        if self.signatures.get(name.symbol) is function:
+            declared = analyzer.symbol_table.global_scope.functions[name.symbol]
+        analyzer.enter_function(function.return_type, name.value, name.line, name.column,
+                                symbol=name.symbol, declared=declared)
+        for parameter in function.parameters:
+            analyzer.add_parameter(parameter.data_type, parameter.name.value,
+                                   parameter.name.line, parameter.name.column,
+                                   symbol=parameter.name.symbol)
+        self.block(function.body)
+        # Salir del ámbito (verifica que la función retorne si lo necesita)
+        analyzer.exit_function()
+
+    # Sentencias
+
+    def statement(self, statement: Stmt) -> None:
+        if not self.recover:
+            self.statement_checks[type(statement)](statement)
+            return
+        
+        try:
+            self.statement_checks[type(statement)](statement)
+        except SemanticError as e:
+            self.report(e)
+            if type(statement) is VarDecl:
+                self.declare_after_error(statement)
+
+    def declare_after_error(self, declaration: VarDecl) -> None:
+        """
+        Declara igualmente una variable cuya declaración tuvo un error, para no
+        reportar después cada uso como variable no declarada.
+        """
+        name = declaration.name
+        try:
+            self.analyzer.declare_variable(declaration.data_type, name.value, True,
+                                           name.line, name.column, symbol=name.symbol)
+        except SemanticError:
+            # Ya estaba declarada en este ámbito
+            pass
+
+    def scoped_statement(self, statement: Stmt) -> None:
+        """Cuerpo de if, while o do-while: en su propio ámbito"""
+        self.analyzer.enter_scope()
+        self.statement(statement)
+        self.analyzer.exit_scope()
+
+    def var_decl(self, declaration: VarDecl) -> None:
+        name = declaration.name
+        initialized = False
+        if declaration.initializer is not None:
+            expr_type = self.expression(declaration.initializer)
+            self.analyzer.check_types(declaration.data_type, expr_type, name.line, name.column)
+            initialized = True
+
+        # Declarar la variable en el ámbito actual
+        self.analyzer.declare_variable(declaration.data_type, name.value, initialized,
+                                       name.line, name.column, symbol=name.symbol)
+
+    def assignment(self, assignment: Assignment) -> None:
+        name = assignment.name
+        # Verificar que la variable existe antes de la expresión
+        variable = self.analyzer.check_variable_exists(name.value, name.line, name.column,
+                                                       symbol=name.symbol)
+        expr_type = self.expression(assignment.value)
+        self.analyzer.check_types(variable.type, expr_type, name.line, name.column)
+        # Después de asignarle un valor la variable queda inicializada
+        variable.initialized = True
+
+    def call_stmt(self, statement: CallStmt) -> None:
+        self.expression(statement.call)
+
+    def if_stmt(self, statement: If) -> None:
+        condition_type = self.expression(statement.condition)
+        self.analyzer.check_condition(condition_type, statement.token.line, statement.token.column)
+        self.scoped_statement(statement.then_branch)
+        if statement.else_branch is not None:
+            self.scoped_statement(statement.else_branch)
+
+    def while_stmt(self, statement: While) -> None:
+        condition_type = self.expression(statement.condition)
+        self.analyzer.check_condition(condition_type, statement.token.line, statement.token.column)
+        self.scoped_statement(statement.body)
+
+    def do_while_stmt(self, statement: DoWhile) -> None:
+        self.scoped_statement(statement.body)
+        condition_type = self.expression(statement.condition)
+        self.analyzer.check_condition(condition_type, statement.token.line, statement.token.column)
+
+    def return_stmt(self, statement: Return) -> None:
+        return_type = None
+        if statement.value is not None:
+            return_type = self.expression(statement.value)
+
+        # Verificar que el tipo de retorno coincide con la función
+        self.analyzer.check_return(return_type, statement.token.line, statement.token.column)
+
+        # Marcar que la función tiene un return válido
+        self.analyzer.has_return = True
+
+    def io_stmt(self, statement: IOStmt) -> None:
+        if statement.argument is None:
+            return
+        io_token = statement.token
+        expr_type = self.expression(statement.argument)
+        expected_type = PRINT_TYPES[io_token.type]
+
+        # No permitir conversiones implícitas para funciones de I/O
+        if expected_type != expr_type:
+            raise SemanticError(
+                f"Tipo incompatible en función {io_token.value}: "
+                f"se esperaba {expected_type.name}, se encontró {expr_type.name}",
+                io_token.line,
+                io_token.column
+            )
+
+    def block(self, block: Block) -> None:
+        self.analyzer.enter_scope()
+        for statement in block.statements:
+            self.statement(statement)
+        self.analyzer.exit_scope()
+
+    def empty_stmt(self, statement: EmptyStmt) -> None:
+        pass
+
+    def error_stmt(self, statement: ErrorStmt) -> None:
+        """Sentencia con error sintáctico: evita errores semánticos en cascada"""
+        if statement.declaration is not None:
+            self.declare_after_error(statement.declaration)
+        elif statement.token.type == TokenType.RETURN:
+            # El return existía aunque no pudo analizarse
+            self.analyzer.has_return = True
+
+    # Expresiones
+
+    def expression(self, expr: Expr) -> DataType:
+        """
+        Calcula y anota el tipo de una expresión.
+        Recorrido en postorden iterativo: las cadenas largas de operadores
+        producen árboles muy profundos que no deben agotar la pila.
+        """
+        stack = [(expr, False)]
+        while stack:
+            node, operands_done = stack.pop()
+            if type(node) is BinaryOp:
+                if operands_done:
+                    node.data_type = self.binary_operation_type(node)
+                else:
+                    stack.append((node, True))
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+            else:
+                node.data_type = self.operand_type(node)
+        return expr.data_type
+
+    def operand_type(self, expr: Expr) -> DataType:
+        """Tipo de una expresión que no es una operación binaria"""
+        if type(expr) is Literal:
+            return LITERAL_TYPES[expr.token.type]
+
+        if type(expr) is VariableRef:
+            name = expr.name
+            variable = self.analyzer.check_variable_exists(name.value, name.line, name.column,
+                                                           symbol=name.symbol)
+            if not variable.initialized:
+                raise SemanticError(
+                    f"Variable '{name.value}' usada sin inicializar",
+                    name.line,
+                    name.column
+                )
+            return variable.type
+
+        if type(expr) is Call:
+            name = expr.name
+            argument_types = [self.expression(argument) for argument in expr.arguments]
+            # Verificar la llamada a función y obtener su tipo de retorno
+            return self.analyzer.check_function_call(name.value, argument_types,
+                                                     name.line, name.column, symbol=name.symbol)
+
+        if type(expr) is ScanCall:
+            return SCAN_TYPES[expr.token.type]
+
+        raise TypeError(f"Expresión desconocida: {type(expr).__name__}")
+
+    def binary_operation_type(self, expr: BinaryOp) -> DataType:
+        """Verifica una operación binaria (con sus operandos ya tipados) y retorna su tipo"""
+        operator = expr.operator
+        left_type = expr.left.data_type
+        right_type = expr.right.data_type
+
+        if operator.type in LOGIC_OPERATORS:
+            # Verificar que ambos operandos sean de tipo INT
+            self.analyzer.check_types(DataType.INT, left_type, operator.line, operator.column)
+            self.analyzer.check_types(DataType.INT, right_type, operator.line, operator.column)
+
+            # Expresiones lógicas siempre retornan INT
+            return DataType.INT
+
+        if operator.type in COMPARISON_OPERATORS:
+            if not self.analyzer.can_compare(left_type, right_type):
+                raise SemanticError(
+                    f"No se pueden comparar tipos {left_type.name} y {right_type.name}",
+                    operator.line,
+                    operator.column
+                )
+
+            # Comparaciones siempre retornan INT
+            return DataType.INT
+
+        # Operadores aritméticos: obtener el tipo resultante de la operación
+        return self.analyzer.get_operation_type(
+            left_type,
+            operator.type,
+            right_type,
+            operator.line,
+            operator.column
+        )
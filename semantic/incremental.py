@@ -0,0 +1,220 @@
+import hashlib
+from operator import is_
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from lexer.token import Token
+from lexer.token_type import TokenType
+from parser.ast_nodes import Program
+from parser.parser import Parser, TopLevelKind
+from parser.top_level import split_top_level
+from utils.error_handler import ParserError
+from .analyzer import SemanticAnalyzer
+from .checker import SemanticChecker
+from .symbol_table import Scope
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Resultado guardado de un elemento de nivel superior"""
+    key: bytes  # token_key de sus tokens
+    tokens: List[Token]  # Tokens que referencia node
+    node: object  # VarDecl o FunctionDecl
+    symbols: List[int]  # IDs de los identificadores que aparecen en el elemento
+    # Entorno global con el que la función se verificó sin errores (None si
+    # no se verificó o falló) y variables globales que dejó inicializadas
+    dependencies: Optional[tuple] = None
+    initialized: Tuple[int, ...] = ()
+
+@dataclass(slots=True)
+class UpdateStats:
+    """Trabajo hecho por la última actualización"""
+    items: int = 0
+    reparsed: int = 0
+    rechecked: int = 0
+    full: bool = False  # Se usó el análisis completo
+
+class IncrementalFrontEnd:
+    """
+    Análisis sintáctico y semántico incremental con granularidad de función,
+    para el modo watch y los editores. Cada elemento de nivel superior se
+    guarda con su AST, indexado por un hash de sus tokens (sin posiciones),
+    y cada función con el entorno global del que dependió su verificación:
+    la firma de las funciones y el tipo y la inicialización de las globales
+    que nombra. Tras un cambio solo se re-analizan los elementos cuyos tokens
+    cambiaron y solo se re-verifican las funciones cuyo entorno cambió. El
+    resultado (AST y primer error) es el mismo que el de Parser seguido de
+    SemanticChecker.
+    """
+    def __init__(self):
+        self.entries: Dict[bytes, CacheEntry] = {}
+        # Entradas de la última versión por el id de su primer token
+        self.starts: Dict[int, CacheEntry] = {}
+        self.stats = UpdateStats()
+
+    def update(self, tokens: List[Token]) -> Program:
+        """
+        Analiza la versión actual de la entrada (una lista de tokens terminada
+        en EOF, por ejemplo la que mantiene Lexer.relex) y retorna su AST;
+        lanza el primer error sintáctico o semántico.
+        """
+        self.stats = UpdateStats()
+        items = split_top_level(tokens, lambda start: self.known_end(tokens, start))
+        if items is None:
+            # Estructura incompleta: el parser completo reporta el error
+            self.stats.full = True
+            program = Parser(tokens).parse()
+            SemanticChecker().check(program)
+            return program
+
+        self.stats.items = len(items)
+        entries = self.parse_items(tokens, items)
+        program = Program(
+            [entry.node for item, entry in zip(items, entries) if item.kind is TopLevelKind.GLOBAL],
+            [entry.node for item, entry in zip(items, entries) if item.kind is not TopLevelKind.GLOBAL],
+        )
+        if not any(item.kind is TopLevelKind.MAIN for item in items):
+            last = tokens[items[-1].end - 1]
+            raise ParserError("No se encontró la función 'main'", last.line, last.column)
+
+        self.check(program, [entry for item, entry in zip(items, entries)
+                             if item.kind is not TopLevelKind.GLOBAL])
+        return program
+
+    def parse_items(self, tokens: List[Token], items) -> List[CacheEntry]:
+        """
+        AST de cada elemento: reutiliza el guardado si sus tokens no cambiaron
+        y analiza el resto. Solo se conservan las entradas de esta versión.
+        """
+        # Primero los elementos cuyos tokens son los mismos objetos: esas
+        # entradas no pueden reutilizarse para otro elemento
+        reused = [self.same_tokens(tokens, item.start, item.end) for item in items]
+        claimed = {id(entry) for entry in reused if entry is not None}
+        live = None
+
+        eof = tokens[-1]
+        entries: Dict[bytes, CacheEntry] = {}
+        result = []
+        try:
+            for item, entry in zip(items, reused):
+                if entry is None:
+                    slice_tokens = tokens[item.start:item.end]
+                    key = token_key(slice_tokens)
+                    entry = self.entries.get(key)
+                    if entry is not None and live is None:
+                        live = set(map(id, tokens))
+                    if entry is None or key in entries or id(entry) in claimed or \
+                            any(id(token) in live for token in entry.tokens):
+                        entry = self.parse_item(item.kind, slice_tokens + [eof], key)
+                        self.stats.reparsed += 1
+                    else:
+                        # Los tokens guardados pasan a la posición de los actuales
+                        for old, new in zip(entry.tokens, slice_tokens):
+                            old.relocate(new)
+                entries.setdefault(entry.key, entry)
+                result.append(entry)
+        except ParserError:
+            # Conservar lo ya analizado para la siguiente versión
+            self.entries.update(entries)
+            raise
+        self.entries = entries
+        self.starts = {id(entry.tokens[0]): entry for entry in result}
+        return result
+
+    def known_end(self, tokens: List[Token], start: int) -> Optional[int]:
+        """Fin del elemento guardado que empieza en tokens[start], para split_top_level"""
+        entry = self.same_tokens(tokens, start)
+        return None if entry is None else start + len(entry.tokens)
+
+    def same_tokens(self, tokens: List[Token], start: int,
+                    end: Optional[int] = None) -> Optional[CacheEntry]:
+        """
+        Entrada guardada cuyos tokens son exactamente los objetos que empiezan
+        en tokens[start] (los que Lexer.relex reutiliza), o None. Evita
+        calcular el hash de los elementos que la edición no tocó.
+        """
+        entry = self.starts.get(id(tokens[start]))
+        if entry is None:
+            return None
+        length = len(entry.tokens)
+        if end is None:
+            end = start + length
+        if end - start != length or end > len(tokens):
+            return None
+        if not all(map(is_, entry.tokens, tokens[start:end])):
+            return None
+        return entry
+
+    def parse_item(self, kind: TopLevelKind, tokens: List[Token], key: bytes) -> CacheEntry:
+        """Analiza un elemento aislado (sus tokens seguidos de EOF)"""
+        parser = Parser(tokens)
+        try:
+            if kind is TopLevelKind.GLOBAL:
+                node = parser.global_declaration()
+            else:
+                node = parser.parse_function()
+        except ParserError:
+            raise
+        except Exception as e:
+            # Igual que Parser.parse
+            current_token = parser.peek()
+            raise ParserError(str(e), current_token.line, current_token.column)
+        symbols = sorted({token.symbol for token in tokens if token.type == TokenType.ID})
+        return CacheEntry(key, tokens[:-1], node, symbols)
+
+    def check(self, program: Program, functions: List[CacheEntry]) -> None:
+        """
+        Verificación semántica en el orden del programa. Las globales se
+        verifican siempre; una función se vuelve a verificar solo si su
+        entorno global cambió desde la última verificación sin errores.
+        """
+        analyzer = SemanticAnalyzer()
+        checker = SemanticChecker(analyzer)
+        analyzer.enter_global_scope()
+        for declaration in program.globals:
+            checker.statement(declaration)
+        checker.declare_signatures(program.functions)
+
+        scope = analyzer.symbol_table.global_scope
+        for entry in functions:
+            # También cuenta si su firma es la registrada para su nombre (no repetida)
+            dependencies = (environment(scope, entry.symbols),
+                            checker.signatures.get(entry.node.name.symbol) is entry.node)
+            if entry.dependencies == dependencies:
+                # Mismo AST y mismo entorno: mismo resultado
+                for symbol in entry.initialized:
+                    scope.variables[symbol].initialized = True
+                continue
+
+            self.stats.rechecked += 1
+            entry.dependencies = None
+            uninitialized = [variable for variable in scope.variables.values()
+                             if not variable.initialized]
+            checker.function(entry.node)
+            entry.initialized = tuple(variable.symbol for variable in uninitialized
+                                      if variable.initialized)
+            entry.dependencies = dependencies
+
+def token_key(tokens: List[Token]) -> bytes:
+    """
+    Hash de los valores de los tokens (las posiciones no cuentan). El tipo de
+    cada token queda determinado por su texto.
+    """
+    text = "\0".join([token.value for token in tokens])
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def environment(scope: Scope, symbols: List[int]) -> tuple:
+    """
+    Lo que el ámbito global dice de cada nombre: firma de la función y tipo e
+    inicialización de la variable con ese nombre, si existen
+    """
+    functions = scope.functions
+    variables = scope.variables
+    result = []
+    for symbol in symbols:
+        function = functions.get(symbol)
+        variable = variables.get(symbol)
+        result.append((
+            None if function is None else
+                (function.return_type, tuple(parameter.type for parameter in function.parameters)),
+            None if variable is None else (variable.type, variable.initialized),
+        ))
+    return tuple(result)
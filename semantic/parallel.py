@@ -0,0 +1,323 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+from lexer.interner import SYMBOLS
+from lexer.lexer import Lexer
+from lexer.token import Token
+from lexer.token_type import TokenType
+from parser.builders import DATA_TYPES
+from parser.parser import MAX_ERRORS, Parser, TopLevelKind
+from parser.top_level import TopLevelItem, split_top_level
+from utils.error_handler import CompilerError, ErrorLimitReached, ParserError, SemanticError
+from .analyzer import SemanticAnalyzer
+from .checker import SemanticChecker
+from .incremental import environment
+from .types import DataType, Variable
+
+# Cantidad mínima de funciones para que el modo paralelo compense el costo
+# de arrancar los procesos
+PARALLEL_FUNCTIONS = 64
+
+# Fragmentos por proceso: más fragmentos reparten mejor la carga
+CHUNKS_PER_WORKER = 4
+
+# Diagnóstico enviado entre procesos: (mensaje, línea, columna)
+Diagnostic = Tuple[str, int, int]
+# Firma de una función: (nombre, tipo de retorno, [(parámetro, tipo)], línea, columna)
+Signature = Tuple[str, DataType, List[Tuple[str, DataType]], int, int]
+
+@dataclass
+class ChunkResult:
+    """Resultado de un fragmento de funciones consecutivas analizado en un proceso"""
+    # El análisis aislado podría no coincidir con el del programa completo
+    diverged: bool = False
+    syntax_errors: List[Diagnostic] = field(default_factory=list)
+    semantic_errors: List[Diagnostic] = field(default_factory=list)
+    limit_reached: bool = False
+    # Identificadores del fragmento y lo que el ámbito global decía de ellos
+    # al empezar la verificación (ver incremental.environment)
+    names: List[str] = field(default_factory=list)
+    environment: tuple = ()
+    # Variables globales que el fragmento dejó inicializadas
+    initialized: List[str] = field(default_factory=list)
+
+class ParallelChecker:
+    """
+    Análisis sintáctico y semántico de las funciones en un pool de procesos,
+    para archivos muy grandes.
+    El proceso principal divide los tokens en elementos de nivel superior
+    contando llaves (split_top_level), analiza y verifica las declaraciones
+    globales y lee la firma de cada función (la pre-pasada de firmas, sin
+    analizar los cuerpos). Cada proceso recibe el texto de un fragmento de
+    funciones consecutivas, lo tokeniza, lo analiza y lo verifica con su
+    propia tabla de símbolos, reconstruida a partir de las globales y todas
+    las firmas (los IDs internados no se comparten entre
+    procesos: todo viaja por nombre, y no se transfieren árboles).
+    Los diagnósticos se combinan en el orden del programa. Cada fragmento
+    informa el entorno global del que dependió su verificación; si no es el
+    que dejan los fragmentos anteriores (por ejemplo, una función anterior
+    inicializa una global que este fragmento lee), el fragmento se vuelve a
+    verificar en el proceso principal. El resultado es el mismo que el de
+    Parser seguido de SemanticChecker.
+    """
+    def __init__(self, workers: Optional[int] = None, max_errors: int = MAX_ERRORS):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_errors = max_errors
+
+    def check(self, text: Union[str, bytes], tokens: List[Token]) -> None:
+        """Analiza y verifica el programa; lanza el primer error"""
+        errors = self.run(text, tokens, recover=False)
+        if errors:
+            raise errors[0]
+
+    def check_with_errors(self, text: Union[str, bytes], tokens: List[Token]) -> List[CompilerError]:
+        """
+        Analiza y verifica el programa en modo de recuperación y retorna los
+        errores sintácticos y luego los semánticos, hasta max_errors.
+        """
+        return self.run(text, tokens, recover=True)
+
+    def run(self, text: Union[str, bytes], tokens: List[Token], recover: bool) -> List[CompilerError]:
+        items = split_top_level(tokens)
+        functions = [item for item in items or () if item.kind is not TopLevelKind.GLOBAL]
+        if items is None or len(functions) < PARALLEL_FUNCTIONS or self.workers < 2:
+            return sequential_errors(tokens, recover, self.max_errors)
+        if recover and items[-1].end != len(tokens) - 1:
+            # En modo de recuperación lo que sigue a la última función se reporta
+            return sequential_errors(tokens, recover, self.max_errors)
+        eof = tokens[-1]
+
+        # Declaraciones globales, en este proceso
+        declarations = []
+        for item in items[:len(items) - len(functions)]:
+            try:
+                declarations.append(Parser(tokens[item.start:item.end] + [eof]).global_declaration())
+            except ParserError as e:
+                if recover:
+                    # La recuperación del parser podría no respetar los límites de la división
+                    return sequential_errors(tokens, recover, self.max_errors)
+                return [e]
+        analyzer = SemanticAnalyzer()
+        checker = SemanticChecker(analyzer, recover, self.max_errors)
+        analyzer.enter_global_scope()
+        first_error = None
+        try:
+            for declaration in declarations:
+                checker.statement(declaration)
+        except SemanticError as e:
+            first_error = e
+        except ErrorLimitReached:
+            pass
+        scope = analyzer.symbol_table.global_scope
+        global_variables = [(variable.name, variable.type, variable.initialized)
+                            for variable in scope.variables.values()]
+
+        # Firmas de las funciones y fragmentos para los procesos
+        signatures = [function_signature(tokens, item.start) for item in functions]
+        declaring = declare_signatures(analyzer, signatures)
+        chunks = split_chunks(functions, self.workers * CHUNKS_PER_WORKER)
+        tasks = [chunk_task(text, tokens, functions, first, last, recover, self.max_errors)
+                 for first, last in chunks]
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(global_variables, signatures)) as executor:
+            results = list(executor.map(_check_chunk, tasks))
+        if any(result.diverged for result in results):
+            return sequential_errors(tokens, recover, self.max_errors)
+
+        # Errores sintácticos en el orden del programa
+        syntax_errors = [ParserError(*error) for result in results for error in result.syntax_errors]
+        if not recover and syntax_errors:
+            return syntax_errors[:1]
+        if not any(item.kind is TopLevelKind.MAIN for item in functions):
+            last = tokens[items[-1].end - 1]
+            syntax_errors.append(ParserError("No se encontró la función 'main'", last.line, last.column))
+            if not recover:
+                return syntax_errors
+        if len(syntax_errors) >= self.max_errors:
+            return syntax_errors[:self.max_errors]
+        if first_error is not None:
+            return [first_error]
+
+        # Errores semánticos: se aceptan los resultados de los fragmentos cuyo
+        # entorno coincide con el real y se vuelven a verificar los demás
+        try:
+            for (first, last), result in zip(chunks, results):
+                if len(syntax_errors) + len(checker.errors) >= self.max_errors:
+                    break
+                symbols = [SYMBOLS.intern(name) for name in result.names]
+                if environment(scope, symbols) != result.environment:
+                    for index in range(first, last):
+                        item = functions[index]
+                        parser = Parser(tokens[item.start:item.end] + [eof], recover, self.max_errors)
+                        declaration = parser.parse_function()
+                        if declaring.get(declaration.name.value) == index:
+                            checker.signatures[declaration.name.symbol] = declaration
+                        checker.function(declaration)
+                    continue
+                errors = [SemanticError(*error) for error in result.semantic_errors]
+                if not recover and errors:
+                    return errors[:1]
+                checker.errors.extend(errors)
+                if result.limit_reached:
+                    break
+                for name in result.initialized:
+                    scope.variables[SYMBOLS.intern(name)].initialized = True
+        except SemanticError as e:
+            return [e]
+        except ErrorLimitReached:
+            pass
+        return (syntax_errors + checker.errors)[:self.max_errors]
+
+def sequential_errors(tokens: List[Token], recover: bool, max_errors: int) -> List[CompilerError]:
+    """Los mismos diagnósticos, con Parser y SemanticChecker sobre el programa completo"""
+    if not recover:
+        try:
+            SemanticChecker().check(Parser(tokens).parse())
+        except CompilerError as e:
+            return [e]
+        return []
+    result = Parser(tokens, max_errors=max_errors).parse_with_errors()
+    errors = list(result.errors)
+    if len(errors) < max_errors:
+        checker = SemanticChecker(max_errors=max_errors - len(errors))
+        errors.extend(checker.check_with_errors(result.program))
+    return errors
+
+def function_signature(tokens: List[Token], start: int) -> Optional[Signature]:
+    """Firma de la función que empieza en tokens[start] (None si no se puede leer)"""
+    parser = Parser(tokens)
+    parser.current = start
+    try:
+        type_token, name, parameters = parser.function_header()
+    except ParserError:
+        return None
+    return (name.value, DATA_TYPES[type_token.type],
+            [(parameter.name.value, parameter.data_type) for parameter in parameters],
+            name.line, name.column)
+
+def declare_signatures(analyzer: SemanticAnalyzer, signatures: List[Optional[Signature]],
+                       line_offset: int = 0) -> Dict[str, int]:
+    """
+    Registra las firmas en el ámbito global como SemanticChecker.declare_signatures
+    (la primera de cada nombre) y retorna, por nombre, el índice de la función
+    cuya firma quedó registrada. line_offset pasa las líneas al texto de un fragmento.
+    """
+    declaring = {}
+    for index, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        name, return_type, parameters, line, column = signature
+        declared = analyzer.declare_signature(
+            return_type, name, [Variable(parameter, type, True) for parameter, type in parameters],
+            line - line_offset, column)
+        if declared is not None:
+            declaring[name] = index
+    return declaring
+
+def split_chunks(functions: List[TopLevelItem], parts: int) -> List[Tuple[int, int]]:
+    """Reparte las funciones en fragmentos consecutivos con cantidades de tokens parecidas"""
+    total = functions[-1].end - functions[0].start
+    chunks = []
+    first = 0
+    for index, item in enumerate(functions):
+        if item.end - functions[0].start >= total * (len(chunks) + 1) / parts:
+            chunks.append((first, index + 1))
+            first = index + 1
+    if first < len(functions):
+        chunks.append((first, len(functions)))
+    return chunks
+
+def chunk_task(text: Union[str, bytes], tokens: List[Token], functions: List[TopLevelItem],
+               first: int, last: int, recover: bool, max_errors: int) -> tuple:
+    """
+    Texto de las funciones functions[first:last] y su posición. Lo que
+    precede a la primera función en su línea se reemplaza por espacios para
+    que las columnas no cambien.
+    """
+    start = tokens[functions[first].start]
+    end = tokens[functions[last - 1].end - 1]
+    chunk = text[start.offset:end.offset + len(end.value)]
+    if not isinstance(chunk, str):
+        chunk = chunk.decode('utf-8')
+    return (" " * (start.column - 1) + chunk, start.line - 1, first, last - first,
+            recover, max_errors)
+
+# Estado de cada proceso del pool: las globales y las firmas de todas las funciones
+_GLOBALS: List[Tuple[str, DataType, bool]] = []
+_SIGNATURES: List[Optional[Signature]] = []
+
+def _init_worker(global_variables: List[Tuple[str, DataType, bool]],
+                 signatures: List[Optional[Signature]]) -> None:
+    global _GLOBALS, _SIGNATURES
+    _GLOBALS = global_variables
+    _SIGNATURES = signatures
+
+def _check_chunk(task: tuple) -> ChunkResult:
+    """
+    Analiza y verifica un fragmento en un proceso del pool. El ámbito global
+    tiene las variables globales y las firmas de todas las funciones.
+    """
+    text, line_offset, first, count, recover, max_errors = task
+    result = ChunkResult()
+    tokens = Lexer(text).tokenize()
+    items = split_top_level(tokens)
+    if items is None or len(items) != count:
+        result.diverged = True
+        return result
+    eof = tokens[-1]
+
+    def diagnostic(error: CompilerError) -> Diagnostic:
+        return (error.message, error.line + line_offset, error.column)
+
+    # Análisis sintáctico de cada función por separado
+    declarations = []
+    for item in items:
+        parser = Parser(tokens[item.start:item.end] + [eof], recover, max_errors)
+        try:
+            declarations.append(parser.parse_function())
+        except ParserError as e:
+            if recover:
+                result.diverged = True
+                return result
+            result.syntax_errors.append(diagnostic(e))
+            return result
+        except ErrorLimitReached:
+            result.syntax_errors.extend(diagnostic(error) for error in parser.errors)
+            result.limit_reached = True
+            return result
+        # En modo de recuperación el análisis debe cerrar la función en su
+        # última llave, sin mirar más allá
+        if parser.current != item.end - item.start or any(
+                (error.line, error.column) == (eof.line, eof.column) for error in parser.errors):
+            result.diverged = True
+            return result
+        result.syntax_errors.extend(diagnostic(error) for error in parser.errors)
+
+    # Tabla de símbolos propia del proceso
+    analyzer = SemanticAnalyzer()
+    checker = SemanticChecker(analyzer, recover, max_errors)
+    analyzer.enter_global_scope()
+    scope = analyzer.symbol_table.global_scope
+    for name, type, initialized in _GLOBALS:
+        scope.define_variable(Variable(name, type, initialized))
+    declaring = declare_signatures(analyzer, _SIGNATURES, line_offset)
+    for index, declaration in enumerate(declarations, first):
+        if declaring.get(declaration.name.value) == index:
+            checker.signatures[declaration.name.symbol] = declaration
+
+    result.names = sorted({token.value for token in tokens if token.type == TokenType.ID})
+    result.environment = environment(scope, [SYMBOLS.intern(name) for name in result.names])
+    uninitialized = [variable for variable in scope.variables.values() if not variable.initialized]
+    try:
+        for declaration in declarations:
+            checker.function(declaration)
+    except SemanticError as e:
+        result.semantic_errors.append(diagnostic(e))
+        return result
+    except ErrorLimitReached:
+        result.limit_reached = True
+    result.semantic_errors.extend(diagnostic(error) for error in checker.errors)
+
+    result.initialized = [variable.name for variable in uninitialized if variable.initialized]
+    return result
@@ -1,51 +1,55 @@
 from typing import Dict, Optional, List
 from .types import Variable, Function
+from lexer.interner import SYMBOLS
 from utils.error_handler import SemanticError
 
 class Scope:
     def __init__(self, parent: Optional['Scope'] = None):
-        self.variables: Dict[str, Variable] = {}
-        self.functions: Dict[str, Function] = {}
+        # Indexadas por el ID internado del nombre
+        self.variables: Dict[int, Variable] = {}
+        self.functions: Dict[int, Function] = {}
         self.parent = parent
 
     def define_variable(self, var: Variable) -> None:
-        if var.name in self.variables:
+        if var.symbol in self.variables:
             raise SemanticError(
                 f"Variable '{var.name}' ya declarada en este ámbito",
                 var.line,
                 var.column
             )
-        self.variables[var.name] = var
+        self.variables[var.symbol] = var
 
     def define_function(self, func: Function) -> None:
-        if func.name in self.functions:
+        if func.symbol in self.functions:
             raise SemanticError(
                 f"Función '{func.name}' ya declarada",
                 func.line,
                 func.column
             )
-        self.functions[func.name] = func
+        self.functions[func.symbol] = func
 
-    def get_variable(self, name: str, line: int, column: int) -> Variable:
+    def get_variable(self, symbol: int, line: int, column: int) -> Variable:
         scope = self
         while scope:
-            if name in scope.variables:
-                return scope.variables[name]
+            variable = scope.variables.get(symbol)
+            if variable is not None:
+                return variable
             scope = scope.parent
         raise SemanticError(
-            f"Variable '{name}' no declarada",
+            f"Variable '{SYMBOLS.name(symbol)}' no declarada",
             line,
             column
         )
 
-    def get_function(self, name: str, line: int, column: int) -> Function:
+    def get_function(self, symbol: int, line: int, column: int) -> Function:
         scope = self
         while scope:
-            if name in scope.functions:
-                return scope.functions[name]
+            function = scope.functions.get(symbol)
+            if function is not None:
+                return function
             scope = scope.parent
         raise SemanticError(
-            f"Función '{name}' no declarada",
+            f"Función '{SYMBOLS.name(symbol)}' no declarada",
             line,
             column
         )
@@ -65,9 +69,10 @@ class SymbolTable:
         if self.current_scope.parent:
             self.current_scope = self.current_scope.parent
 
-    def enter_function(self, func: Function) -> None:
-        """Entra al ámbito de una función"""
-        self.define_function(func)
+    def enter_function(self, func: Function, define: bool = True) -> None:
+        """Entra al ámbito de una función (define=False si ya estaba declarada)"""
+        if define:
+            self.define_function(func)
         self.current_function = func
         self.enter_scope()
 
@@ -84,10 +89,10 @@ class SymbolTable:
         """Define una función en el ámbito global"""
         self.global_scope.define_function(func)
 
-    def get_variable(self, name: str, line: int, column: int) -> Variable:
+    def get_variable(self, symbol: int, line: int, column: int) -> Variable:
         """Busca una variable en todos los ámbitos accesibles"""
-        return self.current_scope.get_variable(name, line, column)
+        return self.current_scope.get_variable(symbol, line, column)
 
-    def get_function(self, name: str, line: int, column: int) -> Function:
+    def get_function(self, symbol: int, line: int, column: int) -> Function:
         """Busca una función (solo en ámbito global)"""
-        return self.global_scope.get_function(name, line, column)
\ No newline at end of file
+        return self.global_scope.get_function(symbol, line, column)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import List
+from lexer.interner import SYMBOLS
 
 class DataType(Enum):
     INT = auto()
@@ -15,6 +16,11 @@ class Variable:
     initialized: bool = False
     line: int = 0
     column: int = 0
+    symbol: int = -1  # ID internado del nombre (se calcula si no se indica)
+    
+    def __post_init__(self):
+        if self.symbol < 0:
+            self.symbol = SYMBOLS.intern(self.name)
 
 @dataclass
 class Function:
@@ -22,4 +28,9 @@ class Function:
     return_type: DataType
     parameters: List[Variable] = field(default_factory=list)
     line: int = 0
-    column: int = 0
\ No newline at end of file
+    column: int = 0
+    symbol: int = -1  # ID internado del nombre (se calcula si no se indica)
+    
+    def __post_init__(self):
+        if self.symbol < 0:
+            self.symbol = SYMBOLS.intern(self.name)
\ No newline at end of file
@@ -0,0 +1,145 @@
+import os
+import random
+import tempfile
+import unittest
+from lexer.lexer import Lexer
+from lexer.token_cache import TokenCache
+from utils.error_handler import LexicalError
+
+def summary(tokens):
+    return [(token.type, token.value, token.offset, token.line, token.column) for token in tokens]
+
+def error_summary(errors):
+    return [(error.message, error.line, error.column) for error in errors]
+
+class RelexTest(unittest.TestCase):
+    """relex debe producir lo mismo que tokenizar el texto editado desde cero"""
+
+    def assert_same_as_tokenize(self, lexer: Lexer, tokens) -> None:
+        reference = Lexer(lexer.text, recover=lexer.recover)
+        self.assertEqual(summary(tokens), summary(reference.tokenize()))
+        self.assertEqual(error_summary(lexer.errors), error_summary(reference.errors))
+
+    def test_edit_closes_quote_in_recover_mode(self):
+        lexer = Lexer('\'"ab}//)/*=\nint x;', recover=True)
+        tokens = lexer.tokenize()
+        tokens = lexer.relex(tokens, 3, 3, '"12')
+        self.assert_same_as_tokenize(lexer, tokens)
+
+    def test_random_edits_in_recover_mode(self):
+        rng = random.Random(7)
+        alphabet = "ab1 2.'\"/*}()=;\n@#x"
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            lexer = Lexer(text, recover=True)
+            tokens = lexer.tokenize()
+            for _ in range(3):
+                start = rng.randint(0, len(lexer.text))
+                end = rng.randint(start, min(len(lexer.text), start + 3))
+                replacement = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3)))
+                tokens = lexer.relex(tokens, start, end, replacement)
+                self.assert_same_as_tokenize(lexer, tokens)
+
+class CrlfTest(unittest.TestCase):
+    """Los finales de línea CRLF son espacios en blanco en ambos motores y modos"""
+
+    SOURCE = "void main() {\n    int x = 5;\n    printInt(x);\n}\n"
+
+    def test_crlf_same_tokens_as_lf(self):
+        expected = [(token.type, token.value, token.line) for token in Lexer(self.SOURCE).tokenize()]
+        crlf = self.SOURCE.replace("\n", "\r\n")
+        for engine in ('regex', 'table'):
+            for text in (crlf, crlf.encode('utf-8')):
+                tokens = Lexer(text, engine=engine).tokenize()
+                self.assertEqual([(token.type, token.value, token.line) for token in tokens], expected)
+
+class TriviaTest(unittest.TestCase):
+    def test_tokenize_twice_replaces_table(self):
+        lexer = Lexer("// a\nint x = 1; /* b */\nfloat y;\n", trivia=True)
+        tokens = lexer.tokenize()
+        entries, bounds = len(lexer.trivia), len(lexer.trivia.bounds)
+        self.assertEqual(summary(lexer.tokenize()), summary(tokens))
+        self.assertEqual((len(lexer.trivia), len(lexer.trivia.bounds)), (entries, bounds))
+        self.assertEqual(bounds, len(tokens))
+        self.assertEqual(lexer.trivia.comments(0), ["// a"])
+
+class TokenBufferTest(unittest.TestCase):
+    def test_repeated_access_reuses_token(self):
+        lexer = Lexer("int main() { return 0; }")
+        buffer = lexer.tokenize_buffer()
+        self.assertIs(buffer[3], buffer[3])
+        self.assertIs(buffer[-1], buffer[len(buffer) - 1])
+        self.assertEqual(summary(buffer[index] for index in range(len(buffer))),
+                         summary(Lexer(lexer.text).tokenize()))
+
+class TokenCacheTest(unittest.TestCase):
+    """Los offsets en caracteres (str) y en bytes (mmap) no comparten entradas"""
+
+    SOURCE = "// comentario con acentos: á é\nint x = 1;\n/* ñ */ float y = 2.5;\n"
+
+    def check_modes(self, warm, read) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'programa.c')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(self.SOURCE)
+            cache = TokenCache(os.path.join(directory, 'cache'))
+            warm_lexer = warm(path)
+            cache.tokenize(warm_lexer)
+            warm_lexer.close()
+            read_lexer = read(path)
+            cached = summary(cache.tokenize(read_lexer))
+            read_lexer.close()
+            reference = read(path)
+            expected = summary(reference.tokenize())
+            reference.close()
+            self.assertEqual(cached, expected)
+
+    @staticmethod
+    def from_str(path: str) -> Lexer:
+        with open(path, encoding='utf-8') as file:
+            return Lexer(file.read())
+
+    def test_bytes_then_str(self):
+        self.check_modes(Lexer.from_file, self.from_str)
+
+    def test_str_then_bytes(self):
+        self.check_modes(self.from_str, Lexer.from_file)
+
+class TokenCacheModeTest(unittest.TestCase):
+    """Los modos de recuperación y de trivias no comparten la caché con el normal"""
+
+    def tokenize_twice(self, source: str, warm: Lexer, read: Lexer):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = TokenCache(directory)
+            cache.tokenize(warm)
+            return cache.tokenize(read)
+
+    def test_recover_then_plain_raises(self):
+        source = "int x = 1 @ 2;"
+        with self.assertRaises(LexicalError):
+            self.tokenize_twice(source, Lexer(source, recover=True), Lexer(source))
+
+    def test_plain_then_recover_reports_errors(self):
+        source = "int x = 1;"
+        lexer = Lexer(source, recover=True)
+        tokens = self.tokenize_twice(source, Lexer(source), lexer)
+        self.assertEqual(summary(tokens), summary(Lexer(source).tokenize()))
+        self.assertEqual(lexer.errors, [])
+
+    def test_recover_reports_errors_after_recover(self):
+        source = "int x = 1 @ 2;"
+        lexer = Lexer(source, recover=True)
+        self.tokenize_twice(source, Lexer(source, recover=True), lexer)
+        self.assertEqual(len(lexer.errors), 1)
+
+    def test_plain_then_trivia_fills_table(self):
+        source = "// comentario\nint x = 1; /* fin */\n"
+        lexer = Lexer(source, trivia=True)
+        self.tokenize_twice(source, Lexer(source), lexer)
+        reference = Lexer(source, trivia=True)
+        reference.tokenize()
+        self.assertEqual(len(lexer.trivia), len(reference.trivia))
+        self.assertGreater(len(lexer.trivia), 0)
+
+if __name__ == '__main__':
+    unittest.main()
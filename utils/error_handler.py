@@ -19,4 +19,10 @@ class ParserError(CompilerError):
 
 class SemanticError(CompilerError):
     """Error específico para el análisis semántico"""
-    pass
\ No newline at end of file
+    pass
+
+class ErrorLimitReached(Exception):
+    """Se alcanzó el máximo de diagnósticos en modo de recuperación"""
+    def __init__(self, limit: int):
+        self.limit = limit
+        super().__init__(f"Se alcanzó el máximo de {limit} errores")